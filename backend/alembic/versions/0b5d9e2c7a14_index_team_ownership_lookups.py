@@ -0,0 +1,25 @@
+"""index team ownership lookups
+
+Revision ID: 0b5d9e2c7a14
+Revises: f1c6a8d3e720
+Create Date: 2025-09-26 16:20:35.114870
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0b5d9e2c7a14'
+down_revision = 'f1c6a8d3e720'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # ix_teams_creator_id already exists (6316b509cc5e)
+    op.create_index(op.f('ix_tkr_team_registrations_team_id'), 'tkr_team_registrations', ['team_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_tkr_team_registrations_team_id'), table_name='tkr_team_registrations')
@@ -0,0 +1,36 @@
+"""add tkr verification claims
+
+Revision ID: 2c8e4f6a1b37
+Revises: 0b5d9e2c7a14
+Create Date: 2025-09-29 10:12:51.470392
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2c8e4f6a1b37'
+down_revision = '0b5d9e2c7a14'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('tkr_game_submissions', sa.Column('claimed_by', sa.Integer(), nullable=True))
+    op.add_column('tkr_game_submissions', sa.Column('claimed_until', sa.DateTime(), nullable=True))
+    op.create_foreign_key(
+        'tkr_game_submissions_claimed_by_fkey', 'tkr_game_submissions', 'users', ['claimed_by'], ['id']
+    )
+    op.create_index(
+        'ix_tkr_game_submissions_pending_queue', 'tkr_game_submissions',
+        ['tournament_id', 'submitted_at', 'id'],
+        postgresql_where=sa.text("status = 'PENDING'")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tkr_game_submissions_pending_queue', 'tkr_game_submissions')
+    op.drop_constraint('tkr_game_submissions_claimed_by_fkey', 'tkr_game_submissions', type_='foreignkey')
+    op.drop_column('tkr_game_submissions', 'claimed_until')
+    op.drop_column('tkr_game_submissions', 'claimed_by')
@@ -0,0 +1,83 @@
+"""add tkr submission fingerprints and anomaly stats
+
+Revision ID: 5a1d7b3e9c48
+Revises: 2c8e4f6a1b37
+Create Date: 2025-09-30 13:05:27.846159
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5a1d7b3e9c48'
+down_revision = '2c8e4f6a1b37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('tkr_game_submissions', sa.Column('fingerprint', sa.String(length=32), nullable=True))
+    op.add_column('tkr_game_submissions', sa.Column('anomaly_score', sa.Float(), nullable=True))
+    op.add_column('tkr_game_submissions', sa.Column('anomaly_flags', sa.JSON(), nullable=True))
+
+    # Same normalization as tkr_anomaly.submission_fingerprint
+    op.execute("""
+        UPDATE tkr_game_submissions
+        SET fingerprint = md5(lower(btrim(vod_url)) || '|' || btrim(timestamp))
+    """)
+    # Existing duplicates stay as they are for hosts to review; only the
+    # earliest copy keeps its fingerprint so the unique index can be built
+    op.execute("""
+        UPDATE tkr_game_submissions s SET fingerprint = NULL
+        FROM (
+            SELECT id, row_number() OVER (
+                PARTITION BY team_registration_id, fingerprint ORDER BY submitted_at, id
+            ) AS copy
+            FROM tkr_game_submissions
+            WHERE status != 'REJECTED'
+        ) d
+        WHERE s.id = d.id AND d.copy > 1
+    """)
+    op.create_index(
+        'uq_tkr_game_submissions_team_fingerprint', 'tkr_game_submissions',
+        ['team_registration_id', 'fingerprint'], unique=True,
+        postgresql_where=sa.text("status != 'REJECTED'")
+    )
+
+    op.create_table(
+        'tkr_submission_stats',
+        sa.Column('tournament_id', sa.Integer(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('kills_mean', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('kills_m2', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('placement_mean', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('placement_m2', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('final_score_mean', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('final_score_m2', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['tournament_id'], ['tournaments.id'], ),
+        sa.PrimaryKeyConstraint('tournament_id')
+    )
+    # Seed running stats from existing games: M2 = var_samp * (n - 1)
+    op.execute("""
+        INSERT INTO tkr_submission_stats (
+            tournament_id, count, kills_mean, kills_m2, placement_mean, placement_m2,
+            final_score_mean, final_score_m2, updated_at
+        )
+        SELECT tournament_id, count(*),
+               avg(kills), coalesce(var_samp(kills), 0) * (count(*) - 1),
+               avg(placement), coalesce(var_samp(placement), 0) * (count(*) - 1),
+               avg(coalesce(final_score, 0)), coalesce(var_samp(coalesce(final_score, 0)), 0) * (count(*) - 1),
+               timezone('utc', now())
+        FROM tkr_game_submissions
+        GROUP BY tournament_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('tkr_submission_stats')
+    op.drop_index('uq_tkr_game_submissions_team_fingerprint', 'tkr_game_submissions')
+    op.drop_column('tkr_game_submissions', 'anomaly_flags')
+    op.drop_column('tkr_game_submissions', 'anomaly_score')
+    op.drop_column('tkr_game_submissions', 'fingerprint')
@@ -0,0 +1,29 @@
+"""add tournament listing index
+
+Revision ID: 5e0b8c3d7f21
+Revises: d41f7a2c9b10
+Create Date: 2025-09-16 14:03:51.402217
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e0b8c3d7f21'
+down_revision = 'd41f7a2c9b10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Status-filtered listings page through (start_date, id) within one status
+    op.create_index(
+        'ix_tournaments_status_start_date_id',
+        'tournaments',
+        ['status', 'start_date', 'id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tournaments_status_start_date_id', 'tournaments')
@@ -0,0 +1,27 @@
+"""add tkr config scoring version
+
+Revision ID: 7e3b5c9d2f61
+Revises: 5a1d7b3e9c48
+Create Date: 2025-10-01 09:31:48.207553
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7e3b5c9d2f61'
+down_revision = '5a1d7b3e9c48'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'tkr_tournament_configs',
+        sa.Column('scoring_version', sa.Integer(), nullable=False, server_default='1')
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('tkr_tournament_configs', 'scoring_version')
@@ -0,0 +1,34 @@
+"""add rate limit buckets
+
+Revision ID: 8a4c2e6b1d93
+Revises: 5e0b8c3d7f21
+Create Date: 2025-09-18 10:21:07.518344
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8a4c2e6b1d93'
+down_revision = '5e0b8c3d7f21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'rate_limit_buckets',
+        sa.Column('key', sa.String(length=255), nullable=False),
+        sa.Column('tokens', sa.Float(), nullable=False),
+        sa.Column('allowed', sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('key')
+    )
+    op.create_index('ix_rate_limit_buckets_expires_at', 'rate_limit_buckets', ['expires_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_rate_limit_buckets_expires_at', 'rate_limit_buckets')
+    op.drop_table('rate_limit_buckets')
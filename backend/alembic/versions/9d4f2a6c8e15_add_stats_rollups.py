@@ -0,0 +1,56 @@
+"""add stats rollups
+
+Revision ID: 9d4f2a6c8e15
+Revises: 7e3b5c9d2f61
+Create Date: 2025-10-02 15:12:09.533871
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d4f2a6c8e15'
+down_revision = '7e3b5c9d2f61'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'stats_rollups',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('subject_type', sa.String(length=10), nullable=False),
+        sa.Column('subject_key', sa.String(), nullable=False),
+        sa.Column('display_name', sa.String(), nullable=False),
+        sa.Column('game', sa.String(), nullable=False, server_default=''),
+        sa.Column('map_name', sa.String(), nullable=False, server_default=''),
+        sa.Column('season', sa.String(length=10), nullable=False, server_default=''),
+        sa.Column('games_played', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('kills', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_score', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('best_game_score', sa.Float(), nullable=True),
+        sa.Column('placement_total', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('first_places', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('matches_won', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('matches_lost', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'subject_type', 'subject_key', 'game', 'map_name', 'season',
+            name='uq_stats_rollups_bucket'
+        )
+    )
+    op.create_index(op.f('ix_stats_rollups_id'), 'stats_rollups', ['id'], unique=False)
+    op.create_index(
+        'ix_stats_rollups_board', 'stats_rollups',
+        ['subject_type', 'game', 'map_name', 'season', 'total_score']
+    )
+    # Existing history is loaded with scripts/rebuild_stats.py, which reuses
+    # the same bucketing as the incremental updates
+
+
+def downgrade() -> None:
+    op.drop_index('ix_stats_rollups_board', 'stats_rollups')
+    op.drop_index(op.f('ix_stats_rollups_id'), table_name='stats_rollups')
+    op.drop_table('stats_rollups')
@@ -0,0 +1,30 @@
+"""add tkr submission updated_at
+
+Revision ID: a3f8d6b2c419
+Revises: e4b9c1d7a352
+Create Date: 2025-10-09 09:41:27.338501
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3f8d6b2c419'
+down_revision = 'e4b9c1d7a352'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('tkr_game_submissions', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    # Best known last change for existing rows
+    op.execute("UPDATE tkr_game_submissions SET updated_at = GREATEST(submitted_at, verified_at)")
+    op.create_index(
+        'ix_tkr_game_submissions_tournament_updated', 'tkr_game_submissions', ['tournament_id', 'updated_at']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tkr_game_submissions_tournament_updated', 'tkr_game_submissions')
+    op.drop_column('tkr_game_submissions', 'updated_at')
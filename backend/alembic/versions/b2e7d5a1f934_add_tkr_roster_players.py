@@ -0,0 +1,69 @@
+"""add tkr roster players
+
+Revision ID: b2e7d5a1f934
+Revises: 9d4f2a6c8e15
+Create Date: 2025-10-03 11:47:52.190384
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b2e7d5a1f934'
+down_revision = '9d4f2a6c8e15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tkr_roster_players',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('registration_id', sa.Integer(), nullable=False),
+        sa.Column('tournament_id', sa.Integer(), nullable=False),
+        sa.Column('handle', sa.String(), nullable=False),
+        sa.Column('player_name', sa.String(), nullable=False),
+        sa.Column('rank', sa.Integer(), nullable=True),
+        sa.Column('stream', sa.String(), nullable=True),
+        sa.Column('position', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('using_free_entry', sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.ForeignKeyConstraint(['registration_id'], ['tkr_team_registrations.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['tournament_id'], ['tournaments.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('registration_id', 'handle', name='uq_tkr_roster_players_registration_handle')
+    )
+    op.create_index(op.f('ix_tkr_roster_players_id'), 'tkr_roster_players', ['id'], unique=False)
+
+    # Same normalization as crud.stats.normalize_key; a name listed twice on
+    # one roster keeps its first position
+    op.execute(r"""
+        INSERT INTO tkr_roster_players (
+            registration_id, tournament_id, handle, player_name, rank, stream, position, using_free_entry
+        )
+        SELECT DISTINCT ON (r.id, p.handle)
+               r.id, r.tournament_id, p.handle, btrim(p.value->>'name'),
+               (p.value->>'rank')::integer, p.value->>'stream', p.ordinality - 1,
+               coalesce(r.free_entry_players::jsonb ? (p.value->>'name'), false)
+        FROM tkr_team_registrations r
+        CROSS JOIN LATERAL (
+            SELECT e.value, e.ordinality,
+                   lower(regexp_replace(btrim(e.value->>'name'), '\s+', ' ', 'g')) AS handle
+            FROM json_array_elements(r.players) WITH ORDINALITY AS e(value, ordinality)
+        ) p
+        WHERE coalesce(btrim(p.value->>'name'), '') != ''
+        ORDER BY r.id, p.handle, p.ordinality
+    """)
+
+    # Built after the backfill so it is one sort instead of per-row maintenance
+    op.create_index(
+        'ix_tkr_roster_players_tournament_handle', 'tkr_roster_players', ['tournament_id', 'handle']
+    )
+    op.create_index('ix_tkr_roster_players_handle', 'tkr_roster_players', ['handle'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tkr_roster_players_handle', 'tkr_roster_players')
+    op.drop_index('ix_tkr_roster_players_tournament_handle', 'tkr_roster_players')
+    op.drop_index(op.f('ix_tkr_roster_players_id'), table_name='tkr_roster_players')
+    op.drop_table('tkr_roster_players')
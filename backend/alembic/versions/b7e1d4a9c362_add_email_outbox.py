@@ -0,0 +1,47 @@
+"""add email outbox
+
+Revision ID: b7e1d4a9c362
+Revises: 8a4c2e6b1d93
+Create Date: 2025-09-19 16:42:18.903115
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e1d4a9c362'
+down_revision = '8a4c2e6b1d93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'email_outbox',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('to_address', sa.String(), nullable=False),
+        sa.Column('subject', sa.String(), nullable=False),
+        sa.Column('html_body', sa.Text(), nullable=True),
+        sa.Column('text_body', sa.Text(), nullable=True),
+        sa.Column('status', sa.Enum('PENDING', 'SENT', 'FAILED', name='emailstatus'), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('next_attempt_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('sent_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_email_outbox_id'), 'email_outbox', ['id'], unique=False)
+    op.create_index(
+        'ix_email_outbox_status_next_attempt_at',
+        'email_outbox',
+        ['status', 'next_attempt_at']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_email_outbox_status_next_attempt_at', 'email_outbox')
+    op.drop_index(op.f('ix_email_outbox_id'), table_name='email_outbox')
+    op.drop_table('email_outbox')
+    sa.Enum(name='emailstatus').drop(op.get_bind(), checkfirst=True)
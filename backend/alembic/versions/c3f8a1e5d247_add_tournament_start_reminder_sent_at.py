@@ -0,0 +1,24 @@
+"""add tournament start reminder sent at
+
+Revision ID: c3f8a1e5d247
+Revises: b7e1d4a9c362
+Create Date: 2025-09-22 09:12:44.187402
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3f8a1e5d247'
+down_revision = 'b7e1d4a9c362'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('tournaments', sa.Column('start_reminder_sent_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('tournaments', 'start_reminder_sent_at')
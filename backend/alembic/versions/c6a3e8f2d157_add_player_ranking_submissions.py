@@ -0,0 +1,46 @@
+"""add player ranking submissions
+
+Revision ID: c6a3e8f2d157
+Revises: b2e7d5a1f934
+Create Date: 2025-10-06 10:22:37.615048
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6a3e8f2d157'
+down_revision = 'b2e7d5a1f934'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'player_ranking_submissions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('player_name', sa.String(), nullable=False),
+        sa.Column('twitter_handle', sa.String(), nullable=False),
+        sa.Column('previous_ranking', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('stream_link', sa.String(), nullable=True),
+        sa.Column('kd_ratio', sa.Float(), nullable=False),
+        sa.Column('total_kills', sa.Integer(), nullable=False),
+        sa.Column('total_time_played', sa.Integer(), nullable=False),
+        sa.Column('wins', sa.Integer(), nullable=False),
+        sa.Column('score_per_min', sa.Float(), nullable=False),
+        sa.Column('predicted_rank', sa.Integer(), nullable=True),
+        sa.Column('submitted_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_player_ranking_submissions_id'), 'player_ranking_submissions', ['id'], unique=False)
+    op.create_index(
+        'ix_player_ranking_submissions_handle_submitted', 'player_ranking_submissions',
+        [sa.text('lower(twitter_handle)'), sa.text('submitted_at DESC')]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_player_ranking_submissions_handle_submitted', 'player_ranking_submissions')
+    op.drop_index(op.f('ix_player_ranking_submissions_id'), table_name='player_ranking_submissions')
+    op.drop_table('player_ranking_submissions')
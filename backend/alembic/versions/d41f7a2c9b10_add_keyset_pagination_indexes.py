@@ -0,0 +1,35 @@
+"""add keyset pagination indexes
+
+Revision ID: d41f7a2c9b10
+Revises: 6316b509cc5e
+Create Date: 2025-09-15 10:12:44.183920
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd41f7a2c9b10'
+down_revision = '6316b509cc5e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Composite (sort_key, id) indexes backing cursor pagination
+    op.create_index('ix_tournaments_start_date_id', 'tournaments', ['start_date', 'id'])
+    op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'])
+    op.create_index('ix_player_rankings_rank_id', 'player_rankings', ['rank', 'id'])
+    op.create_index(
+        'ix_tkr_game_submissions_tournament_submitted',
+        'tkr_game_submissions',
+        ['tournament_id', 'submitted_at', 'id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tkr_game_submissions_tournament_submitted', 'tkr_game_submissions')
+    op.drop_index('ix_player_rankings_rank_id', 'player_rankings')
+    op.drop_index('ix_users_created_at_id', 'users')
+    op.drop_index('ix_tournaments_start_date_id', 'tournaments')
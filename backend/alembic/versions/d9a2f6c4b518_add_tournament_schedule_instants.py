@@ -0,0 +1,47 @@
+"""add tournament schedule instants
+
+Revision ID: d9a2f6c4b518
+Revises: c3f8a1e5d247
+Create Date: 2025-09-24 11:37:02.661930
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd9a2f6c4b518'
+down_revision = 'c3f8a1e5d247'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('tournaments', sa.Column('starts_at', sa.DateTime(), nullable=True))
+    op.add_column('tournaments', sa.Column('ends_at', sa.DateTime(), nullable=True))
+
+    # Same rules as crud.tournament.compute_schedule: malformed or missing
+    # start times mean midnight, missing end times mean 23:59
+    op.execute("""
+        UPDATE tournaments SET
+            starts_at = CASE WHEN start_date IS NULL THEN NULL
+                ELSE date_trunc('day', start_date) + CASE
+                    WHEN start_time ~ '^[0-9]{1,2}:[0-9]{2}$' THEN start_time::time
+                    ELSE time '00:00' END
+                END,
+            ends_at = CASE WHEN end_date IS NULL THEN NULL
+                ELSE date_trunc('day', end_date) + CASE
+                    WHEN end_time ~ '^[0-9]{1,2}:[0-9]{2}$' THEN end_time::time
+                    ELSE time '23:59' END
+                END
+    """)
+
+    op.create_index('ix_tournaments_status_starts_at', 'tournaments', ['status', 'starts_at'])
+    op.create_index('ix_tournaments_status_ends_at', 'tournaments', ['status', 'ends_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tournaments_status_ends_at', 'tournaments')
+    op.drop_index('ix_tournaments_status_starts_at', 'tournaments')
+    op.drop_column('tournaments', 'ends_at')
+    op.drop_column('tournaments', 'starts_at')
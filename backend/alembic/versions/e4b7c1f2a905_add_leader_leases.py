@@ -0,0 +1,31 @@
+"""add leader leases
+
+Revision ID: e4b7c1f2a905
+Revises: d9a2f6c4b518
+Create Date: 2025-09-25 15:02:44.183205
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4b7c1f2a905'
+down_revision = 'd9a2f6c4b518'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'leader_leases',
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('holder', sa.String(length=255), nullable=False),
+        sa.Column('acquired_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('leader_leases')
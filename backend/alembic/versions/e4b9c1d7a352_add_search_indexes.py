@@ -0,0 +1,42 @@
+"""add search indexes
+
+Revision ID: e4b9c1d7a352
+Revises: c6a3e8f2d157
+Create Date: 2025-10-08 14:05:19.402716
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4b9c1d7a352'
+down_revision = 'c6a3e8f2d157'
+branch_labels = None
+depends_on = None
+
+# (table, column, index name stem) for every searched name
+SEARCHED_COLUMNS = (
+    ('player_rankings', 'player_name', 'ix_player_rankings_name'),
+    ('teams', 'name', 'ix_teams_name'),
+    ('tournaments', 'name', 'ix_tournaments_name'),
+    ('users', 'username', 'ix_users_username'),
+    ('host_profiles', 'organization_name', 'ix_host_profiles_organization_name'),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, column, stem in SEARCHED_COLUMNS:
+        # Trigram index: fuzzy (%) and substring LIKE matches of 3+ characters
+        op.execute(f"CREATE INDEX {stem}_trgm ON {table} USING gin (lower({column}) gin_trgm_ops)")
+        # Btree prefix index: LIKE 'ab%' for queries too short to have trigrams
+        op.execute(f"CREATE INDEX {stem}_prefix ON {table} (lower({column}) text_pattern_ops)")
+
+
+def downgrade() -> None:
+    for table, column, stem in reversed(SEARCHED_COLUMNS):
+        op.drop_index(f'{stem}_prefix', table_name=table)
+        op.drop_index(f'{stem}_trgm', table_name=table)
+    # pg_trgm is left installed; dropping an extension needs more privileges than
+    # the app role usually has
@@ -0,0 +1,50 @@
+"""add tkr submission deadlines
+
+Revision ID: f1c6a8d3e720
+Revises: e4b7c1f2a905
+Create Date: 2025-09-26 09:48:13.902716
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1c6a8d3e720'
+down_revision = 'e4b7c1f2a905'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('tkr_team_registrations', sa.Column('submission_deadline', sa.DateTime(), nullable=True))
+    op.add_column('tkr_team_registrations', sa.Column('submissions_closed_at', sa.DateTime(), nullable=True))
+
+    # Registrations created before end_time was always set
+    op.execute("""
+        UPDATE tkr_team_registrations r
+        SET end_time = r.start_time + make_interval(hours => c.consecutive_hours)
+        FROM tkr_tournament_configs c
+        WHERE r.config_id = c.id AND r.end_time IS NULL
+    """)
+    # 24h grace, the TKR_SUBMISSION_GRACE_HOURS default
+    op.execute("""
+        UPDATE tkr_team_registrations
+        SET submission_deadline = end_time + interval '24 hours'
+    """)
+    op.execute("""
+        UPDATE tkr_team_registrations
+        SET submissions_closed_at = timezone('utc', now())
+        WHERE submission_deadline <= timezone('utc', now())
+    """)
+
+    op.create_index(
+        'ix_tkr_team_registrations_open_deadline', 'tkr_team_registrations', ['submission_deadline'],
+        postgresql_where=sa.text('submissions_closed_at IS NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tkr_team_registrations_open_deadline', 'tkr_team_registrations')
+    op.drop_column('tkr_team_registrations', 'submissions_closed_at')
+    op.drop_column('tkr_team_registrations', 'submission_deadline')
@@ -1,6 +1,9 @@
 # app/api/deps.py
-from typing import Generator
-from fastapi import Depends, HTTPException, status
+import math
+import time
+from typing import Generator, Optional
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from pydantic import ValidationError
@@ -8,7 +11,9 @@ from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
 from app.core.config import settings
-from app.core.security import verify_token
+from app.core import rate_limit as rate_limiter
+from app.core.auth_cache import Principal, PrincipalCache
+from app.core.security import decode_token
 from app.db.database import SessionLocal
 from app.models.user import UserRole
 
@@ -21,27 +26,69 @@ def get_db() -> Generator:
     finally:
         db.close()
 
+class CurrentUser:
+    """
+    The authenticated user.
+
+    id, username, email, role, is_active and is_verified come from the cached
+    principal, so authorization checks need no query. Any other attribute
+    loads the User row from the request's session on first access.
+    """
+
+    def __init__(self, principal: Principal, db: Session, user: Optional[models.User] = None):
+        self.id = principal.id
+        self.username = principal.username
+        self.email = principal.email
+        self.role = principal.role
+        self.is_active = principal.is_active
+        self.is_verified = principal.is_verified
+        self._db = db
+        self._user = user
+
+    @property
+    def orm_user(self) -> models.User:
+        if self._user is None:
+            self._user = crud.user.get_user(self._db, user_id=self.id)
+            if self._user is None:
+                raise HTTPException(status_code=401, detail="Could not validate credentials")
+        return self._user
+
+    def __getattr__(self, name):
+        # Only reached for attributes that are not part of the principal
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.orm_user, name)
+
 async def get_current_user(
     db: Session = Depends(get_db),
     token: str = Depends(oauth2_scheme)
-) -> models.User:
+) -> CurrentUser:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    token_key = PrincipalCache.token_key(token)
+    principal = PrincipalCache.get(token_key)
+    if principal is not None:
+        return CurrentUser(principal, db)
+
     try:
         # Use "access" token type for authentication
-        user_id = verify_token(token, "access")
-        if user_id is None:
+        claims = decode_token(token, "access")
+        if claims is None:
             raise credentials_exception
-    except (JWTError, ValidationError):
+        user_id = int(claims["sub"])
+    except (JWTError, ValidationError, KeyError, ValueError):
         raise credentials_exception
         
     user = crud.user.get_user(db, user_id=user_id)
     if not user:
         raise credentials_exception
-    return user
+
+    principal = Principal.from_user(user)
+    PrincipalCache.set(token_key, principal, claims["exp"] - time.time())
+    return CurrentUser(principal, db, user)
 
 def get_current_active_user(
     current_user: models.User = Depends(get_current_user),
@@ -71,4 +118,53 @@ def get_current_host_or_super_admin(
             status_code=403,
             detail="Host privileges required"
         )
-    return current_user
\ No newline at end of file
+    return current_user
+
+async def _request_field(request: Request, name: str) -> Optional[str]:
+    """Read `name` from the query string, form or JSON body (bodies are cached by Starlette)"""
+    value = request.query_params.get(name)
+    if value is None:
+        content_type = request.headers.get("content-type", "")
+        try:
+            if content_type.startswith(("application/x-www-form-urlencoded", "multipart/form-data")):
+                value = (await request.form()).get(name)
+            elif content_type.startswith("application/json"):
+                body = await request.json()
+                value = body.get(name) if isinstance(body, dict) else None
+        except ValueError:
+            value = None
+    return str(value).strip().lower() if value else None
+
+async def _enforce_rate_limit(scope: str, identity: str, times: int, seconds: float):
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+    result = await run_in_threadpool(rate_limiter.hit, scope, identity, times, seconds)
+    if not result.allowed:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many requests. Please try again later.",
+            headers={"Retry-After": str(math.ceil(result.retry_after))}
+        )
+
+def rate_limit(scope: str, times: int, seconds: float, key: str = "ip"):
+    """
+    Dependency allowing `times` requests per `seconds` for each caller.
+
+    key="ip" limits per client address, key="user" per authenticated user,
+    and any other value names a request field (e.g. "email") to limit on;
+    requests without that field fall back to the client address.
+    """
+    if key == "user":
+        async def limit_by_user(current_user: CurrentUser = Depends(get_current_user)):
+            await _enforce_rate_limit(scope, f"user:{current_user.id}", times, seconds)
+        return limit_by_user
+
+    async def limit_by_request(request: Request):
+        identity = None
+        if key != "ip":
+            value = await _request_field(request, key)
+            identity = f"{key}:{value}" if value else None
+        if identity is None:
+            identity = "ip:" + rate_limiter.client_ip(request.headers, request.client)
+        await _enforce_rate_limit(scope, identity, times, seconds)
+    return limit_by_request
@@ -4,7 +4,7 @@ from fastapi import APIRouter
 from app.api.v1.endpoints import (
     auth, tournament, team, match, user, leaderboard, 
     player_ranking, team_generator, losers_match, admin, 
-    hosts, host_applications, social_links, tkr  # Add TKR import
+    hosts, host_applications, social_links, tkr, stats, search  # Add TKR import
 )
 
 api_router = APIRouter()
@@ -23,6 +23,8 @@ api_router.include_router(team_generator.router, prefix="/team-generator", tags=
 api_router.include_router(losers_match.router, prefix="/losers-matches", tags=["losers matches"])
 api_router.include_router(hosts.router, prefix="/hosts", tags=["hosts"])
 api_router.include_router(host_applications.router, prefix="/host-applications", tags=["host-applications"])
+api_router.include_router(stats.router, prefix="/stats", tags=["stats"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
 
 # Add TKR router
 api_router.include_router(tkr.router, prefix="/tkr", tags=["tkr"])
\ No newline at end of file
@@ -1,12 +1,14 @@
 # app/api/v1/endpoints/admin.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from typing import Dict
+from typing import Dict, Optional
 from datetime import datetime, timedelta
 import psutil
 
 from app.api import deps
+from app.crud import user as user_crud
+from app.crud.pagination import set_next_cursor
 from app.models.user import User, UserRole
 from app.models.tournament import Tournament, TournamentStatus
 
@@ -99,11 +101,16 @@ async def get_admin_stats(
     
 @router.get("/users")
 async def get_all_users(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_super_admin)
 ):
     """Get all users for admin management."""
-    users = db.query(User).offset(skip).limit(limit).all()
+    users = user_crud.get_users(
+        db, skip=skip, limit=limit, include_inactive=True, cursor=cursor
+    )
+    set_next_cursor(response, users, limit, "created_at")
     return users
\ No newline at end of file
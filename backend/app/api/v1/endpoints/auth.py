@@ -4,7 +4,6 @@ from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
-from collections import defaultdict
 from pydantic import BaseModel
 from app.models import User
 from app.core.security import get_password_hash, verify_password_reset_token, verify_password
@@ -22,37 +21,25 @@ from app.core.security import (
     create_profile_update_token,
     verify_profile_update_token
 )
-from app.core.email import send_password_reset_email, send_verification_email, send_email
+from app.core.email import send_password_reset_email, send_verification_email, queue_email
+from app.core.auth_cache import PrincipalCache
 from app.core.config import settings
 
 router = APIRouter()
 
-email_attempts = defaultdict(list)
-MAX_ATTEMPTS = 3
-RATE_LIMIT_DURATION = timedelta(hours=1)
-
-def check_email_rate_limit(email: str):
-    now = datetime.utcnow()
-    # Remove old attempts
-    email_attempts[email] = [
-        attempt for attempt in email_attempts[email]
-        if now - attempt < RATE_LIMIT_DURATION
+@router.post(
+    "/login/access-token",
+    response_model=schemas.Token,
+    dependencies=[
+        Depends(deps.rate_limit("login", times=20, seconds=60)),
+        Depends(deps.rate_limit("login-account", times=5, seconds=300, key="username"))
     ]
-    
-    if len(email_attempts[email]) >= MAX_ATTEMPTS:
-        raise HTTPException(
-            status_code=429,
-            detail=f"Too many attempts. Please try again in {RATE_LIMIT_DURATION.seconds // 3600} hours."
-        )
-    
-    email_attempts[email].append(now)
-
-@router.post("/login/access-token", response_model=schemas.Token)
-def login_access_token(
+)
+async def login_access_token(
     db: Session = Depends(deps.get_db), 
     form_data: OAuth2PasswordRequestForm = Depends()
 ):
-    user = crud.user.authenticate_user(
+    user = await crud.user.authenticate_user_async(
         db, email_or_username=form_data.username, password=form_data.password
     )
     if not user:
@@ -84,7 +71,13 @@ def test_token(current_user: schemas.User = Depends(deps.get_current_user)):
     """
     return current_user
 
-@router.post("/forgot-password")
+@router.post(
+    "/forgot-password",
+    dependencies=[
+        Depends(deps.rate_limit("forgot-password", times=10, seconds=3600)),
+        Depends(deps.rate_limit("forgot-password-email", times=3, seconds=3600, key="email"))
+    ]
+)
 async def forgot_password(
     email: str,
     db: Session = Depends(deps.get_db)
@@ -95,13 +88,13 @@ async def forgot_password(
         user = crud.user.get_user_by_email(db, email=email)
         if user:
             token = create_password_reset_token(user.id)
-            # Add await here
-            await send_password_reset_email(
+            send_password_reset_email(
+                db,
                 email_to=user.email,
                 token=token,
                 username=user.username
             )
-            print(f"Reset email sent successfully to {email}")
+            print(f"Reset email queued for {email}")
     except Exception as e:
         print(f"Error sending reset email: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -161,6 +154,7 @@ async def verify_email(token: str, db: Session = Depends(deps.get_db)):
             user.is_verified = True
             db.commit()
             db.refresh(user)
+            PrincipalCache.invalidate_user(user.id)
             print(f"Verification status updated successfully. New status: {user.is_verified}")
             
             return {
@@ -183,15 +177,19 @@ async def verify_email(token: str, db: Session = Depends(deps.get_db)):
             "message": "Verification failed. Please try again or contact support."
         }
         
-@router.post("/register", response_model=schemas.User)
+@router.post(
+    "/register",
+    response_model=schemas.User,
+    dependencies=[
+        Depends(deps.rate_limit("register", times=10, seconds=3600)),
+        Depends(deps.rate_limit("register-email", times=3, seconds=3600, key="email"))
+    ]
+)
 async def register_user(
     user: schemas.UserCreate,
     db: Session = Depends(deps.get_db)
 ):
     try:
-        
-        check_email_rate_limit(user.email)
-        
         # Check if user exists
         if crud.user.get_user_by_email(db, email=user.email):
             print(f"Email {user.email} already registered")
@@ -207,8 +205,9 @@ async def register_user(
             # Generate verification token
             token = create_email_verification_token(new_user.id)
             
-            # Send verification email
-            await send_verification_email(
+            # Queue verification email
+            send_verification_email(
+                db,
                 email_to=new_user.email,
                 token=token,
                 username=new_user.username
@@ -236,25 +235,27 @@ async def register_user(
 
 # Add this test route temporarily
 @router.get("/test-email")
-async def test_email():
+async def test_email(db: Session = Depends(deps.get_db)):
     try:
-        await send_email(
+        queue_email(
+            db,
             email_to="brett.marshall81@gmail.com",
             subject="Test Email",
             html_content="<p>This is a test email from Warzone Tournament Hub</p>"
         )
-        return {"message": "Test email sent successfully"}
+        return {"message": "Test email queued successfully"}
     except Exception as e:
         print(f"Error details: {str(e)}")  # Add this for debugging
         raise HTTPException(status_code=500, detail=str(e))
     
-@router.post("/resend-verification")
+@router.post(
+    "/resend-verification",
+    dependencies=[Depends(deps.rate_limit("resend-verification", times=3, seconds=3600, key="email"))]
+)
 async def resend_verification_email(
     email: str,
     db: Session = Depends(deps.get_db)
 ):
-    check_email_rate_limit(email)
-    
     user = crud.user.get_user_by_email(db, email=email)
     if not user:
         # Return success even if email doesn't exist (security best practice)
@@ -264,7 +265,8 @@ async def resend_verification_email(
         raise HTTPException(status_code=400, detail="Email already verified")
     
     token = create_email_verification_token(user.id)
-    await send_verification_email(
+    send_verification_email(
+        db,
         email_to=user.email,
         token=token,
         username=user.username
@@ -1,9 +1,10 @@
 # app/api/v1/endpoints/hosts.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from typing import List, Dict
 
 from app.api import deps
+from app.core.http_cache import cached_json
 from app.models.user import User, UserRole
 from app.schemas.host_profile import (
     HostProfile,
@@ -18,6 +19,7 @@ router = APIRouter()
 
 @router.get("/active", response_model=List[Dict])
 async def get_active_hosts(
+    request: Request,
     db: Session = Depends(deps.get_db),
 ):
     """
@@ -26,7 +28,13 @@ async def get_active_hosts(
     """
     try:
         result = crud.get_active_hosts_with_stats(db)
-        return result
+        last_updated = crud.DailyHostStatsCache.last_updated()
+        return cached_json(
+            request,
+            List[Dict],
+            result,
+            last_modified=last_updated.astimezone() if last_updated else None
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.crud import leaderboard, tournament
 from app.schemas.leaderboard import LeaderboardEntry
 from app.api import deps
+from app.core.responses import validated_json
 from typing import List
 
 router = APIRouter()
@@ -16,4 +17,4 @@ def get_tournament_leaderboard(tournament_id: int, db: Session = Depends(deps.ge
     leaderboard_entries = leaderboard.get_tournament_leaderboard(db, tournament_id)
     if not leaderboard_entries:
         raise HTTPException(status_code=404, detail="Leaderboard not found")
-    return leaderboard_entries
\ No newline at end of file
+    return validated_json(List[LeaderboardEntry], leaderboard_entries)
\ No newline at end of file
@@ -7,6 +7,8 @@ from datetime import datetime
 import logging
 from app import crud, schemas
 from app.api import deps
+from app.core.responses import validated_json
+from app.crud.stats import record_match_result
 from app.models.tournament import TournamentFormat, TournamentStatus
 from app.models.match import Match
 from app.models.losers_match import LosersMatch
@@ -23,6 +25,12 @@ def check_tournament_access(user: User, tournament_obj) -> bool:
     return (user.role == UserRole.SUPER_ADMIN or 
             (user.role == UserRole.HOST and tournament_obj.creator_id == user.id))
 
+def losers_match_result(match: LosersMatch):
+    """(winner_id, loser_id); losers bracket matches only store the winner"""
+    if not match.winner_id:
+        return (None, None)
+    return (match.winner_id, match.team2_id if match.winner_id == match.team1_id else match.team1_id)
+
 async def check_tournament_completion(db: Session, tournament_id: int, match: Match) -> bool:
     """
     Check if this match completion should mark the tournament as complete.
@@ -104,13 +112,13 @@ def read_matches_by_tournament(
     finals = [m for m in matches if m.round >= 98]
     total_rounds = max((m.round for m in winners_bracket), default=0)
 
-    return schemas.TournamentBracketResponse(
-        tournament_id=tournament_id,
-        winners_bracket=winners_bracket,
-        finals=finals,
-        losers_bracket=losers_matches,
-        total_rounds=total_rounds
-    )
+    return validated_json(schemas.TournamentBracketResponse, {
+        "tournament_id": tournament_id,
+        "winners_bracket": winners_bracket,
+        "finals": finals,
+        "losers_bracket": losers_matches,
+        "total_rounds": total_rounds
+    })
 
 @router.put("/winners/{match_id}", response_model=schemas.Match)
 async def update_winners_match(
@@ -135,8 +143,12 @@ async def update_winners_match(
             detail="Matches can only be updated in ongoing tournaments"
         )
     
+    previous_result = (match.winner_id, match.loser_id)
     try:
         updated_match = WinnersBracket.update_match(match_id, match_update.winner_id, db)
+        record_match_result(
+            db, tournament, previous_result, (updated_match.winner_id, updated_match.loser_id)
+        )
         
         # Check if tournament should be completed
         should_complete = await check_tournament_completion(db, tournament.id, updated_match)
@@ -176,8 +188,11 @@ def update_losers_match(
             detail="Matches can only be updated in ongoing tournaments"
         )
     
+    previous_result = losers_match_result(match)
     try:
-        return LosersBracket.update_match(match_id, match_update.winner_id, db)
+        updated_match = LosersBracket.update_match(match_id, match_update.winner_id, db)
+        record_match_result(db, tournament, previous_result, losers_match_result(updated_match))
+        return updated_match
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -207,8 +222,12 @@ async def update_championship_match(
             detail="Matches can only be updated in ongoing tournaments"
         )
     
+    previous_result = (match.winner_id, match.loser_id)
     try:
         updated_match = ChampionshipMatches.update_match(match_id, match_update.winner_id, db)
+        record_match_result(
+            db, tournament, previous_result, (updated_match.winner_id, updated_match.loser_id)
+        )
         
         # Check if tournament should be completed
         should_complete = await check_tournament_completion(db, tournament.id, updated_match)
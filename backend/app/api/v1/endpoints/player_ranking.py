@@ -1,15 +1,24 @@
 # app/api/v1/endpoints/player_ranking.py
-from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel, Field, field_validator, ValidationInfo
-import smtplib
-from email.mime.text import MIMEText
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field, ValidationError, field_validator, ValidationInfo
 from app.core.config import settings
+from app.core.email import queue_email
 from app.ml import player_ranking_prediction
-from typing import Any, List
+from typing import Any, Dict, List, Optional
+import codecs
+import csv
+import json
 from sqlalchemy.orm import Session
-from app.schemas.player_ranking import PlayerRankingCreate, PlayerRankingUpdate, PlayerRanking
+from app.schemas.player_ranking import (
+    PlayerRankingCreate, PlayerRankingUpdate, PlayerRanking,
+    PlayerRankingModelInfo, PlayerRerankResult, PlayerRankingImportRow, PlayerRankingImportResult
+)
 from app.crud import player_ranking as crud_player_ranking
 from app.api import deps
+from app.crud.pagination import NEXT_CURSOR_HEADER, set_next_cursor
+from app.core.responses import get_type_adapter, validated_json
+from app.core.http_cache import cached_json
 from app.api.deps import get_current_super_admin
 from app.schemas.user import User
 
@@ -34,9 +43,11 @@ class PlayerRankingForm(BaseModel):
         return v
 
 @router.post("/submit-ranking")
-async def submit_ranking(form_data: PlayerRankingForm):
+async def submit_ranking(form_data: PlayerRankingForm, db: Session = Depends(deps.get_db)):
     # Process form data and get prediction
-    prediction = player_ranking_prediction.predict(form_data.model_dump())
+    form = form_data.model_dump()
+    prediction = player_ranking_prediction.predict(form)
+    crud_player_ranking.create_ranking_submission(db, form, prediction)
     
     # Prepare email content
     email_content = f"""
@@ -52,33 +63,108 @@ async def submit_ranking(form_data: PlayerRankingForm):
     Wins: {form_data.wins}
     Score/Min: {form_data.score_per_min}
     
-    Predicted Ranking: {prediction}
+    Predicted Ranking: {prediction if prediction is not None else "n/a (no trained model)"}
     """
     
-    # Send email
-    msg = MIMEText(email_content)
-    msg['Subject'] = f"New Player Ranking Submission: {form_data.player_name}"
-    msg['From'] = settings.EMAIL_FROM
-    msg['To'] = ', '.join(settings.EMAIL_RECIPIENTS)
-    
-    try:
-        with smtplib.SMTP(settings.SMTP_SERVER, settings.SMTP_PORT) as server:
-            server.starttls()
-            server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
-            server.send_message(msg)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to send email: {str(e)}")
+    # Queue email for the outbox worker
+    if settings.EMAIL_RECIPIENTS:
+        queue_email(
+            db,
+            email_to=', '.join(settings.EMAIL_RECIPIENTS),
+            subject=f"New Player Ranking Submission: {form_data.player_name}",
+            text_content=email_content
+        )
     
     return {"message": "Ranking submitted successfully", "prediction": prediction}
 
 @router.get("/rankings", response_model=List[PlayerRanking])
 def read_player_rankings(
+    request: Request,
+    response: Response,
     skip: int = 0, 
     limit: int = 100, 
+    cursor: Optional[str] = None,
     db: Session = Depends(deps.get_db)
 ):
-    rankings = crud_player_ranking.get_player_rankings(db, skip=skip, limit=limit)
-    return rankings
+    rankings = crud_player_ranking.get_player_rankings(db, skip=skip, limit=limit, cursor=cursor)
+    next_cursor = set_next_cursor(response, rankings, limit, "rank")
+    cached = cached_json(request, List[PlayerRanking], rankings)
+    if next_cursor:
+        cached.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return cached
+
+async def read_csv_records(request: Request) -> List[Dict]:
+    """Parse a CSV body (header row required) as it streams in"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    records: List[Dict] = []
+    header: Optional[List[str]] = None
+    pending = ""
+
+    def consume(lines: List[str]):
+        nonlocal header
+        for values in csv.reader(lines):
+            if not any(value.strip() for value in values):
+                continue
+            if header is None:
+                header = [value.strip().lower() for value in values]
+                continue
+            records.append(dict(zip(header, values)))
+            if len(records) > settings.PLAYER_RANKING_IMPORT_MAX_ROWS:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"At most {settings.PLAYER_RANKING_IMPORT_MAX_ROWS} rows per import"
+                )
+
+    async for chunk in request.stream():
+        pending += decoder.decode(chunk)
+        # Player names never contain newlines, so complete lines are complete records
+        lines = pending.split("\n")
+        pending = lines.pop()
+        consume(lines)
+    pending += decoder.decode(b"", final=True)
+    consume([pending])
+    return records
+
+@router.post("/rankings/import", response_model=PlayerRankingImportResult)
+async def import_player_rankings(
+    request: Request,
+    replace: bool = False,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(get_current_super_admin)
+):
+    """
+    Bulk upsert the ladder from a CSV (text/csv, columns player_name,
+    twitter_handle, rank) or JSON array body, then renumber every rank
+    in the same transaction. replace=true also removes players missing
+    from the import.
+    """
+    content_type = request.headers.get("content-type", "")
+    if "csv" in content_type:
+        records = await read_csv_records(request)
+    elif "json" in content_type:
+        try:
+            records = json.loads(await request.body())
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid JSON body")
+        if not isinstance(records, list):
+            raise HTTPException(status_code=400, detail="Expected a JSON array of rankings")
+        if len(records) > settings.PLAYER_RANKING_IMPORT_MAX_ROWS:
+            raise HTTPException(
+                status_code=413,
+                detail=f"At most {settings.PLAYER_RANKING_IMPORT_MAX_ROWS} rows per import"
+            )
+    else:
+        raise HTTPException(status_code=415, detail="Send text/csv or application/json")
+
+    try:
+        rows = get_type_adapter(List[PlayerRankingImportRow]).validate_python(records)
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=e.errors(include_url=False)[:20])
+
+    result = await run_in_threadpool(
+        crud_player_ranking.import_player_rankings, db, [row.model_dump() for row in rows], replace
+    )
+    return validated_json(PlayerRankingImportResult, result)
 
 @router.get("/rankings/{ranking_id}", response_model=PlayerRanking)
 def read_player_ranking(
@@ -119,4 +205,54 @@ def delete_player_ranking(
     db_ranking = crud_player_ranking.delete_player_ranking(db, ranking_id=ranking_id)
     if db_ranking is None:
         raise HTTPException(status_code=404, detail="Player ranking not found")
-    return db_ranking
\ No newline at end of file
+    return db_ranking
+
+# Prediction model
+@router.get("/model", response_model=PlayerRankingModelInfo)
+def get_ranking_model_info(current_user: User = Depends(get_current_super_admin)):
+    return validated_json(PlayerRankingModelInfo, player_ranking_prediction.model_info())
+
+@router.post("/model/train", response_model=PlayerRankingModelInfo)
+async def train_ranking_model(
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(get_current_super_admin)
+):
+    """Retrain on every ranked player's latest submitted stats; other workers pick up the new artifact"""
+    rows, ranks = crud_player_ranking.get_training_data(db)
+    try:
+        metadata = await run_in_threadpool(player_ranking_prediction.train, rows, ranks)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return validated_json(PlayerRankingModelInfo, {"trained": True, **metadata})
+
+@router.post("/rerank", response_model=PlayerRerankResult)
+def rerank_ladder(
+    apply: bool = False,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(get_current_super_admin)
+):
+    """
+    Re-rank the whole ladder from the model in one batch prediction.
+    A dry run by default; apply=true writes the new ranks.
+    """
+    ladder = crud_player_ranking.get_ladder_with_stats(db)
+    new_ranks = player_ranking_prediction.rerank([entry.rank or 0 for entry, _ in ladder], [stats for _, stats in ladder])
+    if new_ranks is None:
+        raise HTTPException(status_code=400, detail="No trained ranking model")
+
+    entries = [
+        {
+            "ranking_id": entry.id,
+            "player_name": entry.player_name,
+            "twitter_handle": entry.twitter_handle,
+            "current_rank": entry.rank,
+            "new_rank": new_rank,
+            "has_stats": stats is not None,
+        }
+        for (entry, stats), new_rank in zip(ladder, new_ranks)
+    ]
+    moved = {item["ranking_id"]: item["new_rank"] for item in entries if item["new_rank"] != item["current_rank"]}
+    if apply:
+        crud_player_ranking.apply_ladder_ranks(db, moved)
+    entries.sort(key=lambda item: item["new_rank"])
+    return validated_json(PlayerRerankResult, {"applied": apply, "players_moved": len(moved), "entries": entries})
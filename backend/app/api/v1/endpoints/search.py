@@ -0,0 +1,38 @@
+# app/api/v1/endpoints/search.py - Typeahead search over players, teams, tournaments and hosts
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.core.http_cache import cached_json
+from app.crud.search import SEARCH_KINDS
+from app.schemas.search import SearchResults
+from app.services import search as search_service
+
+router = APIRouter()
+
+@router.get(
+    "/",
+    response_model=SearchResults,
+    dependencies=[Depends(deps.rate_limit("search", times=120, seconds=60))]
+)
+def search(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=100),
+    kinds: str = Query(",".join(SEARCH_KINDS), description="Comma-separated subset of the kinds to search"),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(deps.get_db)
+):
+    """
+    Prefix and fuzzy (trigram) name search. Hits are ranked per kind: names
+    starting with the query first, then names with a later word starting
+    with it, then by similarity. Queries under 3 characters only prefix-match.
+    """
+    selected = [kind.strip() for kind in kinds.split(",") if kind.strip()]
+    unknown = [kind for kind in selected if kind not in SEARCH_KINDS]
+    if unknown or not selected:
+        raise HTTPException(
+            status_code=400,
+            detail=f"kinds must be a comma-separated subset of {', '.join(SEARCH_KINDS)}"
+        )
+    results = search_service.search(db, q, list(dict.fromkeys(selected)), limit)
+    return cached_json(request, SearchResults, {"query": q, **results})
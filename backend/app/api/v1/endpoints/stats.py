@@ -0,0 +1,98 @@
+# app/api/v1/endpoints/stats.py - Career leaderboards and profiles from precomputed rollups
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from app.api import deps
+from app.core.http_cache import cached_json
+from app.crud import stats as stats_crud
+from app.crud.pagination import NEXT_CURSOR_HEADER, set_next_cursor
+from app.models.stats import StatsSubject
+from app.schemas.stats import StatsProfile, StatsRollup
+
+router = APIRouter()
+
+def leaderboard_response(
+    request: Request,
+    response: Response,
+    db: Session,
+    subject_type: str,
+    game: str,
+    map_name: str,
+    season: str,
+    sort: str,
+    skip: int,
+    limit: int,
+    cursor: Optional[str]
+):
+    rows = stats_crud.get_stats_leaderboard(
+        db, subject_type, game=game, map_name=map_name, season=season,
+        sort=sort, skip=skip, limit=limit, cursor=cursor
+    )
+    next_cursor = set_next_cursor(response, rows, limit, stats_crud.LEADERBOARD_SORTS[sort])
+    cached = cached_json(request, List[StatsRollup], rows)
+    if next_cursor:
+        cached.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return cached
+
+def profile_response(request: Request, db: Session, subject_type: str, name: str):
+    rows = stats_crud.get_stats_profile(db, subject_type, name)
+    if not rows:
+        raise HTTPException(status_code=404, detail="No stats recorded for this name")
+    career = next((row for row in rows if not (row.game or row.map_name or row.season)), None)
+    return cached_json(request, StatsProfile, {
+        "subject_type": subject_type,
+        "subject_key": rows[0].subject_key,
+        "display_name": (career or rows[0]).display_name,
+        "career": career,
+        "breakdown": rows
+    })
+
+@router.get("/players", response_model=List[StatsRollup])
+def get_player_leaderboard(
+    request: Request,
+    response: Response,
+    game: str = "",
+    map_name: str = "",
+    season: str = "",
+    sort: str = Query("score", pattern="^(score|kills|wins)$"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    db: Session = Depends(deps.get_db)
+):
+    """
+    Career player leaderboard. Filter by game, map and/or season
+    (e.g. 2025-Q4); leaving one empty totals across it.
+    """
+    return leaderboard_response(
+        request, response, db, StatsSubject.PLAYER, game, map_name, season, sort, skip, limit, cursor
+    )
+
+@router.get("/players/{handle}", response_model=StatsProfile)
+def get_player_profile(handle: str, request: Request, db: Session = Depends(deps.get_db)):
+    """A player's career totals and per game/map/season breakdown"""
+    return profile_response(request, db, StatsSubject.PLAYER, handle)
+
+@router.get("/teams", response_model=List[StatsRollup])
+def get_team_leaderboard(
+    request: Request,
+    response: Response,
+    game: str = "",
+    map_name: str = "",
+    season: str = "",
+    sort: str = Query("score", pattern="^(score|kills|wins)$"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    db: Session = Depends(deps.get_db)
+):
+    """Career team leaderboard, keyed by team name across tournaments"""
+    return leaderboard_response(
+        request, response, db, StatsSubject.TEAM, game, map_name, season, sort, skip, limit, cursor
+    )
+
+@router.get("/teams/{name}", response_model=StatsProfile)
+def get_team_profile(name: str, request: Request, db: Session = Depends(deps.get_db)):
+    """A team's career totals and per game/map/season breakdown"""
+    return profile_response(request, db, StatsSubject.TEAM, name)
@@ -1,9 +1,10 @@
 # app/api/v1/endpoints/team.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from typing import List
 from app import crud, schemas
 from app.api import deps
+from app.core.http_cache import cached_json, not_modified_response, version_etag
 from app.models.user import User, UserRole
 from app.models.tournament import TournamentStatus
 
@@ -120,6 +121,16 @@ def read_team(team_id: int, db: Session = Depends(deps.get_db)):
     return db_team
 
 @router.get("/tournament/{tournament_id}", response_model=List[schemas.Team])
-def read_teams_by_tournament(tournament_id: int, db: Session = Depends(deps.get_db)):
+def read_teams_by_tournament(
+    tournament_id: int,
+    request: Request,
+    db: Session = Depends(deps.get_db)
+):
+    last_modified, team_count = crud.team.get_tournament_teams_version(db, tournament_id)
+    etag = version_etag("teams", tournament_id, last_modified, team_count)
+    not_modified = not_modified_response(request, etag, last_modified)
+    if not_modified is not None:
+        return not_modified
+
     teams = crud.team.get_teams_by_tournament(db, tournament_id=tournament_id)
-    return teams
\ No newline at end of file
+    return cached_json(request, List[schemas.Team], teams, etag=etag, last_modified=last_modified)
\ No newline at end of file
@@ -1,83 +1,65 @@
 # app/api/v1/endpoints/team_generator.py
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
-from typing import List
-import random
+from sqlalchemy.orm import Session
+from typing import List, Literal, Optional
+
+from app.api import deps
+from app.core.config import settings
+from app.core.responses import validated_json
+from app.crud import player_ranking as crud_player_ranking
+from app.services import team_generator
 
 router = APIRouter()
 
 class TeamGeneratorInput(BaseModel):
     lists: List[List[str]] = Field(..., min_items=1, max_items=4)
     team_size: int = Field(..., ge=2, le=4)
+    # Same seed and lists give the same teams; omitted, a random seed is picked and returned
+    seed: Optional[int] = Field(None, ge=0)
+    # "snake" and "min_variance" balance teams by player ranking
+    balance: Literal["random", "snake", "min_variance"] = "random"
 
 class GeneratedTeams(BaseModel):
     teams: List[List[str]]
+    seed: int
+    # Mean ladder rank of each team's ranked players, for balanced draws
+    average_ranks: Optional[List[Optional[float]]] = None
 
-def generate_teams_two_lists_size_four(list1: List[str], list2: List[str]) -> List[List[str]]:
-    random.shuffle(list1)
-    random.shuffle(list2)
-    num_teams = min(len(list1), len(list2)) // 2
-    teams = []
-    for i in range(num_teams):
-        team = list1[i*2:(i+1)*2] + list2[i*2:(i+1)*2]
-        random.shuffle(team)
-        teams.append(team)
-    # Handle any remaining players
-    remaining = list1[num_teams*2:] + list2[num_teams*2:]
-    for i, player in enumerate(remaining):
-        teams[i % len(teams)].append(player)
-    return teams
-
-@router.post("/generate", response_model=GeneratedTeams)
-async def generate_teams(input_data: TeamGeneratorInput):
-    # Validate that no list exceeds 150 players
-    for i, player_list in enumerate(input_data.lists):
-        if len(player_list) > 150:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"List {i+1} exceeds the maximum of 150 players"
-            )
-
-    num_lists = len(input_data.lists)
+@router.post(
+    "/generate",
+    response_model=GeneratedTeams,
+    dependencies=[Depends(deps.rate_limit("team-generator", times=30, seconds=60))]
+)
+def generate_teams(input_data: TeamGeneratorInput, db: Session = Depends(deps.get_db)):
+    """
+    Split the lists into teams of team_size, spreading every list evenly
+    over the teams. Balanced draws look players up on the ranking ladder
+    by name or twitter handle; unranked players count as the weakest.
+    """
     total_players = sum(len(player_list) for player_list in input_data.lists)
-    
-    # Special case: 2 lists and team size of 4
-    if num_lists == 2 and input_data.team_size == 4:
-        teams = generate_teams_two_lists_size_four(input_data.lists[0], input_data.lists[1])
-    else:
-        if num_lists > 1 and total_players < num_lists * input_data.team_size:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Not enough players to form teams of size {input_data.team_size} with players from different lists"
-            )
-
-        # Shuffle each list independently
-        shuffled_lists = [list(player_list) for player_list in input_data.lists]
-        for player_list in shuffled_lists:
-            random.shuffle(player_list)
-
-        # Calculate the number of teams
-        num_teams = total_players // input_data.team_size
-
-        # Initialize teams
-        teams = [[] for _ in range(num_teams)]
-
-        # Distribute players to teams
-        for i in range(num_teams):
-            for j in range(num_lists):
-                if shuffled_lists[j]:
-                    teams[i].append(shuffled_lists[j].pop())
+    if total_players > settings.TEAM_GENERATOR_MAX_PLAYERS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.TEAM_GENERATOR_MAX_PLAYERS} players per draw"
+        )
 
-        # Distribute remaining players
-        remaining_players = [player for sublist in shuffled_lists for player in sublist]
-        random.shuffle(remaining_players)
-        for i, player in enumerate(remaining_players):
-            teams[i % num_teams].append(player)
+    ranks = None
+    if input_data.balance != "random":
+        ranks = crud_player_ranking.get_ranks_by_name(
+            db, [player for player_list in input_data.lists for player in player_list]
+        )
 
-        # If there's only one list, we need to reshuffle to meet the team size requirement
-        if num_lists == 1:
-            all_players = [player for team in teams for player in team]
-            random.shuffle(all_players)
-            teams = [all_players[i:i + input_data.team_size] for i in range(0, len(all_players), input_data.team_size)]
+    try:
+        teams, seed = team_generator.generate_teams(
+            input_data.lists, input_data.team_size,
+            seed=input_data.seed, balance=input_data.balance, ranks=ranks
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return GeneratedTeams(teams=teams)
\ No newline at end of file
+    return validated_json(GeneratedTeams, {
+        "teams": teams,
+        "seed": seed,
+        "average_ranks": team_generator.average_ranks(teams, ranks) if ranks is not None else None
+    })
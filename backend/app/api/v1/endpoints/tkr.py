@@ -1,8 +1,9 @@
 # app/api/v1/endpoints/tkr.py - Complete updated file with Submit Scores security
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+import time
 
 from app import crud
 from app.api import deps
@@ -14,11 +15,18 @@ from app.schemas.tkr import (
     TKRTeamRegistration, TKRTeamRegistrationCreate, TKRTeamRegistrationUpdate,
     TKRGameSubmission, TKRGameSubmissionCreate, TKRGameSubmissionUpdate,
     TKRLeaderboardEntry, TKRTemplate, TKRTemplateCreate, TKRTemplateUpdate,
-    TKRPrizePool, TKRTournamentDetails, TKRBulkGameSubmission
+    TKRPrizePool, TKRTournamentDetails, TKRBulkGameSubmission, TKREligibilityResponse,
+    TKRHostDashboard, TKRQueuedSubmission, TKRVerificationBatch, TKRVerificationResult,
+    TKRSimulationResult, TKRPlayerHistory
 )
 from app.crud import tkr as tkr_crud
 from app.crud import tournament as tournament_crud
 from app.crud import team as team_crud
+from app.crud.pagination import set_next_cursor
+from app.core.config import settings
+from app.core.responses import validated_json
+from app.core.http_cache import cached_json
+from app.services.tkr_anomaly import submission_fingerprint
 
 router = APIRouter()
 
@@ -31,6 +39,26 @@ def check_tkr_tournament(tournament: Tournament) -> bool:
     """Check if tournament is TKR format"""
     return tournament.format == TournamentFormat.TKR
 
+def leaderboard_rows(leaderboard) -> List[dict]:
+    """Flatten leaderboard rows into the TKRLeaderboardEntry shape"""
+    return [
+        {
+            "id": entry.id,
+            "tournament_id": entry.tournament_id,
+            "team_registration_id": entry.team_registration_id,
+            "team_name": entry.team_registration.team_name,
+            "total_kills": entry.total_kills,
+            "total_score": entry.total_score,
+            "games_submitted": entry.games_submitted,
+            "current_rank": entry.current_rank,
+            "average_kills": entry.average_kills,
+            "average_placement": entry.average_placement,
+            "last_updated": entry.last_updated,
+            "team_registration": entry.team_registration
+        }
+        for entry in leaderboard
+    ]
+
 def verify_team_ownership(
     db: Session, 
     tournament_id: int, 
@@ -112,6 +140,37 @@ def update_tkr_tournament_config(
     
     return config
 
+@router.post("/tournaments/{tournament_id}/config/simulate", response_model=TKRSimulationResult)
+def simulate_tkr_config_update(
+    tournament_id: int,
+    config_update: TKRTournamentConfigUpdate,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_host_or_super_admin)
+):
+    """
+    Preview how a config update would change scores and ranks without
+    applying it. Takes the same body as PUT .../config; only the scoring
+    fields affect the result.
+    """
+    started = time.perf_counter()
+    tournament = tournament_crud.get_tournament(db, tournament_id)
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+    
+    if not check_tournament_access(current_user, tournament):
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    config = tkr_crud.get_tkr_config(db, tournament_id)
+    if not config:
+        raise HTTPException(status_code=404, detail="TKR configuration not found")
+    
+    try:
+        result = tkr_crud.simulate_scoring(db, config, config_update.dict(exclude_unset=True))
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid scoring rules: {e}")
+    result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return validated_json(TKRSimulationResult, result)
+
 # TKR Team Registration Endpoints
 @router.post("/tournaments/{tournament_id}/register", response_model=TKRTeamRegistration)
 def register_team_for_tkr(
@@ -172,6 +231,16 @@ def register_team_for_tkr(
             detail=f"Team must have exactly {expected_team_size} players (received {actual_team_size})"
         )
     
+    if not registration.is_rerunning:
+        already_registered = tkr_crud.find_registered_players(
+            db, tournament_id, [player.name for player in registration.players]
+        )
+        if already_registered:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Already registered in this tournament: {', '.join(already_registered)}"
+            )
+    
     # Validate start time is within tournament dates
     tournament_start = tournament.start_date
     tournament_end_date = tournament.end_date or (tournament_start + timedelta(days=config.tournament_days))
@@ -275,6 +344,31 @@ def get_my_team_registration(
     
     return registration
 
+@router.get("/my-eligibility", response_model=TKREligibilityResponse)
+def get_my_submission_eligibility(
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_user)
+):
+    """Submission eligibility for all of the current user's live TKR registrations"""
+    current_time = datetime.utcnow()
+    registrations, valid_until = tkr_crud.get_user_submission_eligibility(
+        db, current_user.id, current_time
+    )
+    
+    # Nothing can change before the next window boundary
+    max_age = settings.TKR_ELIGIBILITY_MAX_AGE
+    if valid_until:
+        max_age = max(0, min(max_age, int((valid_until - current_time).total_seconds())))
+    
+    response = validated_json(TKREligibilityResponse, {
+        "current_time": current_time,
+        "valid_until": valid_until,
+        "registrations": registrations
+    })
+    response.headers["Cache-Control"] = f"private, max-age={max_age}"
+    response.headers["Vary"] = "Authorization"
+    return response
+
 @router.get("/tournaments/{tournament_id}/can-submit-scores")
 def can_user_submit_scores(
     tournament_id: int,
@@ -300,13 +394,11 @@ def can_user_submit_scores(
     if registration:
         current_time = datetime.utcnow()
         
-        # FIXED: Grace period is 24 hours from END of competition window (not start)
-        if registration.end_time:
-            # Competition window has ended, check grace period
-            grace_period_hours = 24
-            submission_deadline = registration.end_time + timedelta(hours=grace_period_hours)
+        # Deadline is end of the competition window plus the grace period
+        if registration.submission_deadline:
+            submission_deadline = registration.submission_deadline
             
-            if current_time > submission_deadline:
+            if registration.submissions_closed_at or current_time > submission_deadline:
                 can_submit = False
                 message = "Submission deadline has passed"
             elif current_time > registration.end_time:
@@ -359,13 +451,11 @@ def can_user_submit_scores_for_team(
     # FIXED: Proper grace period calculation
     current_time = datetime.utcnow()
     
-    if registration.end_time:
-        # FIXED: Grace period is 24 hours from END of competition window
-        # This matches your requirement: start + competition_duration + 24 hours
-        grace_period_hours = 24
-        submission_deadline = registration.end_time + timedelta(hours=grace_period_hours)
+    if registration.submission_deadline:
+        # Deadline is end of the competition window plus the grace period
+        submission_deadline = registration.submission_deadline
         
-        if current_time > submission_deadline:
+        if registration.submissions_closed_at or current_time > submission_deadline:
             can_submit = False
             message = "Submission deadline has passed"
         elif current_time > registration.end_time:
@@ -419,10 +509,38 @@ def update_tkr_team_registration(
     if updating_payment and not check_tournament_access(current_user, tournament):
         raise HTTPException(status_code=403, detail="Only hosts and admins can update payment information")
     
+    if registration_update.players and not registration.is_rerunning:
+        already_registered = tkr_crud.find_registered_players(
+            db, registration.tournament_id, [player.name for player in registration_update.players],
+            exclude_registration_id=registration_id
+        )
+        if already_registered:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Already registered in this tournament: {', '.join(already_registered)}"
+            )
+    
     return tkr_crud.update_tkr_team_registration(db, registration_id, registration_update)
 
+@router.get("/players/{handle}/registrations", response_model=TKRPlayerHistory)
+def get_player_registrations(
+    handle: str,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_user)
+):
+    """Every TKR registration a player (by activision handle) has been on"""
+    return validated_json(TKRPlayerHistory, {
+        "handle": handle,
+        "free_entries_used": tkr_crud.count_free_entries(db, handle),
+        "registrations": tkr_crud.get_player_registrations(db, handle)
+    })
+
 # TKR Game Submission Endpoints - UPDATED with security checks
-@router.post("/tournaments/{tournament_id}/submissions", response_model=TKRGameSubmission)
+@router.post(
+    "/tournaments/{tournament_id}/submissions",
+    response_model=TKRGameSubmission,
+    dependencies=[Depends(deps.rate_limit("tkr-submission", times=30, seconds=60, key="user"))]
+)
 def submit_tkr_game(
     tournament_id: int,
     submission: TKRGameSubmissionCreate,
@@ -449,29 +567,19 @@ def submit_tkr_game(
             detail="You can only submit scores for your own team"
         )
     
-    # FIXED: Check submission deadline with correct grace period calculation
-    current_time = datetime.utcnow()
-    
-    if registration.end_time:
-        # FIXED: 24 hours from END of competition window (not start)
-        grace_period_hours = 24
-        submission_deadline = registration.end_time + timedelta(hours=grace_period_hours)
-        
-        if current_time > submission_deadline:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Submission deadline has passed. Deadline was {submission_deadline.strftime('%Y-%m-%d %H:%M')} UTC"
-            )
-    elif registration.start_time and current_time < registration.start_time:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Competition has not started yet. Starts at {registration.start_time.strftime('%Y-%m-%d %H:%M')} UTC"
-        )
+    # Deadline is precomputed on the registration; no window arithmetic per request
+    window_error = tkr_crud.submission_window_error(registration, datetime.utcnow())
+    if window_error:
+        raise HTTPException(status_code=400, detail=window_error)
     
     submission.tournament_id = tournament_id
     return tkr_crud.create_tkr_game_submission(db, submission)
 
-@router.post("/tournaments/{tournament_id}/bulk-submissions", response_model=List[TKRGameSubmission])
+@router.post(
+    "/tournaments/{tournament_id}/bulk-submissions",
+    response_model=List[TKRGameSubmission],
+    dependencies=[Depends(deps.rate_limit("tkr-submission", times=30, seconds=60, key="user"))]
+)
 def submit_tkr_games_bulk(
     tournament_id: int,
     bulk_submission: TKRBulkGameSubmission,
@@ -498,24 +606,18 @@ def submit_tkr_games_bulk(
             detail="You can only submit scores for your own team"
         )
     
-    # FIXED: Check submission deadline with correct grace period calculation
-    current_time = datetime.utcnow()
+    # Deadline is precomputed on the registration; no window arithmetic per request
+    window_error = tkr_crud.submission_window_error(registration, datetime.utcnow())
+    if window_error:
+        raise HTTPException(status_code=400, detail=window_error)
     
-    if registration.end_time:
-        # FIXED: 24 hours from END of competition window
-        grace_period_hours = 24
-        submission_deadline = registration.end_time + timedelta(hours=grace_period_hours)
-        
-        if current_time > submission_deadline:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Submission deadline has passed. Deadline was {submission_deadline.strftime('%Y-%m-%d %H:%M')} UTC"
-            )
-    elif registration.start_time and current_time < registration.start_time:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Competition has not started yet. Starts at {registration.start_time.strftime('%Y-%m-%d %H:%M')} UTC"
-        )
+    # Reject duplicates within the batch and against earlier submissions up front
+    # so a bad row doesn't leave the batch half-inserted
+    fingerprints = [submission_fingerprint(game.vod_url, game.timestamp) for game in bulk_submission.games]
+    if len(set(fingerprints)) != len(fingerprints):
+        raise HTTPException(status_code=400, detail="The same game (VOD and timestamp) appears more than once")
+    if tkr_crud.find_duplicate_fingerprints(db, bulk_submission.team_registration_id, fingerprints):
+        raise HTTPException(status_code=409, detail=tkr_crud.DUPLICATE_SUBMISSION_DETAIL)
     
     # Submit all games
     submitted_games = []
@@ -533,7 +635,11 @@ def submit_tkr_games_bulk(
 @router.get("/tournaments/{tournament_id}/submissions", response_model=List[TKRGameSubmission])
 def get_tkr_tournament_submissions(
     tournament_id: int,
+    response: Response,
     team_registration_id: Optional[int] = None,
+    skip: int = 0,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user)
 ):
@@ -552,7 +658,11 @@ def get_tkr_tournament_submissions(
                 )
         return tkr_crud.get_tkr_game_submissions_by_team(db, team_registration_id)
     else:
-        return tkr_crud.get_tkr_game_submissions_by_tournament(db, tournament_id)
+        submissions = tkr_crud.get_tkr_game_submissions_by_tournament(
+            db, tournament_id, skip=skip, limit=limit, cursor=cursor
+        )
+        set_next_cursor(response, submissions, limit, "submitted_at")
+        return submissions
 
 @router.put("/submissions/{submission_id}", response_model=TKRGameSubmission)
 def update_tkr_game_submission(
@@ -575,6 +685,61 @@ def update_tkr_game_submission(
     
     return tkr_crud.update_tkr_game_submission(db, submission_id, submission_update)
 
+# Verification queue
+def get_moderated_tournament(db: Session, tournament_id: int, current_user: User) -> Tournament:
+    tournament = tournament_crud.get_tournament(db, tournament_id)
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+    if not check_tournament_access(current_user, tournament):
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return tournament
+
+@router.post(
+    "/tournaments/{tournament_id}/verification-queue/claim",
+    response_model=List[TKRQueuedSubmission]
+)
+def claim_verification_batch(
+    tournament_id: int,
+    limit: int = Query(20, ge=1),
+    order: str = Query("oldest", pattern="^(oldest|suspicious)$"),
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_user)
+):
+    """
+    Claim the next pending submissions to verify. Claimed rows are hidden
+    from other moderators until verified or until the claim expires.
+    order=suspicious hands out the highest anomaly scores first.
+    """
+    get_moderated_tournament(db, tournament_id, current_user)
+    submissions = tkr_crud.claim_pending_submissions(
+        db, tournament_id, current_user.id,
+        min(limit, settings.TKR_VERIFICATION_MAX_BATCH), datetime.utcnow(),
+        suspicious_first=order == "suspicious"
+    )
+    return validated_json(List[TKRQueuedSubmission], submissions)
+
+@router.post(
+    "/tournaments/{tournament_id}/verification-queue/verdicts",
+    response_model=TKRVerificationResult
+)
+def submit_verification_verdicts(
+    tournament_id: int,
+    batch: TKRVerificationBatch,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_user)
+):
+    """Apply a batch of VERIFIED/REJECTED verdicts with a single leaderboard refresh"""
+    get_moderated_tournament(db, tournament_id, current_user)
+    if len(batch.verdicts) > settings.TKR_VERIFICATION_MAX_BATCH:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.TKR_VERIFICATION_MAX_BATCH} verdicts per batch"
+        )
+    updated, skipped = tkr_crud.apply_verification_verdicts(
+        db, tournament_id, current_user.id, batch.verdicts, datetime.utcnow()
+    )
+    return validated_json(TKRVerificationResult, {"updated": updated, "skipped": skipped})
+
 # TKR Leaderboard and Tournament Details
 @router.get("/tournaments/{tournament_id}/leaderboard", response_model=List[TKRLeaderboardEntry])
 def get_tkr_leaderboard(
@@ -589,26 +754,9 @@ def get_tkr_leaderboard(
     
     leaderboard = tkr_crud.get_tkr_leaderboard(db, tournament_id)
     
-    # Convert to response format
-    from app.schemas.tkr import TKRLeaderboardEntry
-    leaderboard_entries = []
-    for entry in leaderboard:
-        leaderboard_entries.append(TKRLeaderboardEntry(
-            id=entry.id,
-            tournament_id=entry.tournament_id,
-            team_registration_id=entry.team_registration_id,
-            team_name=entry.team_registration.team_name,
-            total_kills=entry.total_kills,
-            total_score=entry.total_score,
-            games_submitted=entry.games_submitted,
-            current_rank=entry.current_rank,
-            average_kills=entry.average_kills,
-            average_placement=entry.average_placement,
-            last_updated=entry.last_updated,
-            team_registration=entry.team_registration
-        ))
-    
-    return leaderboard_entries
+    # Validate once while serializing instead of building models and
+    # letting the response_model pass validate them again
+    return validated_json(List[TKRLeaderboardEntry], leaderboard_rows(leaderboard))
 
 @router.get("/tournaments/{tournament_id}/details", response_model=TKRTournamentDetails)
 def get_tkr_tournament_details(
@@ -637,38 +785,53 @@ def get_tkr_tournament_details(
                          if reg.end_time and current_time > reg.end_time)
     
     # Get prize pool if visible
-    prize_pool = None
+    prize_pool_data = None
     if config.show_prize_pool:
         prize_pool_data = tkr_crud.calculate_tkr_prize_pool(db, tournament_id)
-        prize_pool = TKRPrizePool(**prize_pool_data)
-    
-    # Convert leaderboard
-    leaderboard_entries = []
-    for entry in leaderboard:
-        leaderboard_entries.append(TKRLeaderboardEntry(
-            id=entry.id,
-            tournament_id=entry.tournament_id,
-            team_registration_id=entry.team_registration_id,
-            team_name=entry.team_registration.team_name,
-            total_kills=entry.total_kills,
-            total_score=entry.total_score,
-            games_submitted=entry.games_submitted,
-            current_rank=entry.current_rank,
-            average_kills=entry.average_kills,
-            average_placement=entry.average_placement,
-            last_updated=entry.last_updated,
-            team_registration=entry.team_registration
-        ))
-    
-    return TKRTournamentDetails(
-        tournament_id=tournament_id,
-        config=config,
-        total_registrations=total_registrations,
-        active_teams=active_teams,
-        completed_teams=completed_teams,
-        prize_pool=prize_pool,
-        leaderboard=leaderboard_entries
+    
+    return validated_json(TKRTournamentDetails, {
+        "tournament_id": tournament_id,
+        "config": config,
+        "total_registrations": total_registrations,
+        "active_teams": active_teams,
+        "completed_teams": completed_teams,
+        "prize_pool": prize_pool_data,
+        "leaderboard": leaderboard_rows(leaderboard)
+    })
+
+@router.get("/tournaments/{tournament_id}/dashboard", response_model=TKRHostDashboard)
+def get_tkr_host_dashboard(
+    tournament_id: int,
+    since: Optional[datetime] = None,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_user)
+):
+    """
+    Host dashboard: registrations, submissions, leaderboard, prize pool and
+    payment stats in one response. Poll with `since` set to the previous
+    response's server_time to get only what changed.
+    """
+    tournament = tournament_crud.get_tournament(db, tournament_id)
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+    
+    if not check_tournament_access(current_user, tournament):
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    config = tkr_crud.get_tkr_config(db, tournament_id)
+    if not config:
+        raise HTTPException(status_code=404, detail="TKR configuration not found")
+    
+    # Stored timestamps are naive UTC
+    if since and since.tzinfo:
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+    
+    # Taken before loading so rows written during the request show up again next poll
+    dashboard = tkr_crud.get_host_dashboard(
+        db, tournament, config, now=datetime.utcnow(), since=since
     )
+    dashboard["leaderboard"] = leaderboard_rows(dashboard["leaderboard"])
+    return validated_json(TKRHostDashboard, dashboard)
 
 @router.post("/tournaments/{tournament_id}/leaderboard/refresh")
 def refresh_tkr_leaderboard(
@@ -691,6 +854,7 @@ def refresh_tkr_leaderboard(
 @router.get("/tournaments/{tournament_id}/prize-pool", response_model=TKRPrizePool)
 def get_tkr_prize_pool(
     tournament_id: int,
+    request: Request,
     db: Session = Depends(deps.get_db)
 ):
     """Get TKR tournament prize pool information"""
@@ -706,7 +870,7 @@ def get_tkr_prize_pool(
         raise HTTPException(status_code=403, detail="Prize pool is not visible for this tournament")
     
     prize_pool_data = tkr_crud.calculate_tkr_prize_pool(db, tournament_id)
-    return TKRPrizePool(**prize_pool_data)
+    return cached_json(request, TKRPrizePool, prize_pool_data)
 
 # TKR Template Endpoints
 @router.post("/templates", response_model=TKRTemplate)
@@ -1,12 +1,14 @@
 # app/api/v1/endpoints/tournament.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 from app import crud, schemas
 from app.crud import tournament
 from app.api import deps
-from app.models.tournament import TournamentStatus
+from app.crud.pagination import set_next_cursor
+from app.crud.stats import reverse_tournament_matches
+from app.models.tournament import TournamentFormat, TournamentStatus
 from app.models.team import Team
 from app.models.match import Match
 from app.models.losers_match import LosersMatch
@@ -32,6 +34,58 @@ def create_tournament(
         creator_id=current_user.id
     )
 
+@router.get("/listing", response_model=List[Dict[str, Any]])
+def read_tournament_listing(
+    response: Response,
+    fields: Optional[str] = Query(None, description="Comma-separated columns to return"),
+    status: Optional[List[TournamentStatus]] = Query(None),
+    format: Optional[List[TournamentFormat]] = Query(None),
+    host_id: Optional[int] = None,
+    start_from: Optional[datetime] = None,
+    start_to: Optional[datetime] = None,
+    game: Optional[str] = None,
+    order: str = Query("desc", pattern="^(asc|desc)$"),
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_user)
+):
+    """Filtered tournament listing with sparse fieldsets (?fields=id,name,status)"""
+    selected = [f.strip() for f in fields.split(",") if f.strip()] if fields else crud.tournament.CARD_FIELDS
+    rows = crud.tournament.get_tournament_listing(
+        db, fields=selected, statuses=status, formats=format, host_id=host_id,
+        start_from=start_from, start_to=start_to, game=game,
+        skip=skip, limit=limit, cursor=cursor, descending=order == "desc"
+    )
+    set_next_cursor(response, rows, limit, "start_date")
+    return [dict(row._mapping) for row in rows]
+
+@router.get("/cards", response_model=List[schemas.TournamentCard])
+def read_tournament_cards(
+    response: Response,
+    status: Optional[List[TournamentStatus]] = Query(None),
+    format: Optional[List[TournamentFormat]] = Query(None),
+    host_id: Optional[int] = None,
+    start_from: Optional[datetime] = None,
+    start_to: Optional[datetime] = None,
+    game: Optional[str] = None,
+    order: str = Query("desc", pattern="^(asc|desc)$"),
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_user)
+):
+    """Card projection of the tournament listing used by the home and tournaments pages"""
+    rows = crud.tournament.get_tournament_listing(
+        db, statuses=status, formats=format, host_id=host_id,
+        start_from=start_from, start_to=start_to, game=game,
+        skip=skip, limit=limit, cursor=cursor, descending=order == "desc"
+    )
+    set_next_cursor(response, rows, limit, "start_date")
+    return rows
+
 @router.get("/{tournament_id}", response_model=schemas.Tournament)
 def read_tournament(
     tournament_id: int, 
@@ -45,17 +99,16 @@ def read_tournament(
 
 @router.get("/", response_model=List[schemas.Tournament])
 def read_tournaments(
+    response: Response,
     skip: int = 0, 
     limit: int = 100, 
+    cursor: Optional[str] = None,
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user)  # All active users can view
 ):
-    tournaments = crud.tournament.get_tournaments(db, skip=skip, limit=limit)
-    # Add username to each tournament
-    for tournament in tournaments:
-        user = db.query(User).filter(User.id == tournament.creator_id).first()
-        if user:
-            setattr(tournament, 'creator_username', user.username)
+    # creator is joined-loaded, so the schema derives creator_username without extra queries
+    tournaments = crud.tournament.get_tournaments(db, skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, tournaments, limit, "start_date")
     return tournaments
 
 @router.put("/{tournament_id}", response_model=schemas.Tournament)
@@ -137,6 +190,8 @@ def reset_tournament(
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
     try:
+        reverse_tournament_matches(db, tournament)
+        
         # Delete matches in correct order
         db.query(LosersMatch)\
             .filter(LosersMatch.tournament_id == tournament_id)\
@@ -1,11 +1,12 @@
 # app/api/v1/endpoints/user.py
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app import crud, models, schemas
 from app.api import deps
 from app.api.deps import get_current_user
+from app.crud.pagination import set_next_cursor
 from app.schemas.user import User, UserCreate
 from app.models.user import UserRole
 from app.core.cloudinary import cloudinary_service
@@ -34,8 +35,15 @@ def create_user(user: schemas.UserCreate, db: Session = Depends(deps.get_db)):
     return crud.user.create_user(db=db, user=user)
 
 @router.get("/users", response_model=List[schemas.User])
-def read_users(skip: int = 0, limit: int = 100, db: Session = Depends(deps.get_db)):
-    users = crud.user.get_users(db, skip=skip, limit=limit)
+def read_users(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: Session = Depends(deps.get_db)
+):
+    users = crud.user.get_users(db, skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, users, limit, "created_at")
     return users
 
 @router.get("/users/{user_id}", response_model=schemas.User)
@@ -84,8 +92,10 @@ def get_all_hosts(
 
 @router.get("/", response_model=List[schemas.User])
 def get_all_users(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     role: Optional[UserRole] = None,
     include_inactive: bool = False,
     db: Session = Depends(deps.get_db),
@@ -94,13 +104,16 @@ def get_all_users(
     """
     Retrieve all users with optional filtering (Super Admin only).
     """
-    return crud.user.get_users(
+    users = crud.user.get_users(
         db, 
         skip=skip, 
         limit=limit, 
         role=role,
-        include_inactive=include_inactive
+        include_inactive=include_inactive,
+        cursor=cursor
     )
+    set_next_cursor(response, users, limit, "created_at")
+    return users
 
 @router.put("/{user_id}/promote", response_model=schemas.User)
 def promote_to_host(
@@ -0,0 +1,102 @@
+# app/core/auth_cache.py - Short-lived cache of authenticated principals
+import hashlib
+import threading
+import time
+from typing import Dict, NamedTuple, Optional, Set, Tuple
+
+from app.core.config import settings
+
+class Principal(NamedTuple):
+    """The user columns authorization checks read on every request"""
+    id: int
+    username: str
+    email: str
+    role: object
+    is_active: bool
+    is_verified: bool
+
+    @classmethod
+    def from_user(cls, user) -> "Principal":
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            role=user.role,
+            is_active=user.is_active,
+            is_verified=user.is_verified
+        )
+
+class PrincipalCache:
+    """
+    Maps a token hash to the Principal it resolved to, for at most
+    AUTH_CACHE_TTL_SECONDS (and never past the token's own expiry).
+
+    Entries are dropped per user whenever role, active or verified status,
+    or profile fields change, so admin actions take effect immediately.
+    """
+    _entries: Dict[str, Tuple[Principal, float]] = {}
+    _by_user: Dict[int, Set[str]] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def token_key(token: str) -> str:
+        return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+    @classmethod
+    def get(cls, token_key: str) -> Optional[Principal]:
+        entry = cls._entries.get(token_key)
+        if entry is None:
+            return None
+        principal, expires_at = entry
+        if time.monotonic() >= expires_at:
+            with cls._lock:
+                cls._discard(token_key)
+            return None
+        return principal
+
+    @classmethod
+    def set(cls, token_key: str, principal: Principal, token_expires_in: Optional[float] = None):
+        ttl = settings.AUTH_CACHE_TTL_SECONDS
+        if ttl <= 0:
+            return
+        if token_expires_in is not None:
+            ttl = min(ttl, token_expires_in)
+            if ttl <= 0:
+                return
+        with cls._lock:
+            if len(cls._entries) >= settings.AUTH_CACHE_MAX_ENTRIES:
+                cls._evict()
+            cls._entries[token_key] = (principal, time.monotonic() + ttl)
+            cls._by_user.setdefault(principal.id, set()).add(token_key)
+
+    @classmethod
+    def invalidate_user(cls, user_id: int):
+        with cls._lock:
+            for token_key in cls._by_user.pop(user_id, ()):
+                cls._entries.pop(token_key, None)
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._entries.clear()
+            cls._by_user.clear()
+
+    @classmethod
+    def _discard(cls, token_key: str):
+        entry = cls._entries.pop(token_key, None)
+        if entry is not None:
+            keys = cls._by_user.get(entry[0].id)
+            if keys is not None:
+                keys.discard(token_key)
+                if not keys:
+                    del cls._by_user[entry[0].id]
+
+    @classmethod
+    def _evict(cls):
+        # Drop expired entries; if still full, drop the oldest quarter
+        now = time.monotonic()
+        for token_key in [k for k, (_, exp) in cls._entries.items() if exp <= now]:
+            cls._discard(token_key)
+        if len(cls._entries) >= settings.AUTH_CACHE_MAX_ENTRIES:
+            for token_key in list(cls._entries)[:max(1, len(cls._entries) // 4)]:
+                cls._discard(token_key)
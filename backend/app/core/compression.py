@@ -0,0 +1,113 @@
+# app/core/compression.py - gzip/brotli response compression
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+def _accepts(accept_encoding: str, coding: str) -> bool:
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        if name.strip().lower() == coding:
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+class CompressionMiddleware:
+    """
+    Compress responses of at least `minimum_size` bytes.
+
+    Brotli is preferred when the `brotli` package is installed and the client
+    accepts it; otherwise Starlette's gzip responder is used.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.brotli_quality = brotli_quality
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=gzip_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and BROTLI_AVAILABLE:
+            accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+            if _accepts(accept_encoding, "br"):
+                responder = BrotliResponder(self.app, self.minimum_size, self.brotli_quality)
+                await responder(scope, receive, send)
+                return
+        await self.gzip(scope, receive, send)
+
+class BrotliResponder:
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.quality = quality
+        self.send: Send = None
+        self.initial_message: Message = {}
+        self.started = False
+        self.passthrough = False
+        self.compressor = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_brotli)
+
+    async def send_with_brotli(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # Hold the start message until we know the body size
+            self.initial_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = "content-encoding" in headers
+            return
+
+        if message_type != "http.response.body":
+            await self.send(message)
+            return
+
+        if self.passthrough:
+            if not self.started:
+                self.started = True
+                await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            self.started = True
+            if len(body) < self.minimum_size and not more_body:
+                await self.send(self.initial_message)
+                await self.send(message)
+                self.passthrough = True
+                return
+
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            headers["Content-Encoding"] = "br"
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                # Streaming response: compress chunk by chunk
+                del headers["Content-Length"]
+                self.compressor = brotli.Compressor(quality=self.quality)
+                message["body"] = self.compressor.process(body) + self.compressor.flush()
+            else:
+                message["body"] = brotli.compress(body, quality=self.quality)
+                headers["Content-Length"] = str(len(message["body"]))
+            await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        if more_body:
+            message["body"] = self.compressor.process(body) + self.compressor.flush()
+        else:
+            message["body"] = self.compressor.process(body) + self.compressor.finish()
+        await self.send(message)
@@ -24,12 +24,103 @@ class Settings(BaseSettings):
     SMTP_PORT: Optional[int] = None
     SMTP_USER: Optional[str] = None
     SMTP_PASSWORD: Optional[str] = None
-    SMTP_TLS: bool = True
+    SMTP_TLS: bool = True  # STARTTLS when SMTP_USE_SSL is off
+    SMTP_USE_SSL: bool = True  # implicit TLS (SMTP_SSL)
+    SMTP_TIMEOUT_SECONDS: float = 30.0
+    SMTP_IDLE_TIMEOUT_SECONDS: float = 60.0  # reconnect instead of reusing a connection idle this long
+
+    # Outbound email queue. EMAIL_BACKEND "memory" collects messages instead of sending.
+    EMAIL_BACKEND: str = "smtp"
+    EMAIL_OUTBOX_ENABLED: bool = True
+    EMAIL_OUTBOX_BATCH_SIZE: int = 50
+    EMAIL_OUTBOX_POLL_SECONDS: float = 5.0
+    EMAIL_MAX_ATTEMPTS: int = 6
+    EMAIL_RETRY_BASE_SECONDS: float = 30.0
+    EMAIL_RETRY_MAX_SECONDS: float = 3600.0
 
     # Additional email settings for auth
     EMAIL_FROM_ADDRESS: str = "buildsbybrett@gmail.com"
     EMAIL_FROM_NAME: str = "BSRP Gaming"
 
+    # Password hashing. Hashes in other schemes are upgraded on login.
+    PASSWORD_HASH_SCHEME: str = "bcrypt"
+    BCRYPT_ROUNDS: int = 10
+    SHA256_CRYPT_ROUNDS: int = 535000
+    PASSWORD_HASH_WORKERS: Optional[int] = None  # defaults to the CPU count
+
+    # Authenticated principal cache (per process)
+    AUTH_CACHE_TTL_SECONDS: int = 30
+    AUTH_CACHE_MAX_ENTRIES: int = 10000
+
+    # Rate limiting: "postgres" shares buckets across workers, "memory" is per process
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "postgres"
+    RATE_LIMIT_MEMORY_MAX_ENTRIES: int = 100000
+    RATE_LIMIT_TRUST_FORWARDED: bool = True  # behind the Railway proxy
+    RATE_LIMIT_TRUSTED_HOPS: int = 1  # proxies appending to X-Forwarded-For
+
+    # Logging
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "json"  # "json" or "text"
+    ACCESS_LOG_ENABLED: bool = True
+    ACCESS_LOG_SAMPLE_RATE: float = 0.05
+    ACCESS_LOG_SLOW_MS: float = 1000.0
+
+    # Response compression (brotli is used when the package is installed)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    GZIP_COMPRESSLEVEL: int = 6
+    BROTLI_QUALITY: int = 4
+
+    # HTTP caching for public read endpoints (seconds)
+    PUBLIC_CACHE_MAX_AGE: int = 30
+    PUBLIC_CACHE_STALE_WHILE_REVALIDATE: int = 60
+
+    # Minutes before a TKR tournament starts to email registered teams
+    TOURNAMENT_START_REMINDER_MINUTES: int = 60
+
+    # TKR submissions stay open this long after a team's window ends
+    TKR_SUBMISSION_GRACE_HOURS: int = 24
+    TKR_WINDOW_CLOSE_BATCH_SIZE: int = 500
+    # Upper bound on how long clients may cache /tkr/my-eligibility, so new
+    # registrations show up even when no window boundary is near
+    TKR_ELIGIBILITY_MAX_AGE: int = 60
+    # Non-pending submissions shown on a full (non-incremental) host dashboard load
+    TKR_DASHBOARD_RECENT_SUBMISSIONS: int = 50
+    # How long a moderator holds submissions fetched from the verification queue
+    TKR_VERIFICATION_CLAIM_SECONDS: int = 300
+    TKR_VERIFICATION_MAX_BATCH: int = 100
+    # Submission anomaly scoring
+    TKR_ANOMALY_MIN_SAMPLES: int = 20  # no z-scores before a tournament has this many games
+    TKR_ANOMALY_Z_THRESHOLD: float = 3.0
+    TKR_MAX_KILLS_PER_PLAYER: int = 40
+
+    # Leader election: one process per database runs the background jobs
+    LEADER_ELECTION_LOCK_ID: int = 720315
+    LEADER_HEARTBEAT_SECONDS: float = 10.0
+    LEADER_RETRY_SECONDS: float = 15.0  # how quickly a follower takes over
+
+    # TKR scheduler (runs on the leader); the resync reload catches schedule
+    # edits made outside the API
+    TKR_SCHEDULER_ENABLED: bool = True
+    TKR_SCHEDULER_RESYNC_SECONDS: float = 900.0
+    TKR_SCHEDULER_RETRY_SECONDS: float = 15.0
+
+    # Player ranking prediction; a relative model path is resolved against the backend directory
+    PLAYER_RANKING_MODEL_PATH: str = "models/player_ranking.npy"
+    PLAYER_RANKING_MIN_SAMPLES: int = 20
+    PLAYER_RANKING_RIDGE_ALPHA: float = 1.0
+    PLAYER_RANKING_IMPORT_MAX_ROWS: int = 50000
+
+    # Search: "postgres" queries the pg_trgm indexes, "memory" keeps a per-process
+    # trigram index rebuilt from the database every SEARCH_MEMORY_REFRESH_SECONDS
+    SEARCH_BACKEND: str = "postgres"
+    SEARCH_SIMILARITY_THRESHOLD: float = 0.3
+    SEARCH_MEMORY_REFRESH_SECONDS: float = 60.0
+
+    # Team generator: total players across all lists in one draw
+    TEAM_GENERATOR_MAX_PLAYERS: int = 100000
+
     # Cloudinary settings
     CLOUDINARY_CLOUD_NAME: str
     CLOUDINARY_API_KEY: str
@@ -1,139 +1,108 @@
 # app/core/email.py
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Any, Dict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy.orm import Session
 from app.core.config import settings
+from app.core.email_templates import render_batch, render_email, wrap_in_chrome
+from app.models.email_outbox import EmailOutbox
+from app.services.email_outbox import EmailOutboxWorker
 
 def get_email_template(content: str) -> str:
     """Base template for all emails"""
-    return f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <style>
-            body {{
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-                line-height: 1.6;
-                color: #333;
-                max-width: 600px;
-                margin: 0 auto;
-                padding: 20px;
-            }}
-            .header {{
-                background-color: #2979FF;
-                color: white;
-                padding: 20px;
-                text-align: center;
-                border-radius: 8px 8px 0 0;
-            }}
-            .content {{
-                background-color: #ffffff;
-                padding: 20px;
-                border: 1px solid #e0e0e0;
-                border-radius: 0 0 8px 8px;
-            }}
-            .button {{
-                display: inline-block;
-                padding: 12px 24px;
-                background-color: #2979FF;
-                color: #ffffff !important;  /* Force white text color */
-                text-decoration: none;
-                border-radius: 6px;
-                margin: 20px 0;
-                font-weight: 500;  /* Slightly bolder text */
-            }}
-            /* Ensure link in button is also white */
-            .button:link,
-            .button:visited,
-            .button:hover,
-            .button:active {{
-                color: #ffffff !important;
-                text-decoration: none;
-            }}
-            .footer {{
-                text-align: center;
-                margin-top: 20px;
-                color: #666;
-                font-size: 14px;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h1 style="color: #ffffff; margin: 0;">{settings.PROJECT_NAME}</h1>
-        </div>
-        <div class="content">
-            {content}
-        </div>
-        <div class="footer">
-            <p>© {settings.PROJECT_NAME}. All rights reserved.</p>
-        </div>
-    </body>
-    </html>
-    """
-
-async def send_email(email_to: str, subject: str, html_content: str) -> None:
-    """Send email using configured SMTP server"""
-    try:
-        message = MIMEMultipart("alternative")
-        message["Subject"] = subject
-        message["From"] = f"{settings.EMAIL_FROM_NAME} <{settings.EMAIL_FROM_ADDRESS}>"
-        message["To"] = email_to
+    return wrap_in_chrome(content)
 
-        html_part = MIMEText(get_email_template(html_content), "html")
-        message.attach(html_part)
-
-        print(f"Attempting to connect to {settings.SMTP_HOST}:{settings.SMTP_PORT}")
-        
-        # Use SMTP_SSL instead of SMTP
-        with smtplib.SMTP_SSL(settings.SMTP_HOST, settings.SMTP_PORT) as server:
-            print(f"Attempting login with user: {settings.SMTP_USER}")
-            server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-            server.send_message(message)
-            
-    except Exception as e:
-        print(f"Error sending email: {str(e)}")
-        print(f"SMTP Settings: Host={settings.SMTP_HOST}, Port={settings.SMTP_PORT}, User={settings.SMTP_USER}")
-        raise
+def queue_email(
+    db: Session,
+    email_to: str,
+    subject: str,
+    html_content: Optional[str] = None,
+    text_content: Optional[str] = None,
+    wrap_html: bool = True
+) -> EmailOutbox:
+    """
+    Add an email to the outbox; the outbox worker delivers it.
 
-async def send_verification_email(email_to: str, token: str, username: str) -> None:
-    """Send email verification link"""
-    verify_url = f"{settings.FRONTEND_URL}/verify-email/{token}"
-    
-    subject = f"{settings.PROJECT_NAME} - Verify Your Email"
-    
-    content = f"""
-        <h2>Welcome, {username}!</h2>
-        <p>Thanks for registering with {settings.PROJECT_NAME}! Please verify your email address to get started.</p>
-        <p><a href="{verify_url}" class="button">Verify Email Address</a></p>
-        <p>If the button above doesn't work, you can copy and paste this URL into your browser:</p>
-        <p style="word-break: break-all; color: #666;">{verify_url}</p>
-        <p>This link will expire in 48 hours.</p>
-        <p>If you didn't register for an account, you can safely ignore this email.</p>
-        <br>
-        <p>Best regards,<br>The {settings.PROJECT_NAME} Team</p>
+    Request handlers only pay for one INSERT. `html_content` is wrapped in
+    the base template unless wrap_html is False.
     """
-    
-    await send_email(email_to=email_to, subject=subject, html_content=content)
+    if html_content is not None and wrap_html:
+        html_content = get_email_template(html_content)
+    email = EmailOutbox(
+        to_address=email_to,
+        subject=subject,
+        html_body=html_content,
+        text_body=text_content
+    )
+    db.add(email)
+    db.commit()
+    EmailOutboxWorker.wake()
+    return email
 
-async def send_password_reset_email(email_to: str, token: str, username: str) -> None:
-    """Send password reset email"""
-    reset_url = f"{settings.FRONTEND_URL}/reset-password/{token}"
-    subject = f"{settings.PROJECT_NAME} - Password Reset"
-    
-    content = f"""
-        <h2>Hello {username},</h2>
-        <p>We received a request to reset your password. Click the button below to choose a new password:</p>
-        <p><a href="{reset_url}" class="button">Reset Password</a></p>
-        <p>If the button above doesn't work, you can copy and paste this URL into your browser:</p>
-        <p style="word-break: break-all; color: #666;">{reset_url}</p>
-        <p>This link will expire in 24 hours.</p>
-        <p>If you didn't request a password reset, you can safely ignore this email.</p>
-        <br>
-        <p>Best regards,<br>The {settings.PROJECT_NAME} Team</p>
+def queue_rendered_batch(
+    db: Session,
+    template_name: str,
+    recipients: List[Dict],
+    commit: bool = True,
+    **shared
+) -> int:
     """
+    Render `template_name` for every recipient and add them to the outbox in
+    one bulk INSERT. Each recipient dict needs an "email" key plus its own
+    template values; `shared` values apply to all of them.
+    """
+    if not recipients:
+        return 0
+    rendered = render_batch(template_name, recipients, **shared)
+    now = datetime.utcnow()
+    db.bulk_insert_mappings(EmailOutbox, [
+        {
+            "to_address": recipient["email"],
+            "subject": subject,
+            "html_body": html,
+            "next_attempt_at": now,
+            "created_at": now
+        }
+        for recipient, (subject, html) in zip(recipients, rendered)
+    ])
+    if commit:
+        db.commit()
+        EmailOutboxWorker.wake()
+    return len(recipients)
+
+def send_verification_email(db: Session, email_to: str, token: str, username: str) -> EmailOutbox:
+    """Queue the email verification link"""
+    subject, html = render_email(
+        "verify_email",
+        username=username,
+        verify_url=f"{settings.FRONTEND_URL}/verify-email/{token}"
+    )
+    return queue_email(db, email_to=email_to, subject=subject, html_content=html, wrap_html=False)
+
+def send_password_reset_email(db: Session, email_to: str, token: str, username: str) -> EmailOutbox:
+    """Queue the password reset email"""
+    subject, html = render_email(
+        "password_reset",
+        username=username,
+        reset_url=f"{settings.FRONTEND_URL}/reset-password/{token}"
+    )
+    return queue_email(db, email_to=email_to, subject=subject, html_content=html, wrap_html=False)
 
-    await send_email(email_to=email_to, subject=subject, html_content=content)
\ No newline at end of file
+def queue_tournament_starting_soon(
+    db: Session,
+    tournament,
+    recipients: Iterable[Dict],
+    starts_at: datetime,
+    commit: bool = True
+) -> int:
+    """Queue the "starts soon" notice for every recipient of one tournament"""
+    minutes = max(0, int((starts_at - datetime.utcnow()).total_seconds() // 60))
+    return queue_rendered_batch(
+        db,
+        "tournament_starting_soon",
+        list(recipients),
+        commit=commit,
+        tournament_name=tournament.name,
+        tournament_url=f"{settings.FRONTEND_URL}/tournaments/{tournament.id}",
+        starts_at=starts_at.strftime("%Y-%m-%d %H:%M"),
+        minutes_until_start=minutes
+    )
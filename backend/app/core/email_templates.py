@@ -0,0 +1,100 @@
+# app/core/email_templates.py - Compiled email templates
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Tuple
+
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, Template, select_autoescape
+
+from app.core.config import settings
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
+
+# Marks where per-message content goes when the base template is pre-rendered
+_CONTENT_MARKER = "%%EMAIL_CONTENT%%"
+
+class EmailTemplate(NamedTuple):
+    subject: str  # Jinja expression source, e.g. "{{ project_name }} - Verify Your Email"
+    body: str  # file in TEMPLATE_DIR rendered inside base.html
+
+EMAIL_TEMPLATES: Dict[str, EmailTemplate] = {
+    "verify_email": EmailTemplate(
+        subject="{{ project_name }} - Verify Your Email",
+        body="verify_email.html"
+    ),
+    "password_reset": EmailTemplate(
+        subject="{{ project_name }} - Password Reset",
+        body="password_reset.html"
+    ),
+    "tournament_starting_soon": EmailTemplate(
+        subject="{{ tournament_name }} starts in {{ minutes_until_start }} minutes",
+        body="tournament_starting_soon.html"
+    ),
+}
+
+_env = Environment(
+    loader=FileSystemLoader(str(TEMPLATE_DIR)),
+    autoescape=select_autoescape(["html"]),
+    undefined=StrictUndefined,
+    auto_reload=False,
+    trim_blocks=True,
+    lstrip_blocks=True
+)
+# Subjects are plain text headers, never HTML-escaped
+_subject_env = Environment(autoescape=False, undefined=StrictUndefined)
+
+@lru_cache(maxsize=None)
+def _compiled(name: str) -> Tuple[Template, Template]:
+    """Compile a registered template's subject and body once per process"""
+    try:
+        template = EMAIL_TEMPLATES[name]
+    except KeyError:
+        raise ValueError(f"Unknown email template: {name}")
+    return _subject_env.from_string(template.subject), _env.get_template(template.body)
+
+@lru_cache(maxsize=1)
+def _chrome() -> Tuple[str, str]:
+    """The static HTML before and after the content, rendered once"""
+    document = _env.get_template("base.html").render(
+        project_name=settings.PROJECT_NAME,
+        content=_CONTENT_MARKER
+    )
+    prefix, suffix = document.split(_CONTENT_MARKER, 1)
+    return prefix, suffix
+
+def wrap_in_chrome(content_html: str) -> str:
+    """Place already-rendered HTML content inside the base email layout"""
+    prefix, suffix = _chrome()
+    return prefix + content_html + suffix
+
+def _base_context() -> Dict[str, Any]:
+    return {"project_name": settings.PROJECT_NAME, "frontend_url": settings.FRONTEND_URL}
+
+def render_email(name: str, **context: Any) -> Tuple[str, str]:
+    """Render a registered template to (subject, full HTML document)"""
+    subject_template, body_template = _compiled(name)
+    context = {**_base_context(), **context}
+    return subject_template.render(context), wrap_in_chrome(body_template.render(context))
+
+def render_batch(
+    name: str,
+    recipients: Iterable[Dict[str, Any]],
+    **shared: Any
+) -> List[Tuple[str, str]]:
+    """
+    Render one template for many recipients.
+
+    `shared` is merged into the context once; each recipient dict supplies
+    only its per-message values. The template is compiled and the chrome
+    rendered once for the whole batch.
+    """
+    subject_template, body_template = _compiled(name)
+    prefix, suffix = _chrome()
+    base = {**_base_context(), **shared}
+    rendered = []
+    for recipient in recipients:
+        context = {**base, **recipient}
+        rendered.append((
+            subject_template.render(context),
+            prefix + body_template.render(context) + suffix
+        ))
+    return rendered
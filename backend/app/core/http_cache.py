@@ -0,0 +1,122 @@
+# app/core/http_cache.py - Conditional GET support for public read endpoints
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+from app.core.config import settings
+from app.core.responses import ValidatedJSONResponse, get_type_adapter
+
+def version_etag(*parts: Any) -> str:
+    """Weak ETag derived from version counters such as (max(updated_at), row count)"""
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    return 'W/"%s"' % hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()
+
+def content_etag(body: bytes) -> str:
+    """Strong ETag for a serialized body when the rows carry no version columns"""
+    return '"%s"' % hashlib.blake2b(body, digest_size=12).hexdigest()
+
+def _as_utc(value: datetime) -> datetime:
+    # Model timestamps are written with datetime.utcnow(), so naive means UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+def cache_headers(
+    etag: Optional[str] = None,
+    last_modified: Optional[datetime] = None,
+    max_age: Optional[int] = None
+) -> Dict[str, str]:
+    if max_age is None:
+        max_age = settings.PUBLIC_CACHE_MAX_AGE
+    headers = {
+        "Cache-Control": (
+            f"public, max-age={max_age}, "
+            f"stale-while-revalidate={settings.PUBLIC_CACHE_STALE_WHILE_REVALIDATE}"
+        )
+    }
+    if etag:
+        headers["ETag"] = etag
+    if last_modified:
+        # HTTP dates have one-second resolution
+        headers["Last-Modified"] = format_datetime(
+            _as_utc(last_modified).replace(microsecond=0), usegmt=True
+        )
+    return headers
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison
+    wanted = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == wanted:
+            return True
+    return False
+
+def is_not_modified(
+    request: Request,
+    etag: Optional[str] = None,
+    last_modified: Optional[datetime] = None
+) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against the current validators"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence over If-Modified-Since (RFC 9110 13.2.2)
+        return etag is not None and _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return _as_utc(last_modified).replace(microsecond=0) <= since
+    return False
+
+def not_modified_response(
+    request: Request,
+    etag: Optional[str] = None,
+    last_modified: Optional[datetime] = None,
+    max_age: Optional[int] = None
+) -> Optional[Response]:
+    """
+    Return a 304 when the client's copy is current, otherwise None.
+
+    Routes with version counters call this before loading and serializing
+    the payload, so a revalidation costs a single aggregate query.
+    """
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=cache_headers(etag, last_modified, max_age))
+    return None
+
+def cached_json(
+    request: Request,
+    schema: Any,
+    data: Any,
+    etag: Optional[str] = None,
+    last_modified: Optional[datetime] = None,
+    max_age: Optional[int] = None
+) -> Response:
+    """
+    Serialize `data` against `schema` with Cache-Control/ETag/Last-Modified.
+
+    Without an explicit `etag` one is derived from the serialized body,
+    which still saves clients the transfer when nothing changed.
+    """
+    adapter = get_type_adapter(schema)
+    body = adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+    if etag is None:
+        etag = content_etag(body)
+
+    not_modified = not_modified_response(request, etag, last_modified, max_age)
+    if not_modified is not None:
+        return not_modified
+    return ValidatedJSONResponse(content=body, headers=cache_headers(etag, last_modified, max_age))
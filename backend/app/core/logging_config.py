@@ -0,0 +1,124 @@
+# app/core/logging_config.py - Non-blocking logging and sampled access logs
+import atexit
+import json
+import logging
+import queue
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+access_logger = logging.getLogger("app.access")
+
+_listener: Optional[QueueListener] = None
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line; structured fields come from `extra={"fields": {...}}`"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry.update(fields)
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+def configure_logging() -> None:
+    """
+    Route all records through a QueueHandler so request threads never block
+    on stream I/O; a single QueueListener thread does the formatting and writing.
+    Safe to call more than once.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    if settings.LOG_FORMAT == "json":
+        stream_handler.setFormatter(JSONFormatter())
+    else:
+        stream_handler.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+        )
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(settings.LOG_LEVEL.upper())
+
+    # uvicorn's own access logger writes every request synchronously;
+    # AccessLogMiddleware replaces it with a sampled log
+    if settings.ACCESS_LOG_ENABLED:
+        logging.getLogger("uvicorn.access").disabled = True
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+class AccessLogMiddleware:
+    """
+    Structured access log for a sample of requests.
+
+    Every request slower than `slow_ms` or answered with a 5xx is logged;
+    the rest are logged with probability `sample_rate`.
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: float = 0.05, slow_ms: float = 1000.0) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not access_logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            if (
+                status_code >= 500
+                or duration_ms >= self.slow_ms
+                or random.random() < self.sample_rate
+            ):
+                access_logger.info(
+                    "%s %s %s",
+                    scope["method"], scope["path"], status_code,
+                    extra={"fields": {
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status": status_code,
+                        "duration_ms": round(duration_ms, 2),
+                        "client": scope["client"][0] if scope.get("client") else None,
+                        "sampled": self.sample_rate,
+                    }}
+                )
@@ -0,0 +1,135 @@
+# app/core/rate_limit.py - Token bucket rate limiting over pluggable stores
+import hashlib
+import random
+import threading
+import time
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from sqlalchemy import text
+
+from app.core.config import settings
+
+class RateLimitResult(NamedTuple):
+    allowed: bool
+    remaining: float
+    retry_after: float  # seconds until `cost` tokens are available again
+
+class MemoryRateLimitStore:
+    """
+    Process-local buckets. Buckets that have refilled completely are
+    indistinguishable from absent ones, so they are evicted.
+    """
+
+    def __init__(self, max_entries: int = 100000):
+        self.max_entries = max_entries
+        self._buckets: Dict[str, Tuple[float, float, float]] = {}  # key -> (tokens, updated, full_at)
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, capacity: float, rate: float, cost: float = 1) -> RateLimitResult:
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                available = capacity
+            else:
+                tokens, updated, _ = bucket
+                available = min(capacity, tokens + (now - updated) * rate)
+
+            allowed = available >= cost
+            tokens = available - cost if allowed else available
+            if len(self._buckets) >= self.max_entries and key not in self._buckets:
+                self._evict(now)
+            self._buckets[key] = (tokens, now, now + (capacity - tokens) / rate)
+
+        retry_after = 0.0 if allowed else (cost - tokens) / rate
+        return RateLimitResult(allowed, tokens, retry_after)
+
+    def _evict(self, now: float):
+        for key in [k for k, (_, _, full_at) in self._buckets.items() if full_at <= now]:
+            del self._buckets[key]
+        if len(self._buckets) >= self.max_entries:
+            # Still full of live buckets: drop the ones closest to refilled
+            by_full_at = sorted(self._buckets.items(), key=lambda item: item[1][2])
+            for key, _ in by_full_at[:max(1, len(by_full_at) // 10)]:
+                del self._buckets[key]
+
+# Tokens after refilling since the last hit, capped at capacity
+_AVAILABLE = (
+    "LEAST(:capacity, b.tokens + "
+    "EXTRACT(EPOCH FROM clock_timestamp() - b.updated_at) * :rate)"
+)
+
+_HIT_SQL = text(f"""
+    INSERT INTO rate_limit_buckets AS b (key, tokens, allowed, updated_at, expires_at)
+    VALUES (
+        :key, :capacity - :cost, true, clock_timestamp(),
+        clock_timestamp() + make_interval(secs => :cost / :rate)
+    )
+    ON CONFLICT (key) DO UPDATE SET
+        tokens = CASE WHEN {_AVAILABLE} >= :cost
+                      THEN {_AVAILABLE} - :cost ELSE {_AVAILABLE} END,
+        allowed = {_AVAILABLE} >= :cost,
+        updated_at = clock_timestamp(),
+        expires_at = clock_timestamp() + make_interval(secs =>
+            (:capacity - CASE WHEN {_AVAILABLE} >= :cost
+                              THEN {_AVAILABLE} - :cost ELSE {_AVAILABLE} END) / :rate)
+    RETURNING tokens, allowed
+""")
+
+_PURGE_SQL = text("DELETE FROM rate_limit_buckets WHERE expires_at < clock_timestamp()")
+
+class PostgresRateLimitStore:
+    """
+    Buckets in the rate_limit_buckets table, shared by every worker and kept
+    across restarts. Each hit is a single atomic upsert; the row lock taken by
+    ON CONFLICT serializes concurrent hits on the same key.
+    """
+
+    def __init__(self, engine, purge_probability: float = 0.01):
+        self.engine = engine
+        self.purge_probability = purge_probability
+
+    def hit(self, key: str, capacity: float, rate: float, cost: float = 1) -> RateLimitResult:
+        params = {"key": key, "capacity": float(capacity), "rate": float(rate), "cost": float(cost)}
+        with self.engine.begin() as conn:
+            tokens, allowed = conn.execute(_HIT_SQL, params).one()
+            if random.random() < self.purge_probability:
+                conn.execute(_PURGE_SQL)
+
+        retry_after = 0.0 if allowed else (cost - tokens) / rate
+        return RateLimitResult(allowed, tokens, retry_after)
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_rate_limit_store():
+    """The store selected by RATE_LIMIT_BACKEND, created on first use"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                if settings.RATE_LIMIT_BACKEND == "postgres":
+                    from app.db.database import engine
+                    _store = PostgresRateLimitStore(engine)
+                else:
+                    _store = MemoryRateLimitStore(settings.RATE_LIMIT_MEMORY_MAX_ENTRIES)
+    return _store
+
+def hit(scope: str, identity: str, times: int, seconds: float, cost: float = 1,
+        store=None) -> RateLimitResult:
+    """Spend `cost` tokens from the `times`-per-`seconds` bucket for (scope, identity)"""
+    store = store or get_rate_limit_store()
+    # Identities come from request fields of any length; hashing keeps keys within varchar(255)
+    digest = hashlib.blake2b(identity.encode(), digest_size=16).hexdigest()
+    return store.hit(f"{scope}:{digest}", capacity=times, rate=times / seconds, cost=cost)
+
+def client_ip(headers, client: Optional[Tuple[str, int]]) -> str:
+    if settings.RATE_LIMIT_TRUST_FORWARDED:
+        forwarded = headers.get("x-forwarded-for")
+        if forwarded:
+            # Clients can prepend anything; only the entries our proxies appended
+            # (the rightmost RATE_LIMIT_TRUSTED_HOPS) are trustworthy
+            hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+            if hops:
+                return hops[-max(1, min(settings.RATE_LIMIT_TRUSTED_HOPS, len(hops)))]
+    return client[0] if client else "unknown"
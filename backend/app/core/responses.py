@@ -0,0 +1,31 @@
+# app/core/responses.py - JSON response helpers
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+
+__all__ = ["ORJSONResponse", "ValidatedJSONResponse", "validated_json"]
+
+@lru_cache(maxsize=None)
+def get_type_adapter(schema: Any) -> TypeAdapter:
+    """Build (once per schema) the TypeAdapter used to validate and dump payloads"""
+    return TypeAdapter(schema)
+
+class ValidatedJSONResponse(Response):
+    """Response whose body is already-serialized JSON bytes"""
+    media_type = "application/json"
+
+def validated_json(schema: Any, data: Any, status_code: int = 200) -> Response:
+    """
+    Validate `data` against `schema` once and serialize it straight to bytes.
+
+    Returning a Response from a route makes FastAPI skip its own response_model
+    pass (validate, jsonable_encoder, json.dumps), so routes that assemble large
+    payloads by hand pay for validation exactly once. Keep response_model on the
+    route decorator so the OpenAPI schema stays accurate.
+    """
+    adapter = get_type_adapter(schema)
+    validated = adapter.validate_python(data, from_attributes=True)
+    return ValidatedJSONResponse(content=adapter.dump_json(validated), status_code=status_code)
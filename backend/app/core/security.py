@@ -1,11 +1,30 @@
 # app/core/security.py
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Union, Optional, Literal
+from typing import Any, Union, Optional, Literal, Tuple
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["sha256_crypt"], deprecated="auto")
+# PASSWORD_HASH_SCHEME signs new hashes; every other scheme is only accepted
+# for verification and is flagged for rehash, so existing sha256_crypt hashes
+# are upgraded the next time their owner logs in.
+pwd_context = CryptContext(
+    schemes=["bcrypt", "sha256_crypt"],
+    default=settings.PASSWORD_HASH_SCHEME,
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+    sha256_crypt__rounds=settings.SHA256_CRYPT_ROUNDS
+)
+
+# Hashing is CPU-bound and releases the GIL; a dedicated, bounded pool keeps
+# login bursts from occupying the threads every sync endpoint runs on.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1,
+    thread_name_prefix="password-hash"
+)
 
 TokenType = Literal["access", "password_reset", "email_verification", "profile_update"]
 
@@ -31,16 +50,23 @@ def create_token(subject: Union[str, Any], token_type: TokenType, expires_delta:
     }
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
-def verify_token(token: str, token_type: TokenType) -> Optional[int]:
-    """Generic token verification for both password reset and email verification"""
+def decode_token(token: str, token_type: TokenType) -> Optional[dict]:
+    """Decode and check a token's signature, expiry and type; returns its claims"""
     try:
         decoded_jwt = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         if decoded_jwt["type"] != token_type:
             return None
-        return int(decoded_jwt["sub"])
+        return decoded_jwt
     except JWTError:
         return None
 
+def verify_token(token: str, token_type: TokenType) -> Optional[int]:
+    """Generic token verification for both password reset and email verification"""
+    decoded_jwt = decode_token(token, token_type)
+    if decoded_jwt is None:
+        return None
+    return int(decoded_jwt["sub"])
+
 # Specific token functions
 def create_access_token(user_id: int) -> str:
     return create_token(user_id, "access")
@@ -59,15 +85,24 @@ def verify_email_verification_token(token: str) -> Optional[int]:
 
 # Existing password functions
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    result = pwd_context.verify(plain_password, hashed_password)
-    if not result:
-        # Try hashing the plain password to compare formats
-        test_hash = pwd_context.hash(plain_password)
-    return result
+    return pwd_context.verify(plain_password, hashed_password)
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Verify a password; also returns a replacement hash when the stored one is outdated"""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
-    result = pwd_context.hash(password)
-    return result
+    return pwd_context.hash(password)
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _hash_executor, verify_and_update_password, plain_password, hashed_password
+    )
+
+async def get_password_hash_async(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, get_password_hash, password)
 
 def create_profile_update_token(user_id: int) -> str:
     """Create token for profile updates with 15-minute expiration"""
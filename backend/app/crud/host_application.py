@@ -4,6 +4,7 @@ from typing import List, Optional
 from app.models.host_application import HostApplication, ApplicationStatus
 from app.models.user import User, UserRole
 from app.schemas.host_application import HostApplicationCreate, HostApplicationUpdate
+from app.core.auth_cache import PrincipalCache
 
 def create_application(db: Session, application: HostApplicationCreate, user_id: int) -> HostApplication:
     db_application = HostApplication(
@@ -47,6 +48,8 @@ def update_application_status(
     
     db.commit()
     db.refresh(application)
+    if status == ApplicationStatus.APPROVED:
+        PrincipalCache.invalidate_user(application.user_id)
     return application
 
 def check_pending_application(db: Session, user_id: int) -> bool:
@@ -27,6 +27,10 @@ class DailyHostStatsCache:
             return cls._data
         return None
 
+    @classmethod
+    def last_updated(cls) -> Optional[datetime]:
+        return cls._last_updated
+
     @classmethod
     def set_cached_data(cls, data: List[Dict]):
         cls._data = data
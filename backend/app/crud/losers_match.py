@@ -8,7 +8,6 @@ from sqlalchemy import func
 import logging
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
 
 def get_match(db: Session, match_id: int):
     logger.debug(f"Looking up losers match with ID: {match_id}")
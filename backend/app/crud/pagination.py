@@ -0,0 +1,109 @@
+# app/crud/pagination.py - Keyset (cursor) pagination helpers
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException, Response
+from sqlalchemy import and_, or_, tuple_
+from sqlalchemy.orm import Query
+
+# Response header carrying the cursor for the next page. Offset pagination keeps
+# returning plain lists, so the cursor travels out-of-band.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    """Encode the (sort_key, id) of the last row of a page as an opaque cursor"""
+    if isinstance(sort_value, datetime):
+        payload = {"v": sort_value.isoformat(), "t": "dt", "id": row_id}
+    else:
+        payload = {"v": sort_value, "id": row_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[Any, int]:
+    """Decode a cursor produced by encode_cursor, raising 400 on tampering"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        sort_value = payload["v"]
+        if payload.get("t") == "dt" and sort_value is not None:
+            sort_value = datetime.fromisoformat(sort_value)
+        return sort_value, int(payload["id"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+def order_for_keyset(query: Query, sort_column, id_column, descending: bool = False) -> Query:
+    """Apply the stable (sort_key, id) ordering that keyset pagination relies on"""
+    if descending:
+        return query.order_by(sort_column.desc(), id_column.desc())
+    return query.order_by(sort_column.asc(), id_column.asc())
+
+def apply_keyset(
+    query: Query,
+    sort_column,
+    id_column,
+    cursor: str,
+    descending: bool = False
+) -> Query:
+    """
+    Restrict `query` to rows strictly after the cursor position.
+
+    Uses a row-value comparison so Postgres can walk a composite
+    (sort_key, id) index. NULL sort keys follow Postgres' default placement
+    (last when ascending, first when descending).
+    """
+    sort_value, last_id = decode_cursor(cursor)
+
+    if descending:
+        if sort_value is None:
+            return query.filter(or_(
+                and_(sort_column.is_(None), id_column < last_id),
+                sort_column.isnot(None)
+            ))
+        return query.filter(tuple_(sort_column, id_column) < tuple_(sort_value, last_id))
+
+    if sort_value is None:
+        return query.filter(sort_column.is_(None), id_column > last_id)
+    return query.filter(or_(
+        tuple_(sort_column, id_column) > tuple_(sort_value, last_id),
+        sort_column.is_(None)
+    ))
+
+def paginate(
+    query: Query,
+    sort_column,
+    id_column,
+    skip: int = 0,
+    limit: Optional[int] = 100,
+    cursor: Optional[str] = None,
+    descending: bool = False
+) -> Query:
+    """
+    Order `query` by (sort_key, id) and page it.
+
+    A cursor takes precedence over `skip`; OFFSET is kept for existing clients.
+    Passing limit=None returns every remaining row.
+    """
+    query = order_for_keyset(query, sort_column, id_column, descending)
+    if cursor:
+        query = apply_keyset(query, sort_column, id_column, cursor, descending)
+    elif skip:
+        query = query.offset(skip)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+def set_next_cursor(
+    response: Response,
+    items: List[Any],
+    limit: Optional[int],
+    sort_attr: str
+) -> Optional[str]:
+    """Expose the cursor for the page after `items` when the page is full"""
+    if not items or limit is None or len(items) < limit:
+        return None
+    last = items[-1]
+    cursor = encode_cursor(getattr(last, sort_attr), last.id)
+    response.headers[NEXT_CURSOR_HEADER] = cursor
+    return cursor
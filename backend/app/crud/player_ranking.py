@@ -1,13 +1,19 @@
 # app/crud/player_ranking.py
 from sqlalchemy.orm import Session
-from app.models.player_ranking import PlayerRanking
+from sqlalchemy import Column, Integer, MetaData, String, Table, func, text
+from typing import Dict, List, Optional, Tuple
+from app.models.player_ranking import PlayerRanking, PlayerRankingSubmission
+from app.crud.pagination import paginate
 from app.schemas.player_ranking import PlayerRankingCreate, PlayerRankingUpdate
 
 def get_player_ranking(db: Session, ranking_id: int):
     return db.query(PlayerRanking).filter(PlayerRanking.id == ranking_id).first()
 
-def get_player_rankings(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(PlayerRanking).order_by(PlayerRanking.rank).offset(skip).limit(limit).all()
+def get_player_rankings(db: Session, skip: int = 0, limit: int = 100, cursor: Optional[str] = None):
+    return paginate(
+        db.query(PlayerRanking), PlayerRanking.rank, PlayerRanking.id,
+        skip=skip, limit=limit, cursor=cursor
+    ).all()
 
 def create_player_ranking(db: Session, ranking: PlayerRankingCreate):
     db_ranking = PlayerRanking(**ranking.model_dump())
@@ -31,4 +37,169 @@ def delete_player_ranking(db: Session, ranking_id: int):
     if db_ranking:
         db.delete(db_ranking)
         db.commit()
-    return db_ranking
\ No newline at end of file
+    return db_ranking
+
+# Submissions and model training data
+def create_ranking_submission(db: Session, form: Dict, predicted_rank: Optional[int]) -> PlayerRankingSubmission:
+    submission = PlayerRankingSubmission(**form, predicted_rank=predicted_rank)
+    db.add(submission)
+    db.commit()
+    return submission
+
+def latest_submissions(db: Session):
+    """Each handle's most recent submission, as a subquery (handles compare case-insensitively)"""
+    return db.query(PlayerRankingSubmission).distinct(
+        func.lower(PlayerRankingSubmission.twitter_handle)
+    ).order_by(
+        func.lower(PlayerRankingSubmission.twitter_handle),
+        PlayerRankingSubmission.submitted_at.desc()
+    ).subquery()
+
+def submission_features(row) -> Dict:
+    return {
+        "previous_ranking": row.previous_ranking,
+        "kd_ratio": row.kd_ratio,
+        "total_kills": row.total_kills,
+        "total_time_played": row.total_time_played,
+        "wins": row.wins,
+        "score_per_min": row.score_per_min,
+    }
+
+def get_training_data(db: Session) -> Tuple[List[Dict], List[int]]:
+    """Latest stats of every ranked player paired with their current ladder rank"""
+    latest = latest_submissions(db)
+    rows = db.query(latest, PlayerRanking.rank).join(
+        PlayerRanking, func.lower(PlayerRanking.twitter_handle) == func.lower(latest.c.twitter_handle)
+    ).filter(PlayerRanking.rank.isnot(None), PlayerRanking.rank > 0).all()
+    return [submission_features(row) for row in rows], [row.rank for row in rows]
+
+def get_ladder_with_stats(db: Session) -> List[Tuple[PlayerRanking, Optional[Dict]]]:
+    """Every ladder entry with its player's latest submitted stats (None if never submitted)"""
+    latest = latest_submissions(db)
+    rows = db.query(PlayerRanking, latest).outerjoin(
+        latest, func.lower(latest.c.twitter_handle) == func.lower(PlayerRanking.twitter_handle)
+    ).order_by(PlayerRanking.rank, PlayerRanking.id).all()
+    return [
+        (row[0], submission_features(row) if row.kd_ratio is not None else None)
+        for row in rows
+    ]
+
+def apply_ladder_ranks(db: Session, ranks: Dict[int, int]) -> None:
+    """Write {ranking_id: rank} in one executemany"""
+    if ranks:
+        db.bulk_update_mappings(PlayerRanking, [
+            {"id": ranking_id, "rank": rank} for ranking_id, rank in ranks.items()
+        ])
+        db.commit()
+
+def get_ranks_by_name(db: Session, names: List[str], chunk_size: int = 5000) -> Dict[str, int]:
+    """
+    Ladder rank for each name that matches a ranked player's name or twitter
+    handle (case-insensitive), keyed by the lower-cased name
+    """
+    keys = list({name.strip().lower() for name in names if name.strip()})
+    ranks: Dict[str, int] = {}
+    for start in range(0, len(keys), chunk_size):
+        chunk = keys[start:start + chunk_size]
+        rows = db.query(
+            func.lower(PlayerRanking.player_name), func.lower(PlayerRanking.twitter_handle), PlayerRanking.rank
+        ).filter(
+            PlayerRanking.rank.isnot(None),
+            func.lower(PlayerRanking.player_name).in_(chunk) | func.lower(PlayerRanking.twitter_handle).in_(chunk)
+        )
+        chunk_keys = set(chunk)
+        for name, handle, rank in rows:
+            for key in (name, handle):
+                if key in chunk_keys and rank < ranks.get(key, rank + 1):
+                    ranks[key] = rank
+    return ranks
+
+# Bulk import
+# Per-transaction staging table for imports; dropped at commit or rollback
+IMPORT_TABLE = Table(
+    "player_ranking_import", MetaData(),
+    Column("player_name", String, nullable=False),
+    Column("twitter_handle", String, nullable=False),
+    Column("handle_key", String, nullable=False),
+    Column("rank", Integer, nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP"
+)
+
+def import_player_rankings(db: Session, rows: List[Dict], replace: bool = False, commit: bool = True) -> Dict:
+    """
+    Upsert ladder entries by twitter handle (case-insensitive) and renumber
+    the whole ladder 1..n, all in one transaction.
+
+    Rows are staged in a temp table, then applied with a handful of
+    set-based statements. The renumbering is a single UPDATE driven by
+    row_number() ordered by (rank, imported first, id), so an imported
+    player takes the position they were given and the rest shift around
+    them. With replace=True, entries missing from the import are deleted.
+    The ladder is locked against concurrent writes for the duration.
+    """
+    # Last row wins when a handle appears twice
+    staged = {}
+    for row in rows:
+        handle_key = row["twitter_handle"].strip().lower()
+        staged[handle_key] = {
+            "player_name": row["player_name"].strip(),
+            "twitter_handle": row["twitter_handle"].strip(),
+            "handle_key": handle_key,
+            "rank": row["rank"],
+        }
+
+    connection = db.connection()
+    connection.execute(text("LOCK TABLE player_rankings IN SHARE ROW EXCLUSIVE MODE"))
+    # An earlier import in the same uncommitted transaction leaves its table behind
+    connection.execute(text("DROP TABLE IF EXISTS pg_temp.player_ranking_import"))
+    IMPORT_TABLE.create(connection)
+    if staged:
+        connection.execute(IMPORT_TABLE.insert(), list(staged.values()))
+    connection.execute(text("ANALYZE player_ranking_import"))
+
+    updated = connection.execute(text("""
+        UPDATE player_rankings p
+        SET player_name = i.player_name, twitter_handle = i.twitter_handle, rank = i.rank
+        FROM player_ranking_import i
+        WHERE lower(p.twitter_handle) = i.handle_key
+    """)).rowcount
+    created = connection.execute(text("""
+        INSERT INTO player_rankings (player_name, twitter_handle, rank)
+        SELECT i.player_name, i.twitter_handle, i.rank
+        FROM player_ranking_import i
+        WHERE NOT EXISTS (
+            SELECT 1 FROM player_rankings p WHERE lower(p.twitter_handle) = i.handle_key
+        )
+    """)).rowcount
+    removed = 0
+    if replace:
+        removed = connection.execute(text("""
+            DELETE FROM player_rankings p
+            WHERE NOT EXISTS (
+                SELECT 1 FROM player_ranking_import i WHERE i.handle_key = lower(p.twitter_handle)
+            )
+        """)).rowcount
+    # Only rows whose position actually changes are written
+    connection.execute(text("""
+        UPDATE player_rankings p SET rank = ordered.new_rank
+        FROM (
+            SELECT r.id, row_number() OVER (
+                ORDER BY r.rank NULLS LAST, i.handle_key IS NULL, r.id
+            ) AS new_rank
+            FROM player_rankings r
+            LEFT JOIN player_ranking_import i ON i.handle_key = lower(r.twitter_handle)
+        ) ordered
+        WHERE p.id = ordered.id AND p.rank IS DISTINCT FROM ordered.new_rank
+    """))
+    ladder_size = connection.execute(text("SELECT count(*) FROM player_rankings")).scalar()
+
+    if commit:
+        db.commit()
+    return {
+        "received": len(rows),
+        "created": created,
+        "updated": updated,
+        "removed": removed,
+        "ladder_size": ladder_size,
+    }
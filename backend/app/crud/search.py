@@ -0,0 +1,150 @@
+# app/crud/search.py - Trigram/prefix name search over players, teams, tournaments and hosts
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models.host_profile import HostProfile
+from app.models.player_ranking import PlayerRanking
+from app.models.team import Team
+from app.models.tournament import Tournament
+from app.models.user import User, UserRole
+
+SEARCH_KINDS = ("players", "teams", "tournaments", "hosts")
+
+# Shorter queries have no trigrams of their own, so they only prefix-match
+FUZZY_MIN_LENGTH = 3
+
+# Ranking shared by both backends: trigram similarity (0..1) plus a bonus
+# when the whole name, or a later word of it, starts with the query
+PREFIX_BONUS = 1.0
+WORD_PREFIX_BONUS = 0.5
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+def like_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def _score(key: str) -> str:
+    return (
+        f"(similarity({key}, :q) + CASE WHEN {key} LIKE :prefix THEN {PREFIX_BONUS} "
+        f"WHEN {key} LIKE :word_prefix THEN {WORD_PREFIX_BONUS} ELSE 0 END)"
+    )
+
+def _match(key: str, fuzzy: bool) -> str:
+    """Each branch is served by one of the search_indexes on `key`"""
+    if not fuzzy:
+        return f"{key} LIKE :prefix"
+    return f"({key} LIKE :prefix OR {key} LIKE :word_prefix OR {key} % :q)"
+
+def _kind_sql(kind: str, fuzzy: bool) -> str:
+    if kind == "players":
+        key = "lower(p.player_name)"
+        return f"""
+            SELECT 'players' AS kind, p.id, p.player_name AS label, p.twitter_handle AS detail,
+                   {_score(key)} AS score
+            FROM player_rankings p
+            WHERE {_match(key, fuzzy)}
+        """
+    if kind == "teams":
+        key = "lower(t.name)"
+        return f"""
+            SELECT 'teams' AS kind, t.id, t.name AS label, tr.name AS detail, {_score(key)} AS score
+            FROM teams t
+            LEFT JOIN tournaments tr ON tr.id = t.tournament_id
+            WHERE {_match(key, fuzzy)}
+        """
+    if kind == "tournaments":
+        key = "lower(t.name)"
+        return f"""
+            SELECT 'tournaments' AS kind, t.id, t.name AS label, t.game AS detail, {_score(key)} AS score
+            FROM tournaments t
+            WHERE {_match(key, fuzzy)}
+        """
+    # Hosts match on username or organization name; the UNION keeps both
+    # lookups on their own indexes
+    username, organization = "lower(u.username)", "lower(h.organization_name)"
+    return f"""
+        SELECT 'hosts' AS kind, u.id, coalesce(u.username, h.organization_name) AS label,
+               h.organization_name AS detail,
+               GREATEST({_score(username)}, coalesce({_score(organization)}, 0)) AS score
+        FROM users u
+        LEFT JOIN host_profiles h ON h.user_id = u.id
+        WHERE u.role = :host_role AND u.is_active AND u.id IN (
+            SELECT u.id FROM users u WHERE {_match(username, fuzzy)}
+            UNION
+            SELECT h.user_id FROM host_profiles h WHERE {_match(organization, fuzzy)}
+        )
+    """
+
+def postgres_search(
+    db: Session,
+    query: str,
+    kinds: Sequence[str],
+    limit: int,
+    threshold: float
+) -> Dict[str, List[Dict]]:
+    """
+    Top `limit` hits per kind for an already normalized query, in one round
+    trip. Relies on the pg_trgm and text_pattern_ops indexes from
+    models.base.search_indexes.
+    """
+    fuzzy = len(query) >= FUZZY_MIN_LENGTH
+    parts = [
+        f"({_kind_sql(kind, fuzzy)} ORDER BY score DESC, label, id LIMIT :limit)"
+        for kind in kinds
+    ]
+    # Threshold for the % operator, scoped to this transaction
+    db.execute(
+        text("SELECT set_config('pg_trgm.similarity_threshold', :threshold, true)"),
+        {"threshold": str(threshold)}
+    )
+    escaped = like_escape(query)
+    rows = db.execute(text(" UNION ALL ".join(parts)), {
+        "q": query,
+        "prefix": f"{escaped}%",
+        "word_prefix": f"% {escaped}%",
+        "limit": limit,
+        "host_role": UserRole.HOST.name,
+    }).mappings()
+
+    results: Dict[str, List[Dict]] = {kind: [] for kind in kinds}
+    for row in rows:
+        results[row["kind"]].append({
+            "kind": row["kind"],
+            "id": row["id"],
+            "label": row["label"],
+            "detail": row["detail"],
+            "score": round(float(row["score"]), 4),
+        })
+    # UNION ALL does not keep each part's order
+    for hits in results.values():
+        hits.sort(key=lambda hit: (-hit["score"], hit["label"], hit["id"]))
+    return results
+
+def load_search_documents(db: Session) -> Iterator[Tuple[str, int, str, Optional[str], List[str]]]:
+    """Every searchable (kind, id, label, detail, keys) for the in-memory index"""
+    for ranking_id, name, handle in db.query(
+        PlayerRanking.id, PlayerRanking.player_name, PlayerRanking.twitter_handle
+    ).yield_per(5000):
+        if name:
+            yield "players", ranking_id, name, handle, [name.lower()]
+
+    for team_id, name, tournament_name in db.query(Team.id, Team.name, Tournament.name).outerjoin(
+        Tournament, Tournament.id == Team.tournament_id
+    ).yield_per(5000):
+        if name:
+            yield "teams", team_id, name, tournament_name, [name.lower()]
+
+    for tournament_id, name, game in db.query(Tournament.id, Tournament.name, Tournament.game).yield_per(5000):
+        if name:
+            yield "tournaments", tournament_id, name, game, [name.lower()]
+
+    hosts = db.query(User.id, User.username, HostProfile.organization_name).outerjoin(
+        HostProfile, HostProfile.user_id == User.id
+    ).filter(User.role == UserRole.HOST, User.is_active.is_(True))
+    for user_id, username, organization in hosts:
+        keys = [value.lower() for value in (username, organization) if value]
+        if keys:
+            yield "hosts", user_id, username or organization, organization, keys
@@ -0,0 +1,324 @@
+# app/crud/stats.py - Incremental cross-tournament stats rollups
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.crud.pagination import paginate
+from app.models.losers_match import LosersMatch
+from app.models.match import Match
+from app.models.stats import StatsRollup, StatsSubject
+from app.models.team import Team
+from app.models.tkr import TKRGameSubmission, TKRTeamRegistration, SubmissionStatus
+from app.models.tournament import Tournament
+
+COUNTERS = (
+    "games_played", "kills", "total_score", "placement_total",
+    "first_places", "matches_won", "matches_lost"
+)
+
+# (subject_type, subject_key, game, map_name, season)
+BucketKey = Tuple[str, str, str, str, str]
+
+# (team_registration_id, kills, placement, final_score) of one verified TKR game
+TKRGame = Tuple[int, int, int, Optional[float]]
+
+def normalize_key(name: str) -> str:
+    return " ".join(str(name).split()).lower()
+
+def season_for(moment: Optional[datetime]) -> str:
+    """Calendar quarters, e.g. "2025-Q4" """
+    if moment is None:
+        return ""
+    return f"{moment.year}-Q{(moment.month - 1) // 3 + 1}"
+
+def rollup_buckets(game: Optional[str], map_name: Optional[str], season: str) -> set:
+    """The exact bucket plus every coarser one it rolls into ("" means all)"""
+    game = normalize_key(game or "")
+    map_name = normalize_key(map_name or "")
+    return {
+        (game, map_name, season),
+        (game, map_name, ""),
+        (game, "", season),
+        (game, "", ""),
+        ("", "", season),
+        ("", "", ""),
+    }
+
+class StatsDelta:
+    """Signed counter changes accumulated per bucket, applied in one upsert"""
+
+    def __init__(self):
+        self.counters: Dict[BucketKey, Dict[str, float]] = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+        self.best: Dict[BucketKey, Optional[float]] = {}
+        self.names: Dict[BucketKey, str] = {}
+
+    def add(
+        self,
+        subject_type: str,
+        name: str,
+        buckets: Iterable[Tuple[str, str, str]],
+        best_game_score: Optional[float] = None,
+        **counts
+    ) -> None:
+        subject_key = normalize_key(name)
+        if not subject_key:
+            return
+        for game, map_name, season in buckets:
+            key = (subject_type, subject_key, game, map_name, season)
+            row = self.counters[key]
+            for field, value in counts.items():
+                row[field] += value
+            self.names[key] = name.strip()
+            if best_game_score is not None:
+                current = self.best.get(key)
+                self.best[key] = best_game_score if current is None else max(current, best_game_score)
+            else:
+                self.best.setdefault(key, None)
+
+    def __bool__(self):
+        return bool(self.counters)
+
+def apply_stats_delta(db: Session, delta: StatsDelta) -> None:
+    """
+    Upsert every touched bucket in one statement, adding the deltas to the
+    stored counters. Runs in the caller's transaction; rows are written in
+    key order so concurrent writers cannot deadlock on each other.
+
+    best_game_score only ever rises; reversing a game does not lower it
+    until the next rebuild_stats_rollups.
+    """
+    if not delta:
+        return
+    now = datetime.utcnow()
+    rows = []
+    for key in sorted(delta.counters):
+        subject_type, subject_key, game, map_name, season = key
+        rows.append({
+            "subject_type": subject_type,
+            "subject_key": subject_key,
+            "display_name": delta.names[key],
+            "game": game,
+            "map_name": map_name,
+            "season": season,
+            "best_game_score": delta.best[key],
+            "updated_at": now,
+            **delta.counters[key]
+        })
+
+    statement = pg_insert(StatsRollup).values(rows)
+    excluded = statement.excluded
+    table = StatsRollup.__table__.c
+    statement = statement.on_conflict_do_update(
+        constraint="uq_stats_rollups_bucket",
+        set_={
+            **{field: table[field] + excluded[field] for field in COUNTERS},
+            "best_game_score": func.greatest(table.best_game_score, excluded.best_game_score),
+            "display_name": excluded.display_name,
+            "updated_at": excluded.updated_at,
+        }
+    )
+    db.execute(statement)
+
+# TKR games
+def add_tkr_games(
+    delta: StatsDelta,
+    tournament: Tournament,
+    registrations: Dict[int, TKRTeamRegistration],
+    games: Sequence[TKRGame],
+    sign: int
+) -> None:
+    """Credit (sign=1) or reverse (sign=-1) games for each team and every player on its roster"""
+    map_name = tournament.tkr_config.map_name if tournament.tkr_config else None
+    buckets = rollup_buckets(tournament.game, map_name, season_for(tournament.starts_at or tournament.start_date))
+    for team_registration_id, kills, placement, final_score in games:
+        registration = registrations.get(team_registration_id)
+        if registration is None:
+            continue
+        score = final_score or 0.0
+        counts = {
+            "games_played": sign,
+            "kills": sign * kills,
+            "total_score": sign * score,
+            "placement_total": sign * placement,
+            "first_places": sign * (placement == 1),
+        }
+        best = score if sign > 0 else None
+        delta.add(StatsSubject.TEAM, registration.team_name, buckets, best, **counts)
+        for player in registration.players or []:
+            delta.add(StatsSubject.PLAYER, player.get("name", ""), buckets, best, **counts)
+
+def record_tkr_games(db: Session, tournament_id: int, games: Sequence[TKRGame], sign: int) -> None:
+    """Apply verified TKR games to the rollups inside the caller's transaction"""
+    if not games:
+        return
+    tournament = db.query(Tournament).options(
+        joinedload(Tournament.tkr_config)
+    ).filter(Tournament.id == tournament_id).first()
+    if not tournament:
+        return
+    registrations = {
+        registration.id: registration for registration in db.query(TKRTeamRegistration).filter(
+            TKRTeamRegistration.id.in_({game[0] for game in games})
+        )
+    }
+    delta = StatsDelta()
+    add_tkr_games(delta, tournament, registrations, games, sign)
+    apply_stats_delta(db, delta)
+
+def tkr_game(submission: TKRGameSubmission) -> TKRGame:
+    return (submission.team_registration_id, submission.kills, submission.placement, submission.final_score)
+
+def verified_tkr_games(db: Session, team_registration_ids: Iterable[int]) -> List[TKRGame]:
+    return db.query(
+        TKRGameSubmission.team_registration_id, TKRGameSubmission.kills,
+        TKRGameSubmission.placement, TKRGameSubmission.final_score
+    ).filter(
+        TKRGameSubmission.team_registration_id.in_(list(team_registration_ids)),
+        TKRGameSubmission.status == SubmissionStatus.VERIFIED
+    ).all()
+
+# Bracket matches
+def add_match_result(delta: StatsDelta, tournament: Tournament, winner: Team, loser: Team, sign: int) -> None:
+    buckets = rollup_buckets(tournament.game, None, season_for(tournament.starts_at or tournament.start_date))
+    for team, field in ((winner, "matches_won"), (loser, "matches_lost")):
+        delta.add(StatsSubject.TEAM, team.name or "", buckets, **{field: sign})
+        for player in team.players:
+            delta.add(StatsSubject.PLAYER, player.username, buckets, **{field: sign})
+
+def record_match_result(
+    db: Session,
+    tournament: Tournament,
+    previous: Tuple[Optional[int], Optional[int]],
+    current: Tuple[Optional[int], Optional[int]]
+) -> None:
+    """
+    Move a bracket match's (winner_id, loser_id) from `previous` to `current`
+    in the rollups. Byes and undecided matches count for nothing, and
+    re-deciding a match reverses the old result first. Commits.
+    """
+    if previous == current:
+        return
+    results = [(pair, sign) for pair, sign in ((previous, -1), (current, 1)) if all(pair)]
+    if not results:
+        return
+    teams = load_teams_with_players(db, [team_id for pair, _ in results for team_id in pair])
+    delta = StatsDelta()
+    for (winner_id, loser_id), sign in results:
+        if winner_id in teams and loser_id in teams:
+            add_match_result(delta, tournament, teams[winner_id], teams[loser_id], sign)
+    apply_stats_delta(db, delta)
+    db.commit()
+
+def decided_matches(db: Session, tournament_id: Optional[int] = None) -> List[Tuple[int, int, int]]:
+    """(tournament_id, winner_id, loser_id) for every decided winners, finals and losers match"""
+    matches = db.query(Match.tournament_id, Match.winner_id, Match.loser_id).filter(
+        Match.winner_id.isnot(None), Match.loser_id.isnot(None)
+    )
+    losers_matches = db.query(
+        LosersMatch.tournament_id, LosersMatch.winner_id, LosersMatch.team1_id, LosersMatch.team2_id
+    ).filter(
+        LosersMatch.winner_id.isnot(None),
+        LosersMatch.team1_id.isnot(None),
+        LosersMatch.team2_id.isnot(None)
+    )
+    if tournament_id is not None:
+        matches = matches.filter(Match.tournament_id == tournament_id)
+        losers_matches = losers_matches.filter(LosersMatch.tournament_id == tournament_id)
+
+    results = [tuple(row) for row in matches]
+    for match_tournament_id, winner_id, team1_id, team2_id in losers_matches:
+        # Losers matches only store the winner
+        results.append((match_tournament_id, winner_id, team2_id if winner_id == team1_id else team1_id))
+    return results
+
+def load_teams_with_players(db: Session, team_ids: Optional[Iterable[int]] = None) -> Dict[int, Team]:
+    query = db.query(Team).options(selectinload(Team.players))
+    if team_ids is not None:
+        query = query.filter(Team.id.in_(set(team_ids)))
+    return {team.id: team for team in query}
+
+def reverse_tournament_matches(db: Session, tournament: Tournament) -> None:
+    """Take a bracket's decided matches out of the rollups before it is reset (no commit)"""
+    results = decided_matches(db, tournament.id)
+    if not results:
+        return
+    teams = load_teams_with_players(db, [team_id for _, *pair in results for team_id in pair])
+    delta = StatsDelta()
+    for _, winner_id, loser_id in results:
+        if winner_id in teams and loser_id in teams:
+            add_match_result(delta, tournament, teams[winner_id], teams[loser_id], -1)
+    apply_stats_delta(db, delta)
+
+def rebuild_stats_rollups(db: Session) -> int:
+    """
+    Recompute every rollup from verified TKR games and decided matches.
+    Used for the initial backfill and to repair drift. Returns the row count.
+    """
+    db.query(StatsRollup).delete(synchronize_session=False)
+    delta = StatsDelta()
+
+    tournaments = db.query(Tournament).options(joinedload(Tournament.tkr_config)).all()
+    games_by_tournament = defaultdict(list)
+    for submission in db.query(TKRGameSubmission).filter(
+        TKRGameSubmission.status == SubmissionStatus.VERIFIED
+    ):
+        games_by_tournament[submission.tournament_id].append(tkr_game(submission))
+    registrations = {registration.id: registration for registration in db.query(TKRTeamRegistration)}
+    teams = load_teams_with_players(db)
+
+    for tournament in tournaments:
+        add_tkr_games(delta, tournament, registrations, games_by_tournament.get(tournament.id, []), 1)
+
+    by_id = {tournament.id: tournament for tournament in tournaments}
+    for tournament_id, winner_id, loser_id in decided_matches(db):
+        if tournament_id in by_id and winner_id in teams and loser_id in teams:
+            add_match_result(delta, by_id[tournament_id], teams[winner_id], teams[loser_id], 1)
+
+    apply_stats_delta(db, delta)
+    db.commit()
+    return len(delta.counters)
+
+# Reads
+# sort parameter -> StatsRollup column
+LEADERBOARD_SORTS = {
+    "score": "total_score",
+    "kills": "kills",
+    "wins": "matches_won",
+}
+
+def get_stats_leaderboard(
+    db: Session,
+    subject_type: str,
+    game: str = "",
+    map_name: str = "",
+    season: str = "",
+    sort: str = "score",
+    skip: int = 0,
+    limit: int = 50,
+    cursor: Optional[str] = None
+) -> List[StatsRollup]:
+    """One precomputed bucket, best first; the default bucket is career totals"""
+    query = db.query(StatsRollup).filter(
+        StatsRollup.subject_type == subject_type,
+        StatsRollup.game == normalize_key(game),
+        StatsRollup.map_name == normalize_key(map_name),
+        StatsRollup.season == season,
+        or_(StatsRollup.games_played > 0, StatsRollup.matches_won + StatsRollup.matches_lost > 0)
+    )
+    return paginate(
+        query, getattr(StatsRollup, LEADERBOARD_SORTS[sort]), StatsRollup.id,
+        skip=skip, limit=limit, cursor=cursor, descending=True
+    ).all()
+
+def get_stats_profile(db: Session, subject_type: str, name: str) -> List[StatsRollup]:
+    """Every bucket for one handle or team name, career row first"""
+    return db.query(StatsRollup).filter(
+        StatsRollup.subject_type == subject_type,
+        StatsRollup.subject_key == normalize_key(name)
+    ).order_by(
+        StatsRollup.game, StatsRollup.map_name, StatsRollup.season
+    ).all()
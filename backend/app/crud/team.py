@@ -58,6 +58,12 @@ def get_teams_by_tournament(db: Session, tournament_id: int):
         .order_by(Team.seed)\
         .all()
 
+def get_tournament_teams_version(db: Session, tournament_id: int):
+    """(latest updated_at, team count) for a tournament; changes whenever its team list does"""
+    return db.query(func.max(Team.updated_at), func.count(Team.id))\
+        .filter(Team.tournament_id == tournament_id)\
+        .one()
+
 def update_team(db: Session, team_id: int, team_update: TeamUpdate):
     """
     Update team details while preserving seed number.
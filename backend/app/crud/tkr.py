@@ -1,16 +1,25 @@
 # app/crud/tkr.py - Complete updated version with tournament days calculation
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, and_, or_
-from typing import List, Optional, Dict
+from sqlalchemy.orm import Session, joinedload, selectinload
+from fastapi import HTTPException
+from sqlalchemy import func, and_, or_, case
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime, timedelta
 
 from app.models.tkr import (
     TKRTournamentConfig, TKRTeamRegistration, TKRGameSubmission,
-    TKRLeaderboard, TKRTemplate, PaymentStatus, SubmissionStatus,
+    TKRLeaderboard, TKRTemplate, TKRSubmissionStats, TKRRosterPlayer, PaymentStatus, SubmissionStatus,
     TKRTeamSize
 )
-from app.models.tournament import Tournament
+from app.models.tournament import Tournament, TournamentStatus
 from app.models.team import Team
+from app.crud.pagination import paginate
+from app.crud.stats import normalize_key, record_tkr_games, tkr_game, verified_tkr_games
+from app.core.config import settings
+from app.crud.tournament import notify_schedule_changed, sync_schedule
+from app.services.tkr_anomaly import METRICS, score_submission, submission_fingerprint, welford_update
+from app.services.tkr_scoring import CompiledScorer, get_scorer
 from app.schemas.tkr import (
     TKRTournamentConfigCreate, TKRTournamentConfigUpdate,
     TKRTeamRegistrationCreate, TKRTeamRegistrationUpdate,
@@ -19,7 +28,11 @@ from app.schemas.tkr import (
 )
 
 class TKRScoringEngine:
-    """TKR scoring calculation engine"""
+    """
+    TKR scoring calculation engine. Reference implementation; scoring paths
+    use app.services.tkr_scoring.get_scorer(config), which compiles the same
+    rules once per config version.
+    """
     
     @staticmethod
     def calculate_game_score(
@@ -82,6 +95,9 @@ def create_tkr_config(db: Session, config: TKRTournamentConfigCreate) -> TKRTour
     
     db_config = TKRTournamentConfig(**config_data)
     db.add(db_config)
+    if tournament:
+        # The tournament only becomes schedulable once it has a TKR config
+        sync_schedule(db, tournament)
     db.commit()
     db.refresh(db_config)
     return db_config
@@ -118,6 +134,13 @@ def update_tkr_config(
     for field, value in update_data.items():
         setattr(db_config, field, value)
     
+    if scoring_fields_changed:
+        db_config.scoring_version = (db_config.scoring_version or 0) + 1
+    
+    if 'consecutive_hours' in update_data:
+        reschedule_submission_windows(db, db_config.id, db_config.consecutive_hours)
+        notify_schedule_changed(db, tournament_id)
+    
     db.commit()
     db.refresh(db_config)
     
@@ -147,6 +170,11 @@ def recalculate_tournament_scores(db: Session, tournament_id: int) -> bool:
         
         # Create a lookup for team ranks
         team_ranks = {reg.id: reg.team_rank for reg in registrations}
+        score = get_scorer(config).score
+        verified_before = [
+            tkr_game(submission) for submission in submissions
+            if submission.status == SubmissionStatus.VERIFIED
+        ]
         
         # Recalculate each submission
         for submission in submissions:
@@ -155,27 +183,22 @@ def recalculate_tournament_scores(db: Session, tournament_id: int) -> bool:
                 continue  # Skip if we can't find team rank
             
             # Recalculate scores using current configuration
-            score_data = TKRScoringEngine.calculate_game_score(
-                kills=submission.kills,
-                placement=submission.placement,
-                team_rank=team_rank,
-                placement_multipliers=config.placement_multipliers,
-                bonus_point_thresholds=config.bonus_point_thresholds,
-                max_points_per_map=config.max_points_per_map
+            submission.base_score, submission.bonus_points, submission.final_score = score(
+                submission.kills, submission.placement, team_rank
             )
-            
-            # Update the submission with new scores
-            submission.base_score = score_data["base_score"]
-            submission.bonus_points = score_data["bonus_points"]
-            submission.final_score = score_data["final_score"]
         
+        # Update leaderboards for all affected teams, reranking once
+        affected_teams = list(set(submission.team_registration_id for submission in submissions))
+        db.flush()
+        refresh_leaderboard_entries(db, tournament_id, affected_teams, commit=False)
+        # Swap the old scores of verified games for the new ones in the stats rollups
+        record_tkr_games(db, tournament_id, verified_before, -1)
+        record_tkr_games(db, tournament_id, [
+            tkr_game(submission) for submission in submissions
+            if submission.status == SubmissionStatus.VERIFIED
+        ], 1)
         db.commit()
         
-        # Update leaderboards for all affected teams
-        affected_teams = set(submission.team_registration_id for submission in submissions)
-        for team_registration_id in affected_teams:
-            update_leaderboard_for_team(db, team_registration_id)
-        
         return True
         
     except Exception as e:
@@ -183,6 +206,72 @@ def recalculate_tournament_scores(db: Session, tournament_id: int) -> bool:
         print(f"Error recalculating tournament scores: {str(e)}")
         return False
 
+def simulate_scoring(db: Session, config: TKRTournamentConfig, proposed: Dict) -> Dict:
+    """
+    Score every non-rejected submission under `proposed` scoring fields
+    (falling back to the current config for the rest) and compare the
+    resulting leaderboard with the stored one. Reads only; nothing is written.
+    """
+    rules = {
+        field: proposed.get(field, getattr(config, field))
+        for field in ('placement_multipliers', 'bonus_point_thresholds', 'max_points_per_map')
+    }
+    # null clears the optional bonus and cap, but placement multipliers are required
+    if rules['placement_multipliers'] is None:
+        rules['placement_multipliers'] = config.placement_multipliers
+    score = CompiledScorer(**rules).score
+
+    teams = db.query(
+        TKRTeamRegistration.id, TKRTeamRegistration.team_name, TKRTeamRegistration.team_rank,
+        TKRLeaderboard.total_score, TKRLeaderboard.current_rank
+    ).outerjoin(
+        TKRLeaderboard, TKRLeaderboard.team_registration_id == TKRTeamRegistration.id
+    ).filter(TKRTeamRegistration.tournament_id == config.tournament_id).all()
+
+    games = db.query(
+        TKRGameSubmission.team_registration_id, TKRGameSubmission.kills, TKRGameSubmission.placement
+    ).filter(
+        TKRGameSubmission.tournament_id == config.tournament_id,
+        TKRGameSubmission.status != SubmissionStatus.REJECTED
+    ).all()
+
+    team_ranks = {team.id: team.team_rank for team in teams}
+    totals = {team.id: 0.0 for team in teams}
+    kills = {team.id: 0 for team in teams}
+    for registration_id, game_kills, placement in games:
+        team_rank = team_ranks.get(registration_id)
+        if not team_rank:
+            continue  # same rule as recalculate_tournament_scores
+        totals[registration_id] += score(game_kills, placement, team_rank)[2]
+        kills[registration_id] += game_kills
+
+    # Same ordering as update_tournament_leaderboard_ranks
+    ranking = sorted(totals, key=lambda registration_id: (-totals[registration_id], -kills[registration_id], registration_id))
+    simulated_ranks = {registration_id: i + 1 for i, registration_id in enumerate(ranking)}
+
+    entries = []
+    for team in teams:
+        current_score = team.total_score or 0.0
+        simulated_rank = simulated_ranks[team.id]
+        entries.append({
+            "team_registration_id": team.id,
+            "team_name": team.team_name,
+            "current_score": current_score,
+            "simulated_score": totals[team.id],
+            "score_delta": totals[team.id] - current_score,
+            "current_rank": team.current_rank,
+            "simulated_rank": simulated_rank,
+            "rank_change": (team.current_rank - simulated_rank) if team.current_rank else None,
+        })
+    entries.sort(key=lambda entry: entry["simulated_rank"])
+
+    return {
+        "tournament_id": config.tournament_id,
+        "games_evaluated": len(games),
+        "teams_moved": sum(1 for entry in entries if entry["rank_change"]),
+        "entries": entries,
+    }
+
 def delete_tkr_config(db: Session, tournament_id: int) -> bool:
     db_config = get_tkr_config(db, tournament_id)
     if db_config:
@@ -191,21 +280,168 @@ def delete_tkr_config(db: Session, tournament_id: int) -> bool:
         return True
     return False
 
+# TKR submission windows
+def submission_window(start_time: datetime, consecutive_hours: int) -> Tuple[datetime, datetime]:
+    """(end of the competition window, submission deadline) for a team starting at start_time"""
+    end_time = start_time + timedelta(hours=consecutive_hours)
+    return end_time, end_time + timedelta(hours=settings.TKR_SUBMISSION_GRACE_HOURS)
+
+def set_submission_window(registration: TKRTeamRegistration, consecutive_hours: int) -> None:
+    registration.end_time, registration.submission_deadline = submission_window(
+        registration.start_time, consecutive_hours
+    )
+    # Moving the window later reopens a closed one
+    if registration.submission_deadline > datetime.utcnow():
+        registration.submissions_closed_at = None
+
+def reschedule_submission_windows(db: Session, config_id: int, consecutive_hours: int) -> None:
+    """Recompute every registration's window after consecutive_hours changes, in one UPDATE"""
+    end_time = TKRTeamRegistration.start_time + timedelta(hours=consecutive_hours)
+    deadline = end_time + timedelta(hours=settings.TKR_SUBMISSION_GRACE_HOURS)
+    db.query(TKRTeamRegistration).filter(
+        TKRTeamRegistration.config_id == config_id
+    ).update({
+        TKRTeamRegistration.end_time: end_time,
+        TKRTeamRegistration.submission_deadline: deadline,
+        TKRTeamRegistration.submissions_closed_at: case(
+            (deadline > datetime.utcnow(), None),
+            else_=TKRTeamRegistration.submissions_closed_at
+        )
+    }, synchronize_session=False)
+
+def close_expired_submission_windows(
+    db: Session, now: Optional[datetime] = None, batch_size: Optional[int] = None
+) -> List[int]:
+    """
+    Mark every registration whose deadline has passed as closed, batch_size
+    rows per transaction. Rows are claimed with SKIP LOCKED so a registration
+    being edited is simply picked up on the next run. Returns the closed IDs.
+    """
+    now = now or datetime.utcnow()
+    batch_size = batch_size or settings.TKR_WINDOW_CLOSE_BATCH_SIZE
+    closed = []
+    while True:
+        ids = [row.id for row in db.query(TKRTeamRegistration.id).filter(
+            TKRTeamRegistration.submissions_closed_at.is_(None),
+            TKRTeamRegistration.submission_deadline <= now
+        ).order_by(
+            TKRTeamRegistration.submission_deadline
+        ).limit(batch_size).with_for_update(skip_locked=True)]
+        if not ids:
+            break
+        db.query(TKRTeamRegistration).filter(
+            TKRTeamRegistration.id.in_(ids)
+        ).update({TKRTeamRegistration.submissions_closed_at: now}, synchronize_session=False)
+        db.commit()
+        closed.extend(ids)
+        if len(ids) < batch_size:
+            break
+    return closed
+
+def next_submission_deadline(db: Session) -> Optional[Tuple[int, datetime]]:
+    """(tournament_id, deadline) of the earliest window still open"""
+    return db.query(
+        TKRTeamRegistration.tournament_id, TKRTeamRegistration.submission_deadline
+    ).filter(
+        TKRTeamRegistration.submissions_closed_at.is_(None),
+        TKRTeamRegistration.submission_deadline.isnot(None)
+    ).order_by(TKRTeamRegistration.submission_deadline).first()
+
+def submission_window_error(registration: TKRTeamRegistration, now: datetime) -> Optional[str]:
+    """Why scores can't be submitted for this registration right now, or None"""
+    deadline = registration.submission_deadline
+    if registration.submissions_closed_at or (deadline and now > deadline):
+        return f"Submission deadline has passed. Deadline was {deadline.strftime('%Y-%m-%d %H:%M')} UTC"
+    if registration.start_time and now < registration.start_time:
+        return f"Competition has not started yet. Starts at {registration.start_time.strftime('%Y-%m-%d %H:%M')} UTC"
+    return None
+
+def submission_window_status(
+    start_time: datetime,
+    end_time: Optional[datetime],
+    deadline: Optional[datetime],
+    closed_at: Optional[datetime],
+    now: datetime
+) -> Tuple[str, Optional[datetime]]:
+    """("upcoming" | "active" | "grace" | "closed", when that status next changes)"""
+    if closed_at or (deadline and now > deadline):
+        return "closed", None
+    if now < start_time:
+        return "upcoming", start_time
+    if end_time is None or now <= end_time:
+        return "active", end_time or deadline
+    return "grace", deadline
+
+def get_user_submission_eligibility(
+    db: Session, user_id: int, now: datetime
+) -> Tuple[List[Dict], Optional[datetime]]:
+    """
+    Eligibility of every registration the user owns in a live tournament,
+    from one query. Returns the rows and the earliest boundary at which any
+    of them changes status.
+    """
+    rows = db.query(
+        TKRTeamRegistration.id, TKRTeamRegistration.tournament_id, Tournament.name,
+        TKRTeamRegistration.team_name, TKRTeamRegistration.start_time,
+        TKRTeamRegistration.end_time, TKRTeamRegistration.submission_deadline,
+        TKRTeamRegistration.submissions_closed_at
+    ).join(
+        Team, Team.id == TKRTeamRegistration.team_id
+    ).join(
+        Tournament, Tournament.id == TKRTeamRegistration.tournament_id
+    ).filter(
+        Team.creator_id == user_id,
+        Tournament.status != TournamentStatus.CANCELLED,
+        # Completed tournaments still count while a team is in its grace period
+        or_(
+            Tournament.status.in_([TournamentStatus.PENDING, TournamentStatus.ONGOING]),
+            TKRTeamRegistration.submissions_closed_at.is_(None)
+        )
+    ).order_by(TKRTeamRegistration.start_time, TKRTeamRegistration.id).all()
+
+    messages = {
+        "upcoming": "Competition window has not started yet",
+        "active": "Competition window active - ready to submit",
+        "grace": "Grace period - submissions still open",
+        "closed": "Submission deadline has passed",
+    }
+    results = []
+    valid_until = None
+    for (registration_id, tournament_id, tournament_name, team_name,
+         start_time, end_time, deadline, closed_at) in rows:
+        status, boundary = submission_window_status(start_time, end_time, deadline, closed_at, now)
+        if boundary and (valid_until is None or boundary < valid_until):
+            valid_until = boundary
+        results.append({
+            "team_registration_id": registration_id,
+            "tournament_id": tournament_id,
+            "tournament_name": tournament_name,
+            "team_name": team_name,
+            "can_submit": status in ("active", "grace"),
+            "window_status": status,
+            "message": messages[status],
+            "start_time": start_time,
+            "end_time": end_time,
+            "submission_deadline": deadline,
+            "seconds_remaining": int((boundary - now).total_seconds()) if boundary else None,
+        })
+    return results, valid_until
+
 # TKR Team Registration CRUD
 def create_tkr_team_registration(
     db: Session, registration: TKRTeamRegistrationCreate, team_id: int, config_id: int
 ) -> TKRTeamRegistration:
-    # Calculate end time based on start time + consecutive hours
     config = db.query(TKRTournamentConfig).filter(TKRTournamentConfig.id == config_id).first()
-    end_time = registration.start_time + timedelta(hours=config.consecutive_hours)
     
     db_registration = TKRTeamRegistration(
         **registration.dict(),
         team_id=team_id,
-        config_id=config_id,
-        end_time=end_time
+        config_id=config_id
     )
+    set_submission_window(db_registration, config.consecutive_hours)
+    sync_roster(db_registration)
     db.add(db_registration)
+    notify_schedule_changed(db, registration.tournament_id)
     db.commit()
     db.refresh(db_registration)
     
@@ -237,14 +473,120 @@ def update_tkr_team_registration(
         return None
     
     update_data = registration_update.dict(exclude_unset=True)
+    # Verified games follow the roster: move them from the old names to the new ones
+    roster_changed = 'players' in update_data or 'team_name' in update_data
+    verified_games = verified_tkr_games(db, [registration_id]) if roster_changed else []
+    record_tkr_games(db, db_registration.tournament_id, verified_games, -1)
+    
     for field, value in update_data.items():
         setattr(db_registration, field, value)
+    if 'players' in update_data:
+        sync_roster(db_registration)
+    record_tkr_games(db, db_registration.tournament_id, verified_games, 1)
+    
+    if 'start_time' in update_data:
+        set_submission_window(db_registration, db_registration.tournament_config.consecutive_hours)
+        notify_schedule_changed(db, db_registration.tournament_id)
     
     db_registration.updated_at = datetime.utcnow()
     db.commit()
     db.refresh(db_registration)
     return db_registration
 
+# Normalized roster
+def sync_roster(registration: TKRTeamRegistration) -> None:
+    """
+    Bring the registration's roster rows in line with its players JSON.
+    Rows are updated in place by handle so the unique (registration, handle)
+    index never sees a delete and re-insert of the same player.
+    """
+    free_entry = {normalize_key(name) for name in registration.free_entry_players or []}
+    existing = {row.handle: row for row in registration.roster}
+    rows = []
+    for position, player in enumerate(registration.players or []):
+        handle = normalize_key(player.get("name", ""))
+        if not handle or any(row.handle == handle for row in rows):
+            continue
+        row = existing.pop(handle, None) or TKRRosterPlayer(handle=handle)
+        row.tournament_id = registration.tournament_id
+        row.player_name = player["name"].strip()
+        row.rank = player.get("rank")
+        row.stream = player.get("stream")
+        row.position = position
+        row.using_free_entry = handle in free_entry
+        rows.append(row)
+    # Players no longer listed are orphaned and deleted
+    registration.roster = rows
+
+def find_registered_players(
+    db: Session, tournament_id: int, names: List[str], exclude_registration_id: Optional[int] = None
+) -> List[str]:
+    """Names already on another registration in the tournament, via the (tournament, handle) index"""
+    by_handle = {normalize_key(name): name for name in names}
+    query = db.query(TKRRosterPlayer.handle).filter(
+        TKRRosterPlayer.tournament_id == tournament_id,
+        TKRRosterPlayer.handle.in_(list(by_handle))
+    )
+    if exclude_registration_id is not None:
+        query = query.filter(TKRRosterPlayer.registration_id != exclude_registration_id)
+    return sorted({by_handle[handle] for (handle,) in query.distinct()})
+
+def get_player_registrations(db: Session, handle: str) -> List[TKRTeamRegistration]:
+    """Every registration a player has been on, newest first"""
+    return db.query(TKRTeamRegistration).join(
+        TKRRosterPlayer, TKRRosterPlayer.registration_id == TKRTeamRegistration.id
+    ).options(
+        joinedload(TKRTeamRegistration.tournament_config),
+        joinedload(TKRTeamRegistration.team).joinedload(Team.creator)
+    ).filter(
+        TKRRosterPlayer.handle == normalize_key(handle)
+    ).order_by(TKRTeamRegistration.start_time.desc(), TKRTeamRegistration.id.desc()).all()
+
+def count_free_entries(db: Session, handle: str) -> int:
+    return db.query(func.count(TKRRosterPlayer.id)).filter(
+        TKRRosterPlayer.handle == normalize_key(handle),
+        TKRRosterPlayer.using_free_entry.is_(True)
+    ).scalar()
+
+# Duplicate and anomaly detection
+DUPLICATE_SUBMISSION_DETAIL = "This game was already submitted for this team (same VOD and timestamp)"
+
+def find_duplicate_fingerprints(db: Session, team_registration_id: int, fingerprints: List[str]) -> set:
+    """Fingerprints that already exist among the team's non-rejected submissions"""
+    return {row.fingerprint for row in db.query(TKRGameSubmission.fingerprint).filter(
+        TKRGameSubmission.team_registration_id == team_registration_id,
+        TKRGameSubmission.fingerprint.in_(fingerprints),
+        TKRGameSubmission.status != SubmissionStatus.REJECTED
+    )}
+
+def record_submission_stats(
+    db: Session, tournament_id: int, team_size, values: Dict[str, float]
+) -> Tuple[float, List[str]]:
+    """
+    Score a new submission against the tournament's running statistics, then
+    fold it into them. The stats row is locked until the caller commits, so
+    concurrent submissions to one tournament update it in turn.
+    """
+    db.execute(pg_insert(TKRSubmissionStats).values(
+        tournament_id=tournament_id
+    ).on_conflict_do_nothing(index_elements=["tournament_id"]))
+    stats = db.query(TKRSubmissionStats).filter(
+        TKRSubmissionStats.tournament_id == tournament_id
+    ).with_for_update().one()
+    
+    states = {
+        metric: (stats.count, getattr(stats, f"{metric}_mean"), getattr(stats, f"{metric}_m2"))
+        for metric in METRICS
+    }
+    anomaly = score_submission(states, values, team_size)
+    
+    for metric in METRICS:
+        count, mean, m2 = welford_update(states[metric], values[metric])
+        setattr(stats, f"{metric}_mean", mean)
+        setattr(stats, f"{metric}_m2", m2)
+    stats.count = count
+    return anomaly
+
 # TKR Game Submission CRUD
 def create_tkr_game_submission(
     db: Session, submission: TKRGameSubmissionCreate
@@ -259,25 +601,36 @@ def create_tkr_game_submission(
     
     config = team_reg.tournament_config
     
+    fingerprint = submission_fingerprint(submission.vod_url, submission.timestamp)
+    if find_duplicate_fingerprints(db, team_reg.id, [fingerprint]):
+        raise HTTPException(status_code=409, detail=DUPLICATE_SUBMISSION_DETAIL)
+    
     # Calculate scores
-    score_data = TKRScoringEngine.calculate_game_score(
-        kills=submission.kills,
-        placement=submission.placement,
-        team_rank=team_reg.team_rank,
-        placement_multipliers=config.placement_multipliers,
-        bonus_point_thresholds=config.bonus_point_thresholds,
-        max_points_per_map=config.max_points_per_map
-    )
+    score_data = get_scorer(config).score_dict(submission.kills, submission.placement, team_reg.team_rank)
+    
+    anomaly_score, anomaly_flags = record_submission_stats(db, team_reg.tournament_id, config.team_size, {
+        "kills": submission.kills,
+        "placement": submission.placement,
+        "final_score": score_data["final_score"]
+    })
     
     db_submission = TKRGameSubmission(
         **submission.dict(),
         base_score=score_data["base_score"],
         bonus_points=score_data["bonus_points"],
-        final_score=score_data["final_score"]
+        final_score=score_data["final_score"],
+        fingerprint=fingerprint,
+        anomaly_score=anomaly_score,
+        anomaly_flags=anomaly_flags or None
     )
     
     db.add(db_submission)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent request inserted the same game first
+        db.rollback()
+        raise HTTPException(status_code=409, detail=DUPLICATE_SUBMISSION_DETAIL)
     db.refresh(db_submission)
     
     # Update leaderboard
@@ -293,11 +646,20 @@ def get_tkr_game_submissions_by_team(
     ).order_by(TKRGameSubmission.game_number).all()
 
 def get_tkr_game_submissions_by_tournament(
-    db: Session, tournament_id: int
+    db: Session,
+    tournament_id: int,
+    skip: int = 0,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
 ) -> List[TKRGameSubmission]:
-    return db.query(TKRGameSubmission).filter(
+    """Newest submissions first; limit=None keeps the historical unbounded response"""
+    query = db.query(TKRGameSubmission).filter(
         TKRGameSubmission.tournament_id == tournament_id
-    ).order_by(TKRGameSubmission.submitted_at.desc()).all()
+    )
+    return paginate(
+        query, TKRGameSubmission.submitted_at, TKRGameSubmission.id,
+        skip=skip, limit=limit, cursor=cursor, descending=True
+    ).all()
 
 def update_tkr_game_submission(
     db: Session, submission_id: int, submission_update: TKRGameSubmissionUpdate
@@ -310,6 +672,8 @@ def update_tkr_game_submission(
         return None
     
     update_data = submission_update.dict(exclude_unset=True)
+    if db_submission.status == SubmissionStatus.VERIFIED:
+        record_tkr_games(db, db_submission.tournament_id, [tkr_game(db_submission)], -1)
     
     # If kills or placement are being updated, recalculate scores
     if 'kills' in update_data or 'placement' in update_data:
@@ -322,14 +686,7 @@ def update_tkr_game_submission(
         kills = update_data.get('kills', db_submission.kills)
         placement = update_data.get('placement', db_submission.placement)
         
-        score_data = TKRScoringEngine.calculate_game_score(
-            kills=kills,
-            placement=placement,
-            team_rank=team_reg.team_rank,
-            placement_multipliers=config.placement_multipliers,
-            bonus_point_thresholds=config.bonus_point_thresholds,
-            max_points_per_map=config.max_points_per_map
-        )
+        score_data = get_scorer(config).score_dict(kills, placement, team_reg.team_rank)
         
         update_data.update({
             "base_score": score_data["base_score"],
@@ -340,7 +697,17 @@ def update_tkr_game_submission(
     for field, value in update_data.items():
         setattr(db_submission, field, value)
     
-    db.commit()
+    if 'vod_url' in update_data or 'timestamp' in update_data:
+        db_submission.fingerprint = submission_fingerprint(db_submission.vod_url, db_submission.timestamp)
+    if db_submission.status == SubmissionStatus.VERIFIED:
+        record_tkr_games(db, db_submission.tournament_id, [tkr_game(db_submission)], 1)
+    
+    try:
+        db.commit()
+    except IntegrityError:
+        # Edited into (or un-rejected as) a copy of another of the team's games
+        db.rollback()
+        raise HTTPException(status_code=409, detail=DUPLICATE_SUBMISSION_DETAIL)
     db.refresh(db_submission)
     
     # Update leaderboard
@@ -355,6 +722,8 @@ def delete_tkr_game_submission(db: Session, submission_id: int) -> bool:
     
     if db_submission:
         team_registration_id = db_submission.team_registration_id
+        if db_submission.status == SubmissionStatus.VERIFIED:
+            record_tkr_games(db, db_submission.tournament_id, [tkr_game(db_submission)], -1)
         db.delete(db_submission)
         db.commit()
         
@@ -409,7 +778,42 @@ def update_leaderboard_for_team(db: Session, team_registration_id: int):
     # Recalculate ranks for all teams in the tournament
     update_tournament_leaderboard_ranks(db, leaderboard_entry.tournament_id)
 
-def update_tournament_leaderboard_ranks(db: Session, tournament_id: int):
+def refresh_leaderboard_entries(
+    db: Session, tournament_id: int, team_registration_ids: List[int], commit: bool = True
+):
+    """
+    Recalculate the given teams' totals with one grouped query, then rerank
+    the tournament once. Equivalent to update_leaderboard_for_team per team.
+    """
+    if team_registration_ids:
+        totals = {
+            row.team_registration_id: row for row in db.query(
+                TKRGameSubmission.team_registration_id,
+                func.count(TKRGameSubmission.id).label("games"),
+                func.coalesce(func.sum(TKRGameSubmission.kills), 0).label("kills"),
+                func.coalesce(func.sum(TKRGameSubmission.final_score), 0.0).label("score"),
+                func.avg(TKRGameSubmission.placement).label("placement")
+            ).filter(
+                TKRGameSubmission.team_registration_id.in_(team_registration_ids),
+                TKRGameSubmission.status != SubmissionStatus.REJECTED
+            ).group_by(TKRGameSubmission.team_registration_id)
+        }
+        entries = db.query(TKRLeaderboard).filter(
+            TKRLeaderboard.team_registration_id.in_(team_registration_ids)
+        ).all()
+        now = datetime.utcnow()
+        for entry in entries:
+            row = totals.get(entry.team_registration_id)
+            games = row.games if row else 0
+            entry.total_kills = int(row.kills) if row else 0
+            entry.total_score = float(row.score) if row else 0.0
+            entry.games_submitted = games
+            entry.average_kills = entry.total_kills / games if games else 0
+            entry.average_placement = float(row.placement) if row else 0
+            entry.last_updated = now
+    update_tournament_leaderboard_ranks(db, tournament_id, commit=commit)
+
+def update_tournament_leaderboard_ranks(db: Session, tournament_id: int, commit: bool = True):
     """Recalculate ranks for all teams in a tournament"""
     # Get all leaderboard entries sorted by total_score (desc) then total_kills (desc)
     entries = db.query(TKRLeaderboard).filter(
@@ -423,15 +827,23 @@ def update_tournament_leaderboard_ranks(db: Session, tournament_id: int):
     for i, entry in enumerate(entries):
         entry.current_rank = i + 1
     
-    db.commit()
+    if commit:
+        db.commit()
 
-def get_tkr_leaderboard(db: Session, tournament_id: int) -> List[TKRLeaderboard]:
-    """Get full leaderboard for a tournament"""
-    return db.query(TKRLeaderboard).options(
+def get_tkr_leaderboard(
+    db: Session, tournament_id: int, since: Optional[datetime] = None
+) -> List[TKRLeaderboard]:
+    """Get full leaderboard for a tournament, or only rows changed after `since`"""
+    query = db.query(TKRLeaderboard).options(
         joinedload(TKRLeaderboard.team_registration)
+        .joinedload(TKRTeamRegistration.team)
+        .joinedload(Team.creator)
     ).filter(
         TKRLeaderboard.tournament_id == tournament_id
-    ).order_by(
+    )
+    if since:
+        query = query.filter(TKRLeaderboard.last_updated > since)
+    return query.order_by(
         TKRLeaderboard.current_rank.asc()
     ).all()
 
@@ -483,13 +895,23 @@ def delete_tkr_template(db: Session, template_id: int) -> bool:
     return False
 
 # Prize Pool Calculation
-def calculate_tkr_prize_pool(db: Session, tournament_id: int) -> Dict:
+def calculate_tkr_prize_pool(
+    db: Session,
+    tournament_id: int,
+    tournament: Optional[Tournament] = None,
+    config: Optional[TKRTournamentConfig] = None,
+    registrations: Optional[List[TKRTeamRegistration]] = None
+) -> Dict:
     """
     Calculate prize pool for a TKR tournament - FIXED VERSION
-    Properly handles normal, rerunning, and partial free entry teams
+    Properly handles normal, rerunning, and partial free entry teams.
+    Callers that already loaded the tournament, config or registrations
+    can pass them in to skip those queries.
     """
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
-    config = get_tkr_config(db, tournament_id)
+    if tournament is None:
+        tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
+    if config is None:
+        config = get_tkr_config(db, tournament_id)
     
     if not tournament or not config:
         return {
@@ -509,7 +931,8 @@ def calculate_tkr_prize_pool(db: Session, tournament_id: int) -> Dict:
         }
     
     # Get all team registrations
-    registrations = get_tkr_team_registrations_by_tournament(db, tournament_id)
+    if registrations is None:
+        registrations = get_tkr_team_registrations_by_tournament(db, tournament_id)
     
     # Parse base entry fee
     base_entry_fee = 0.0
@@ -599,6 +1022,221 @@ def calculate_tkr_prize_pool(db: Session, tournament_id: int) -> Dict:
         }
     }
     
+# Verification queue
+def _with_team_names(rows) -> List[TKRGameSubmission]:
+    submissions = []
+    for submission, team_name, team_rank in rows:
+        submission.team_name = team_name
+        submission.team_rank = team_rank
+        submissions.append(submission)
+    return submissions
+
+def claim_pending_submissions(
+    db: Session, tournament_id: int, moderator_id: int, limit: int, now: datetime,
+    suspicious_first: bool = False
+) -> List[TKRGameSubmission]:
+    """
+    Claim the oldest `limit` pending submissions nobody else holds.
+
+    SKIP LOCKED keeps concurrent claims from blocking on or double-claiming
+    the same rows; the claim columns then keep them reserved for this
+    moderator across requests until TKR_VERIFICATION_CLAIM_SECONDS pass.
+    A moderator's own live claims are renewed and returned first.
+    """
+    ordering = [(TKRGameSubmission.claimed_by == moderator_id).desc().nullslast()]
+    if suspicious_first:
+        ordering.append(TKRGameSubmission.anomaly_score.desc().nullslast())
+    ordering += [TKRGameSubmission.submitted_at, TKRGameSubmission.id]
+    ids = [row.id for row in db.query(TKRGameSubmission.id).filter(
+        TKRGameSubmission.tournament_id == tournament_id,
+        TKRGameSubmission.status == SubmissionStatus.PENDING,
+        or_(
+            TKRGameSubmission.claimed_until.is_(None),
+            TKRGameSubmission.claimed_until < now,
+            TKRGameSubmission.claimed_by == moderator_id
+        )
+    ).order_by(*ordering).limit(limit).with_for_update(skip_locked=True)]
+    if not ids:
+        db.commit()
+        return []
+
+    db.query(TKRGameSubmission).filter(TKRGameSubmission.id.in_(ids)).update({
+        TKRGameSubmission.claimed_by: moderator_id,
+        TKRGameSubmission.claimed_until: now + timedelta(seconds=settings.TKR_VERIFICATION_CLAIM_SECONDS)
+    }, synchronize_session=False)
+    db.commit()
+
+    return _with_team_names(db.query(
+        TKRGameSubmission, TKRTeamRegistration.team_name, TKRTeamRegistration.team_rank
+    ).join(
+        TKRTeamRegistration, TKRTeamRegistration.id == TKRGameSubmission.team_registration_id
+    ).filter(
+        TKRGameSubmission.id.in_(ids)
+    ).order_by(*ordering[1:]).all())
+
+def apply_verification_verdicts(
+    db: Session, tournament_id: int, moderator_id: int, verdicts: List, now: datetime
+) -> Tuple[List[TKRGameSubmission], List[int]]:
+    """
+    Apply VERIFIED/REJECTED verdicts in one transaction and refresh the
+    leaderboard once for every affected team.
+
+    Submissions that are no longer pending, belong to another tournament,
+    are locked by a concurrent batch, or are held by another moderator's
+    live claim are skipped. Returns (updated submissions, skipped IDs).
+    """
+    by_id = {verdict.submission_id: verdict for verdict in verdicts}
+    submissions = db.query(TKRGameSubmission).filter(
+        TKRGameSubmission.id.in_(list(by_id)),
+        TKRGameSubmission.tournament_id == tournament_id,
+        TKRGameSubmission.status == SubmissionStatus.PENDING
+    ).with_for_update(skip_locked=True).all()
+
+    updated = []
+    for submission in submissions:
+        if (submission.claimed_by not in (None, moderator_id)
+                and submission.claimed_until and submission.claimed_until > now):
+            continue
+        verdict = by_id[submission.id]
+        submission.status = verdict.status
+        submission.verification_notes = verdict.verification_notes
+        submission.verified_by = moderator_id
+        submission.verified_at = now
+        submission.claimed_by = None
+        submission.claimed_until = None
+        updated.append(submission)
+
+    refresh_leaderboard_entries(
+        db, tournament_id, list({s.team_registration_id for s in updated}), commit=False
+    )
+    record_tkr_games(db, tournament_id, [
+        tkr_game(s) for s in updated if s.status == SubmissionStatus.VERIFIED
+    ], 1)
+    db.commit()
+
+    updated_ids = {s.id for s in updated}
+    skipped = [submission_id for submission_id in by_id if submission_id not in updated_ids]
+    if updated_ids:
+        # One SELECT reloads everything the commit expired
+        updated = db.query(TKRGameSubmission).filter(
+            TKRGameSubmission.id.in_(updated_ids)
+        ).order_by(TKRGameSubmission.id).all()
+    return updated, skipped
+
+# Host dashboard
+def get_host_dashboard(
+    db: Session,
+    tournament: Tournament,
+    config: TKRTournamentConfig,
+    now: datetime,
+    since: Optional[datetime] = None
+) -> Dict:
+    """
+    Everything the host view shows, loaded set-wise: one query per table
+    (team and creator via selectinload) plus two aggregates for quick_stats.
+
+    With `since`, only registrations, submissions and leaderboard rows
+    changed after it are returned (plus every pending submission), and the
+    prize pool is only recomputed when a registration changed. quick_stats
+    are always complete. Deleted submissions are not reported incrementally;
+    edits are, through TKRGameSubmission.updated_at.
+    """
+    tournament_id = tournament.id
+
+    registrations_query = db.query(TKRTeamRegistration).options(
+        selectinload(TKRTeamRegistration.team).selectinload(Team.creator)
+    ).filter(TKRTeamRegistration.tournament_id == tournament_id)
+    if since:
+        registrations_query = registrations_query.filter(TKRTeamRegistration.updated_at > since)
+    registrations = registrations_query.order_by(TKRTeamRegistration.registered_at).all()
+
+    submissions_query = db.query(
+        TKRGameSubmission, TKRTeamRegistration.team_name, TKRTeamRegistration.team_rank
+    ).join(
+        TKRTeamRegistration, TKRTeamRegistration.id == TKRGameSubmission.team_registration_id
+    ).filter(TKRGameSubmission.tournament_id == tournament_id)
+    if since:
+        submissions_query = submissions_query.filter(or_(
+            TKRGameSubmission.status == SubmissionStatus.PENDING,
+            TKRGameSubmission.updated_at > since
+        ))
+    else:
+        latest = db.query(TKRGameSubmission.id).filter(
+            TKRGameSubmission.tournament_id == tournament_id
+        ).order_by(
+            TKRGameSubmission.submitted_at.desc()
+        ).limit(settings.TKR_DASHBOARD_RECENT_SUBMISSIONS)
+        submissions_query = submissions_query.filter(or_(
+            TKRGameSubmission.status == SubmissionStatus.PENDING,
+            TKRGameSubmission.id.in_(latest.scalar_subquery())
+        ))
+    submissions = _with_team_names(submissions_query.order_by(
+        TKRGameSubmission.submitted_at.desc()
+    ).all())
+
+    leaderboard = get_tkr_leaderboard(db, tournament_id, since=since)
+
+    registration_stats = db.query(
+        func.count(TKRTeamRegistration.id),
+        func.count(TKRTeamRegistration.id).filter(and_(
+            TKRTeamRegistration.start_time <= now,
+            or_(TKRTeamRegistration.end_time.is_(None), TKRTeamRegistration.end_time >= now)
+        )),
+        func.count(TKRTeamRegistration.id).filter(TKRTeamRegistration.end_time < now),
+        func.count(TKRTeamRegistration.id).filter(TKRTeamRegistration.payment_status.in_(
+            [PaymentStatus.PAID_FULL, PaymentStatus.FREE_ENTRY]
+        )),
+        func.count(TKRTeamRegistration.id).filter(TKRTeamRegistration.payment_status.in_(
+            [PaymentStatus.UNPAID, PaymentStatus.PARTIAL]
+        )),
+        func.coalesce(func.sum(TKRTeamRegistration.payment_amount), 0.0)
+    ).filter(TKRTeamRegistration.tournament_id == tournament_id).one()
+
+    submission_counts = dict(db.query(
+        TKRGameSubmission.status, func.count(TKRGameSubmission.id)
+    ).filter(
+        TKRGameSubmission.tournament_id == tournament_id
+    ).group_by(TKRGameSubmission.status).all())
+
+    total_registrations, active_teams, completed_teams, paid_teams, unpaid_teams, amount_paid = registration_stats
+    quick_stats = {
+        "total_registrations": total_registrations,
+        "active_teams": active_teams,
+        "completed_teams": completed_teams,
+        "paid_teams": paid_teams,
+        "unpaid_teams": unpaid_teams,
+        "amount_paid": float(amount_paid),
+        "pending_submissions": submission_counts.get(SubmissionStatus.PENDING, 0),
+        "verified_submissions": submission_counts.get(SubmissionStatus.VERIFIED, 0),
+        "rejected_submissions": submission_counts.get(SubmissionStatus.REJECTED, 0),
+    }
+
+    prize_pool = None
+    if not since:
+        prize_pool = calculate_tkr_prize_pool(
+            db, tournament_id, tournament=tournament, config=config, registrations=registrations
+        )
+    elif registrations:
+        prize_pool = calculate_tkr_prize_pool(db, tournament_id, tournament=tournament, config=config)
+
+    for registration in registrations:
+        registration.time_window_status = submission_window_status(
+            registration.start_time, registration.end_time,
+            registration.submission_deadline, registration.submissions_closed_at, now
+        )[0]
+
+    return {
+        "tournament_id": tournament_id,
+        "server_time": now,
+        "since": since,
+        "config": config,
+        "registrations": registrations,
+        "recent_submissions": submissions,
+        "leaderboard": leaderboard,
+        "prize_pool": prize_pool,
+        "quick_stats": quick_stats,
+    }
+
 def get_tkr_game_submission(db: Session, submission_id: int) -> Optional[TKRGameSubmission]:
     """Get a single TKR game submission by ID"""
     return db.query(TKRGameSubmission).filter(
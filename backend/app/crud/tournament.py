@@ -1,8 +1,49 @@
 # app/crud/tournament.py - FIXED: Consistent payment field handling
 from sqlalchemy.orm import Session, joinedload
+from typing import Optional, List, Sequence
+from datetime import datetime, time
+from fastapi import HTTPException
+from sqlalchemy import text
 from app.models.tournament import Tournament, TournamentFormat, TournamentStatus
+from app.models.user import User
 from app.models import Match, Team
 from app.schemas.tournament import TournamentUpdate, TournamentCreate, TournamentBracketConfig
+from app.crud.pagination import paginate
+
+def _parse_clock(value: Optional[str], default: time) -> time:
+    try:
+        return datetime.strptime(value, '%H:%M').time() if value else default
+    except ValueError:
+        return default
+
+def compute_schedule(start_date, start_time, end_date, end_time):
+    """
+    Combine the stored date and 'HH:MM' pairs into (starts_at, ends_at).
+    A missing start time means midnight and a missing end time the end of
+    the day, matching how the auto-start service always read them.
+    """
+    starts_at = ends_at = None
+    if start_date:
+        starts_at = datetime.combine(start_date.date(), _parse_clock(start_time, time(0, 0)))
+    if end_date:
+        ends_at = datetime.combine(end_date.date(), _parse_clock(end_time, time(23, 59)))
+    return starts_at, ends_at
+
+def sync_schedule(db: Session, db_tournament: Tournament) -> None:
+    """Refresh starts_at/ends_at and tell the TKR scheduler once the change commits"""
+    db_tournament.starts_at, db_tournament.ends_at = compute_schedule(
+        db_tournament.start_date, db_tournament.start_time,
+        db_tournament.end_date, db_tournament.end_time
+    )
+    if db_tournament.format == TournamentFormat.TKR:
+        notify_schedule_changed(db, db_tournament.id)
+
+def notify_schedule_changed(db: Session, tournament_id: Optional[int]) -> None:
+    # NOTIFY is transactional: the scheduler only hears about committed changes
+    db.execute(
+        text("SELECT pg_notify('tkr_schedule', :payload)"),
+        {"payload": str(tournament_id or "")}
+    )
 
 def create_tournament(db: Session, tournament: TournamentCreate, creator_id: int) -> Tournament:
     """Create a new tournament with payment information"""
@@ -28,6 +69,8 @@ def create_tournament(db: Session, tournament: TournamentCreate, creator_id: int
     )
     
     db.add(db_tournament)
+    db.flush()
+    sync_schedule(db, db_tournament)
     db.commit()
     db.refresh(db_tournament)
     return db_tournament
@@ -38,12 +81,96 @@ def get_tournament(db: Session, tournament_id: int):
         .filter(Tournament.id == tournament_id)\
         .first()
 
-def get_tournaments(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Tournament)\
-        .options(joinedload(Tournament.creator))\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
+def get_tournaments(db: Session, skip: int = 0, limit: int = 100, cursor: Optional[str] = None):
+    """Newest tournaments first, ordered by (start_date, id) for stable paging"""
+    query = db.query(Tournament).options(joinedload(Tournament.creator))
+    return paginate(
+        query, Tournament.start_date, Tournament.id,
+        skip=skip, limit=limit, cursor=cursor, descending=True
+    ).all()
+
+# Columns a listing request may select. Long text fields (rules, description,
+# payment text) are opt-in so list pages only move what they render.
+LISTING_COLUMNS = {
+    "id": Tournament.id,
+    "name": Tournament.name,
+    "format": Tournament.format,
+    "status": Tournament.status,
+    "start_date": Tournament.start_date,
+    "start_time": Tournament.start_time,
+    "end_date": Tournament.end_date,
+    "end_time": Tournament.end_time,
+    "team_size": Tournament.team_size,
+    "max_teams": Tournament.max_teams,
+    "current_teams": Tournament.current_teams,
+    "creator_id": Tournament.creator_id,
+    "creator_username": User.username,
+    "entry_fee": Tournament.entry_fee,
+    "game": Tournament.game,
+    "game_mode": Tournament.game_mode,
+    "description": Tournament.description,
+    "rules": Tournament.rules,
+    "payment_methods": Tournament.payment_methods,
+    "payment_details": Tournament.payment_details,
+    "payment_instructions": Tournament.payment_instructions,
+}
+
+# Fields rendered by TournamentCard / HomeTournamentCard
+CARD_FIELDS = (
+    "id", "name", "format", "start_date", "start_time", "status", "team_size",
+    "max_teams", "current_teams", "creator_id", "creator_username",
+    "entry_fee", "game", "game_mode",
+)
+
+def get_tournament_listing(
+    db: Session,
+    fields: Sequence[str] = CARD_FIELDS,
+    statuses: Optional[List[TournamentStatus]] = None,
+    formats: Optional[List[TournamentFormat]] = None,
+    host_id: Optional[int] = None,
+    start_from: Optional[datetime] = None,
+    start_to: Optional[datetime] = None,
+    game: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    descending: bool = True
+):
+    """
+    Filtered tournament listing that selects only the requested columns.
+    id and start_date are always selected since the cursor is built from them.
+    Returns SQLAlchemy rows addressable by field name.
+    """
+    unknown = [field for field in fields if field not in LISTING_COLUMNS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown tournament fields: {', '.join(unknown)}"
+        )
+
+    selected = ["id", "start_date"] + [f for f in fields if f not in ("id", "start_date")]
+    query = db.query(*[LISTING_COLUMNS[field].label(field) for field in selected])\
+        .select_from(Tournament)
+
+    if "creator_username" in selected:
+        query = query.outerjoin(User, User.id == Tournament.creator_id)
+    if statuses:
+        query = query.filter(Tournament.status.in_(statuses))
+    if formats:
+        query = query.filter(Tournament.format.in_(formats))
+    if host_id is not None:
+        query = query.filter(Tournament.creator_id == host_id)
+    if start_from is not None:
+        query = query.filter(Tournament.start_date >= start_from)
+    if start_to is not None:
+        query = query.filter(Tournament.start_date <= start_to)
+    if game:
+        query = query.filter(Tournament.game == game)
+
+    return paginate(
+        query, Tournament.start_date, Tournament.id,
+        skip=skip, limit=limit, cursor=cursor, descending=descending
+    ).all()
 
 def update_tournament(db: Session, tournament_id: int, tournament_update: TournamentUpdate):
     """Update tournament details including payment information"""
@@ -64,6 +191,9 @@ def update_tournament(db: Session, tournament_id: int, tournament_update: Tourna
         elif hasattr(update_data['bracket_config'], 'dict'):
             update_data['bracket_config'] = update_data['bracket_config'].dict()
     
+    if update_data.keys() & {'start_date', 'start_time', 'end_date', 'end_time', 'status', 'format'}:
+        sync_schedule(db, db_tournament)
+    
     db.commit()
     db.refresh(db_tournament)
     return db_tournament
@@ -2,12 +2,17 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import or_
 from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional, List
 from app.models.user import User, UserRole
 from app.models.host_profile import HostProfile
 from app.schemas.user import UserCreate, UserUpdate
 from app.schemas.host_profile import HostProfileCreate
-from app.core.security import get_password_hash, verify_password
+from app.core.security import (
+    get_password_hash, verify_and_update_password, verify_and_update_password_async
+)
+from app.core.auth_cache import PrincipalCache
+from app.crud.pagination import paginate
 
 def get_user(db: Session, user_id: int) -> Optional[User]:
     return db.query(User).filter(User.id == user_id).first()
@@ -20,7 +25,8 @@ def get_users(
     skip: int = 0,
     limit: int = 100,
     role: Optional[UserRole] = None,
-    include_inactive: bool = False
+    include_inactive: bool = False,
+    cursor: Optional[str] = None
 ) -> List[User]:
     query = db.query(User)
     
@@ -30,7 +36,11 @@ def get_users(
     if not include_inactive:
         query = query.filter(User.is_active == True)
     
-    return query.offset(skip).limit(limit).all()
+    # Ordered by (created_at, id) so cursor and offset pages agree
+    return paginate(
+        query, User.created_at, User.id,
+        skip=skip, limit=limit, cursor=cursor
+    ).all()
 
 def create_user(db: Session, user: UserCreate) -> User:
     hashed_password = get_password_hash(user.password)
@@ -74,6 +84,7 @@ def update_user(db: Session, user_id: int, user_update: UserUpdate) -> Optional[
     
     db.commit()
     db.refresh(db_user)
+    PrincipalCache.invalidate_user(user_id)
     return db_user
 
 def create_host_profile_for_user(db: Session, user: User) -> HostProfile:
@@ -126,6 +137,7 @@ def update_user_role(
     db_user.role = new_role
     db.commit()
     db.refresh(db_user)
+    PrincipalCache.invalidate_user(user_id)
     
     # Auto-create host profile if promoting to HOST
     if new_role == UserRole.HOST and old_role != UserRole.HOST:
@@ -162,18 +174,22 @@ def toggle_user_active_status(
     db_user.is_active = not db_user.is_active
     db.commit()
     db.refresh(db_user)
+    PrincipalCache.invalidate_user(user_id)
     return db_user
 
-def authenticate_user(db: Session, email_or_username: str, password: str) -> Optional[User]:
-    user = db.query(User).filter(
+def get_user_by_login(db: Session, email_or_username: str) -> Optional[User]:
+    return db.query(User).filter(
         or_(
             User.email == email_or_username,
             User.username == email_or_username
         )
     ).first()
-    
-    if not user or not verify_password(password, user.hashed_password):
-        return None
+
+def _finish_authentication(db: Session, user: User, new_hash: Optional[str]) -> User:
+    # Transparently upgrade hashes made with an older scheme or cost
+    if new_hash:
+        user.hashed_password = new_hash
+        db.commit()
     
     if not user.is_active:
         raise HTTPException(
@@ -181,4 +197,27 @@ def authenticate_user(db: Session, email_or_username: str, password: str) -> Opt
             detail="This account has been deactivated"
         )
     
-    return user
\ No newline at end of file
+    return user
+
+def authenticate_user(db: Session, email_or_username: str, password: str) -> Optional[User]:
+    user = get_user_by_login(db, email_or_username)
+    if not user:
+        return None
+    
+    verified, new_hash = verify_and_update_password(password, user.hashed_password)
+    if not verified:
+        return None
+    
+    return _finish_authentication(db, user, new_hash)
+
+async def authenticate_user_async(db: Session, email_or_username: str, password: str) -> Optional[User]:
+    """authenticate_user for async routes: queries run in the threadpool, hashing in the hash pool"""
+    user = await run_in_threadpool(get_user_by_login, db, email_or_username)
+    if not user:
+        return None
+    
+    verified, new_hash = await verify_and_update_password_async(password, user.hashed_password)
+    if not verified:
+        return None
+    
+    return await run_in_threadpool(_finish_authentication, db, user, new_hash)
\ No newline at end of file
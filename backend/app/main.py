@@ -1,13 +1,23 @@
 # app/main.py - Minimal update to add TKR auto-start
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import logging
 import atexit
+from sqlalchemy import text
 
 from .api.v1.api import api_router
 from .core.config import settings
+from .core.responses import ORJSONResponse
+from .core.compression import CompressionMiddleware
+from .core.logging_config import AccessLogMiddleware, configure_logging
+from .services.email_outbox import EmailOutboxWorker
+from .services.leader_election import LeaderElection
+from .services.tkr_auto_start import run_tkr_auto_start_check
+from .services.tkr_scheduler import TKRScheduler
 from .db.database import engine, Base
+from .ml import player_ranking_prediction
 
 # Import all models to ensure they're registered
 from app.models import (
@@ -15,75 +25,65 @@ from app.models import (
     HostProfile, UserSocialLink  # Add new models
 )
 
-# TKR Auto-start imports
-try:
-    from apscheduler.schedulers.background import BackgroundScheduler
-    from app.services.tkr_auto_start import run_tkr_auto_start_check
-    SCHEDULER_AVAILABLE = True
-except ImportError:
-    SCHEDULER_AVAILABLE = False
-    print("APScheduler not installed. TKR auto-start disabled. Install with: pip install apscheduler")
-
-logging.basicConfig(level=logging.INFO)
+configure_logging()
 logger = logging.getLogger(__name__)
 
-# Global scheduler variable
-scheduler = None
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan events"""
-    global scheduler
-    
     # Startup
     logger.info("Starting up Tournament Hub API...")
     
-    # Create database tables
+    # Create database tables. The search indexes use gin_trgm_ops, so pg_trgm
+    # must exist first (normally installed by the search indexes migration)
+    with engine.begin() as connection:
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
     Base.metadata.create_all(bind=engine)
     
-    # Start TKR auto-start scheduler if available
-    if SCHEDULER_AVAILABLE:
-        try:
-            scheduler = BackgroundScheduler()
-            scheduler.add_job(
-                func=run_tkr_auto_start_check,
-                trigger="interval",
-                minutes=1,  # Check every minute
-                id='tkr_auto_start',
-                max_instances=1,
-                coalesce=True,
-                misfire_grace_time=30
-            )
-            scheduler.start()
-            logger.info("TKR auto-start scheduler initialized")
-        except Exception as e:
-            logger.error(f"Failed to start TKR scheduler: {e}")
+    if settings.EMAIL_OUTBOX_ENABLED:
+        EmailOutboxWorker.start()
+    
+    # Memory-maps the trained weights once; predictions reuse them
+    if player_ranking_prediction.ModelStore.load() is None:
+        logger.info("No player ranking model; predictions fall back to the previous ranking")
+    
+    # Every worker joins the election; only the leader runs the registered jobs
+    if settings.TKR_SCHEDULER_ENABLED:
+        LeaderElection.register("tkr_scheduler", TKRScheduler)
     else:
-        logger.info("TKR auto-start scheduler disabled (APScheduler not available)")
+        logger.info("TKR scheduler disabled")
+    LeaderElection.start()
     
     yield
     
     # Shutdown
     logger.info("Shutting down Tournament Hub API...")
-    if scheduler and scheduler.running:
-        scheduler.shutdown()
-        logger.info("TKR auto-start scheduler stopped")
+    EmailOutboxWorker.stop()
+    LeaderElection.stop()
 
 # Create FastAPI app with lifespan management
 app = FastAPI(
     title=settings.PROJECT_NAME, 
     version=settings.VERSION,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# Add middleware to log requests
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    logger.info(f"Incoming request: {request.method} {request.url}")
-    logger.info(f"Origin: {request.headers.get('origin')}")
-    response = await call_next(request)
-    logger.info(f"Response status: {response.status_code}")
-    return response
+# Sampled structured access log
+if settings.ACCESS_LOG_ENABLED:
+    app.add_middleware(
+        AccessLogMiddleware,
+        sample_rate=settings.ACCESS_LOG_SAMPLE_RATE,
+        slow_ms=settings.ACCESS_LOG_SLOW_MS
+    )
+
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.GZIP_COMPRESSLEVEL,
+        brotli_quality=settings.BROTLI_QUALITY
+    )
 
 # Your existing CORS middleware
 app.add_middleware(
@@ -108,55 +108,45 @@ app.include_router(api_router, prefix="/api/v1")
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    scheduler_status = "running" if scheduler and scheduler.running else "stopped" if SCHEDULER_AVAILABLE else "disabled"
+    scheduler_status = "running" if LeaderElection.running() else "stopped"
     return {
         "status": "healthy",
-        "scheduler_status": scheduler_status
+        "scheduler_status": scheduler_status,
+        "is_leader": LeaderElection.is_leader()
     }
 
-# Optional admin endpoints for monitoring (only if scheduler available)
-if SCHEDULER_AVAILABLE:
-    @app.get("/admin/scheduler/status")
-    async def get_scheduler_status():
-        """Get scheduler status"""
-        if not scheduler:
-            return {"status": "not_initialized"}
-        
-        jobs = []
-        for job in scheduler.get_jobs():
-            jobs.append({
-                "id": job.id,
-                "next_run": job.next_run_time.isoformat() if job.next_run_time else None,
-            })
-        
-        return {
-            "status": "running" if scheduler.running else "stopped",
-            "jobs": jobs
-        }
-
-    @app.post("/admin/scheduler/run-now")
-    async def run_scheduler_now():
-        """Manually trigger TKR check"""
-        try:
-            result = run_tkr_auto_start_check()
-            return {"success": True, "result": result}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+# Admin endpoints for monitoring the TKR scheduler
+@app.get("/admin/scheduler/status")
+async def get_scheduler_status():
+    """Get the elected leader and, when this worker leads, its job state"""
+    status = await run_in_threadpool(LeaderElection.status)
+    if settings.TKR_SCHEDULER_ENABLED and LeaderElection.is_leader():
+        status["tkr_scheduler"] = TKRScheduler.status()
+    return status
+
+@app.post("/admin/scheduler/run-now")
+async def run_scheduler_now():
+    """Manually trigger TKR check"""
+    try:
+        result = run_tkr_auto_start_check()
+        TKRScheduler.wake()
+        return {"success": True, "result": result}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
 
 @app.get("/")
 def root():
     return {
         "message": "Welcome to the Warzone Tournament Hub API",
-        "scheduler_enabled": SCHEDULER_AVAILABLE
+        "scheduler_enabled": settings.TKR_SCHEDULER_ENABLED
     }
 
 # Graceful shutdown handler
 def shutdown_handler():
     """Handle graceful shutdown"""
-    global scheduler
-    if scheduler and scheduler.running:
+    if LeaderElection.running():
         logger.info("Gracefully shutting down scheduler...")
-        scheduler.shutdown(wait=True)
+        LeaderElection.stop()
 
 # Register shutdown handler
 atexit.register(shutdown_handler)
\ No newline at end of file
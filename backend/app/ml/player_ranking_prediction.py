@@ -0,0 +1,216 @@
+# app/ml/player_ranking_prediction.py - Ridge regression from submitted player stats to ladder rank
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Fields of the ranking form the model reads (see PlayerRankingForm)
+INPUTS = ("previous_ranking", "kd_ratio", "total_kills", "total_time_played", "wins", "score_per_min")
+
+# Columns of the design matrix built from INPUTS; the weights file follows this order
+FEATURES = (
+    "log_previous_ranking", "is_ranked", "kd_ratio",
+    "log_kills_per_hour", "log_wins_per_hour", "score_per_min", "log_hours_played"
+)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def model_path() -> str:
+    path = settings.PLAYER_RANKING_MODEL_PATH
+    return path if os.path.isabs(path) else os.path.join(BACKEND_DIR, path)
+
+def metadata_path(weights_path: str) -> str:
+    return os.path.splitext(weights_path)[0] + ".json"
+
+def feature_matrix(rows: Sequence[Mapping[str, Any]]) -> np.ndarray:
+    """Design matrix for a batch of form submissions, one row each"""
+    raw = np.array(
+        [[float(row.get(field) or 0) for field in INPUTS] for row in rows],
+        dtype=np.float64
+    ).reshape(len(rows), len(INPUTS))
+    previous, kd_ratio, kills, minutes, wins, score_per_min = raw.T
+    hours = np.maximum(minutes / 60.0, 1.0)
+    ranked = previous > 0
+    return np.column_stack([
+        np.where(ranked, np.log(np.maximum(previous, 1.0)), 0.0),
+        ranked.astype(np.float64),
+        kd_ratio,
+        np.log1p(kills / hours),
+        np.log1p(wins / hours),
+        score_per_min,
+        np.log1p(hours),
+    ])
+
+def fit_ridge(features: np.ndarray, targets: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Closed-form ridge regression on standardized features. Returns one
+    vector [w_1 .. w_n, bias] with the standardization folded in, so
+    prediction is a single matrix-vector product.
+    """
+    mean = features.mean(axis=0)
+    scale = features.std(axis=0)
+    scale[scale == 0] = 1.0
+    standardized = (features - mean) / scale
+    target_mean = targets.mean()
+
+    gram = standardized.T @ standardized + alpha * np.eye(features.shape[1])
+    coef = np.linalg.solve(gram, standardized.T @ (targets - target_mean))
+
+    weights = coef / scale
+    bias = target_mean - float(mean @ weights)
+    return np.append(weights, bias)
+
+class RankingModel:
+    """Weights (usually a read-only memory map) plus the training metadata"""
+    __slots__ = ("weights", "metadata")
+
+    def __init__(self, weights: np.ndarray, metadata: Dict[str, Any]):
+        self.weights = weights
+        self.metadata = metadata
+
+    def predict_log_rank(self, features: np.ndarray) -> np.ndarray:
+        return features @ self.weights[:-1] + self.weights[-1]
+
+    def to_ranks(self, log_ranks: np.ndarray) -> np.ndarray:
+        max_rank = self.metadata.get("max_rank") or None
+        return np.clip(np.rint(np.exp(log_ranks)), 1, max_rank).astype(np.int64)
+
+class ModelStore:
+    """
+    The process-wide model. Loaded at startup with the weights memory-mapped
+    (np.load mmap_mode="r"), so every worker shares the same page-cache copy.
+    A newer artifact on disk, e.g. written by training in another worker, is
+    picked up on the next prediction; checking costs one stat() call.
+    """
+    _model: Optional[RankingModel] = None
+    _mtime: Optional[float] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def load(cls) -> Optional[RankingModel]:
+        path = model_path()
+        try:
+            mtime = os.stat(path).st_mtime
+        except FileNotFoundError:
+            cls._model, cls._mtime = None, None
+            return None
+        if mtime == cls._mtime:
+            return cls._model
+
+        with cls._lock:
+            if mtime == cls._mtime:
+                return cls._model
+            try:
+                weights = np.load(path, mmap_mode="r")
+                with open(metadata_path(path)) as f:
+                    metadata = json.load(f)
+                if weights.shape != (len(FEATURES) + 1,) or tuple(metadata.get("features", ())) != FEATURES:
+                    raise ValueError("artifact does not match the current feature set")
+            except (OSError, ValueError) as e:
+                logger.warning("Ignoring player ranking model at %s: %s", path, e)
+                cls._model, cls._mtime = None, mtime
+                return None
+            cls._model, cls._mtime = RankingModel(weights, metadata), mtime
+            logger.info("Loaded player ranking model trained %s on %s samples",
+                        metadata.get("trained_at"), metadata.get("samples"))
+            return cls._model
+
+    @classmethod
+    def current(cls) -> Optional[RankingModel]:
+        return cls.load()
+
+def predict_many(rows: Sequence[Mapping[str, Any]]) -> List[Optional[int]]:
+    """
+    Predicted ranks for a batch of submissions in one vectorized pass.
+    Without a trained model each player keeps their previous ranking
+    (None when unranked).
+    """
+    if not rows:
+        return []
+    model = ModelStore.current()
+    if model is None:
+        return [int(row.get("previous_ranking") or 0) or None for row in rows]
+    ranks = model.to_ranks(model.predict_log_rank(feature_matrix(rows)))
+    return [int(rank) for rank in ranks]
+
+def predict(row: Mapping[str, Any]) -> Optional[int]:
+    return predict_many([row])[0]
+
+def rerank(current_ranks: Sequence[int], stats: Sequence[Optional[Mapping[str, Any]]]) -> Optional[List[int]]:
+    """
+    New ladder positions (1..n) for the whole ladder from one predict call.
+    Players without submitted stats are placed by their current rank on the
+    same log scale. Returns None without a trained model.
+    """
+    model = ModelStore.current()
+    if model is None:
+        return None
+    scores = np.log(np.maximum(np.asarray(current_ranks, dtype=np.float64), 1.0))
+    with_stats = [i for i, row in enumerate(stats) if row is not None]
+    if with_stats:
+        scores[with_stats] = model.predict_log_rank(feature_matrix([stats[i] for i in with_stats]))
+    # Stable sort keeps the existing order between equal scores
+    order = np.argsort(scores, kind="stable")
+    positions = np.empty(len(order), dtype=np.int64)
+    positions[order] = np.arange(1, len(order) + 1)
+    return positions.tolist()
+
+def train(rows: Sequence[Mapping[str, Any]], ranks: Sequence[int]) -> Dict[str, Any]:
+    """
+    Fit on (submission, current ladder rank) pairs, write the artifact
+    atomically and load it. Returns the metadata written next to it.
+    """
+    if len(rows) < settings.PLAYER_RANKING_MIN_SAMPLES:
+        raise ValueError(
+            f"Need at least {settings.PLAYER_RANKING_MIN_SAMPLES} ranked submissions to train "
+            f"(have {len(rows)})"
+        )
+    features = feature_matrix(rows)
+    targets = np.log(np.maximum(np.asarray(ranks, dtype=np.float64), 1.0))
+    weights = fit_ridge(features, targets, settings.PLAYER_RANKING_RIDGE_ALPHA)
+
+    residuals = features @ weights[:-1] + weights[-1] - targets
+    fitted_ranks = np.clip(np.rint(np.exp(targets + residuals)), 1, None)
+    metadata = {
+        "features": list(FEATURES),
+        "samples": len(rows),
+        "alpha": settings.PLAYER_RANKING_RIDGE_ALPHA,
+        "max_rank": int(max(ranks)),
+        "rmse_log_rank": float(np.sqrt(np.mean(residuals ** 2))),
+        "mean_abs_rank_error": float(np.mean(np.abs(fitted_ranks - np.asarray(ranks)))),
+        "trained_at": datetime.utcnow().isoformat(),
+    }
+
+    path = model_path()
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    # Metadata first: a reader that sees the new weights also sees matching metadata
+    for target, write in (
+        (metadata_path(path), lambda f: f.write(json.dumps(metadata, indent=2).encode())),
+        (path, lambda f: np.save(f, weights)),
+    ):
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp, target)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    ModelStore.load()
+    return metadata
+
+def model_info() -> Dict[str, Any]:
+    model = ModelStore.current()
+    return {"trained": model is not None, **(dict(model.metadata) if model else {})}
@@ -7,13 +7,17 @@ from .match import Match
 from .leaderboard import LeaderboardEntry
 from .associations import team_player
 from .losers_match import LosersMatch
-from .player_ranking import PlayerRanking
+from .player_ranking import PlayerRanking, PlayerRankingSubmission
 from .host_profile import HostProfile
 from .host_application import ApplicationStatus, HostApplication
 from .activity_log import ActivityLog, ActivityType
 from .system_health import SystemHealth, MetricType
 from .user_social_links import SocialPlatform, UserSocialLink
-from .tkr import TKRTeamSize, PaymentStatus, SubmissionStatus, TKRTournamentConfig, TKRTeamRegistration, TKRGameSubmission, TKRLeaderboard, TKRTemplate
+from .tkr import TKRTeamSize, PaymentStatus, SubmissionStatus, TKRTournamentConfig, TKRTeamRegistration, TKRGameSubmission, TKRLeaderboard, TKRTemplate, TKRSubmissionStats, TKRRosterPlayer
+from .rate_limit import RateLimitBucket
+from .email_outbox import EmailStatus, EmailOutbox
+from .leader_lease import LeaderLease
+from .stats import StatsSubject, StatsRollup
 
 # Export enums directly for easier access
 __all__ = [
@@ -29,6 +33,7 @@ __all__ = [
     'team_player',
     'LosersMatch',
     'PlayerRanking',
+    'PlayerRankingSubmission',
     'ActivityLog',
     'ActivityType',
     'SystemHealth',
@@ -43,7 +48,15 @@ __all__ = [
     'TKRGameSubmission',
     'TKRLeaderboard',
     'TKRTemplate',
+    'TKRSubmissionStats',
+    'TKRRosterPlayer',
     'TKRTeamSize',
     'PaymentStatus',
-    'SubmissionStatus'
+    'SubmissionStatus',
+    'RateLimitBucket',
+    'EmailStatus',
+    'EmailOutbox',
+    'LeaderLease',
+    'StatsSubject',
+    'StatsRollup'
 ]
\ No newline at end of file
@@ -1,3 +1,16 @@
+from sqlalchemy import Index, func
 from sqlalchemy.ext.declarative import declarative_base
 
-Base = declarative_base()
\ No newline at end of file
+Base = declarative_base()
+
+def search_indexes(stem: str, column):
+    """
+    The two indexes app.crud.search relies on for `column`: trigram (GIN) for
+    fuzzy and substring matches, text_pattern_ops btree for short prefixes
+    """
+    return (
+        Index(f'{stem}_trgm', func.lower(column).label('search_key'),
+              postgresql_using='gin', postgresql_ops={'search_key': 'gin_trgm_ops'}),
+        Index(f'{stem}_prefix', func.lower(column).label('search_key'),
+              postgresql_ops={'search_key': 'text_pattern_ops'}),
+    )
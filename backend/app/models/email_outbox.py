@@ -0,0 +1,31 @@
+# app/models/email_outbox.py
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, Index
+from datetime import datetime
+import enum
+from app.models.base import Base
+
+class EmailStatus(str, enum.Enum):
+    PENDING = "PENDING"
+    SENT = "SENT"
+    FAILED = "FAILED"
+
+class EmailOutbox(Base):
+    """Outbound email, written by request handlers and delivered by the outbox worker"""
+    __tablename__ = "email_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    to_address = Column(String, nullable=False)  # comma-separated for multiple recipients
+    subject = Column(String, nullable=False)
+    html_body = Column(Text, nullable=True)
+    text_body = Column(Text, nullable=True)
+
+    status = Column(Enum(EmailStatus), default=EmailStatus.PENDING, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+    next_attempt_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime, nullable=True)
+
+    # The worker claims due PENDING rows in next_attempt_at order
+    __table_args__ = (Index('ix_email_outbox_status_next_attempt_at', 'status', 'next_attempt_at'),)
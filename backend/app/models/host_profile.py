@@ -1,7 +1,7 @@
 # app/models/host_profile.py
 from sqlalchemy import Column, Integer, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from app.models.base import Base
+from app.models.base import Base, search_indexes
 
 class HostProfile(Base):
     __tablename__ = "host_profiles"
@@ -28,4 +28,7 @@ class HostProfile(Base):
     user = relationship("User", back_populates="host_profile", uselist=False)
     
     # Index for efficient lookups
-    __table_args__ = (Index('idx_host_user_id', 'user_id'),)
\ No newline at end of file
+    __table_args__ = (
+        Index('idx_host_user_id', 'user_id'),
+        *search_indexes('ix_host_profiles_organization_name', organization_name),
+    )
\ No newline at end of file
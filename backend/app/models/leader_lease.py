@@ -0,0 +1,15 @@
+# app/models/leader_lease.py
+from sqlalchemy import Column, String, DateTime
+from app.models.base import Base
+
+class LeaderLease(Base):
+    """
+    Who currently leads an election (see app.services.leader_election).
+    The advisory lock decides leadership; this row only makes it visible.
+    """
+    __tablename__ = "leader_leases"
+
+    name = Column(String(100), primary_key=True)
+    holder = Column(String(255), nullable=False)  # "hostname:pid" of the leader
+    acquired_at = Column(DateTime(timezone=True), nullable=False)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=False)
@@ -1,6 +1,7 @@
 # app/models/player_ranking.py
-from sqlalchemy import Column, Integer, String
-from app.models.base import Base
+from sqlalchemy import Column, Integer, String, Float, DateTime, Index, func
+from app.models.base import Base, search_indexes
+from datetime import datetime
 
 class PlayerRanking(Base):
     __tablename__ = "player_rankings"
@@ -8,4 +9,34 @@ class PlayerRanking(Base):
     id = Column(Integer, primary_key=True, index=True)
     player_name = Column(String, index=True)
     twitter_handle = Column(String, index=True)
-    rank = Column(Integer, index=True)
\ No newline at end of file
+    rank = Column(Integer, index=True)
+
+    # Keyset pagination walks (rank, id)
+    __table_args__ = (
+        Index('ix_player_rankings_rank_id', 'rank', 'id'),
+        *search_indexes('ix_player_rankings_name', player_name),
+    )
+
+class PlayerRankingSubmission(Base):
+    """Stats sent through the ranking form; training data for the prediction model"""
+    __tablename__ = "player_ranking_submissions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    player_name = Column(String, nullable=False)
+    twitter_handle = Column(String, nullable=False)
+    previous_ranking = Column(Integer, nullable=False, default=0)  # 0 = unranked
+    stream_link = Column(String, nullable=True)
+    kd_ratio = Column(Float, nullable=False)
+    total_kills = Column(Integer, nullable=False)
+    total_time_played = Column(Integer, nullable=False)  # minutes
+    wins = Column(Integer, nullable=False)
+    score_per_min = Column(Float, nullable=False)
+
+    # What the model said at submission time
+    predicted_rank = Column(Integer, nullable=True)
+    submitted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Training and re-ranking read each handle's latest submission
+    __table_args__ = (
+        Index('ix_player_ranking_submissions_handle_submitted', func.lower(twitter_handle), submitted_at.desc()),
+    )
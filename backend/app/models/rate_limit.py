@@ -0,0 +1,17 @@
+# app/models/rate_limit.py
+from sqlalchemy import Column, String, Float, Boolean, DateTime, Index
+from app.models.base import Base
+
+class RateLimitBucket(Base):
+    """Token bucket state shared by every worker (see app.core.rate_limit)"""
+    __tablename__ = "rate_limit_buckets"
+
+    key = Column(String(255), primary_key=True)
+    tokens = Column(Float, nullable=False)
+    # Outcome of the most recent hit, returned by the upsert
+    allowed = Column(Boolean, nullable=False, default=True)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    # When the bucket will be full again; rows past this carry no state
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (Index('ix_rate_limit_buckets_expires_at', 'expires_at'),)
@@ -0,0 +1,59 @@
+# app/models/stats.py - Cross-tournament player and team stats
+from sqlalchemy import Column, Integer, String, Float, DateTime, Index, UniqueConstraint
+from app.models.base import Base
+from datetime import datetime
+
+class StatsSubject:
+    PLAYER = "player"
+    TEAM = "team"
+
+class StatsRollup(Base):
+    """
+    Running totals for one player handle or team name in one bucket.
+
+    A bucket is (game, map_name, season); an empty string means "all", so
+    ("", "", "") is the career row. Rows are maintained incrementally by
+    crud.stats as TKR submissions are verified and bracket matches complete.
+    """
+    __tablename__ = "stats_rollups"
+
+    id = Column(Integer, primary_key=True, index=True)
+    subject_type = Column(String(10), nullable=False)
+    # Normalized (lowercased, single-spaced) handle or team name
+    subject_key = Column(String, nullable=False)
+    display_name = Column(String, nullable=False)
+
+    game = Column(String, nullable=False, default="")
+    map_name = Column(String, nullable=False, default="")
+    season = Column(String(10), nullable=False, default="")
+
+    # TKR games
+    games_played = Column(Integer, nullable=False, default=0)
+    kills = Column(Integer, nullable=False, default=0)
+    total_score = Column(Float, nullable=False, default=0.0)
+    best_game_score = Column(Float, nullable=True)
+    placement_total = Column(Integer, nullable=False, default=0)
+    first_places = Column(Integer, nullable=False, default=0)
+
+    # Bracket matches
+    matches_won = Column(Integer, nullable=False, default=0)
+    matches_lost = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint(
+            'subject_type', 'subject_key', 'game', 'map_name', 'season',
+            name='uq_stats_rollups_bucket'
+        ),
+        # Leaderboards read one bucket ordered by score
+        Index('ix_stats_rollups_board', 'subject_type', 'game', 'map_name', 'season', 'total_score'),
+    )
+
+    @property
+    def average_kills(self):
+        return self.kills / self.games_played if self.games_played else None
+
+    @property
+    def average_placement(self):
+        return self.placement_total / self.games_played if self.games_played else None
@@ -1,7 +1,7 @@
 # app/models/team.py - Fixed version without relationship conflicts
 from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
 from sqlalchemy.orm import relationship
-from app.models.base import Base
+from app.models.base import Base, search_indexes
 from datetime import datetime
 
 class Team(Base):
@@ -11,7 +11,7 @@ class Team(Base):
     name = Column(String, index=True)
     tournament_id = Column(Integer, ForeignKey("tournaments.id"))
     seed = Column(Integer, nullable=True)  # For bracket seeding
-    creator_id = Column(Integer, ForeignKey("users.id"), nullable=True)  # NEW: Track team creator
+    creator_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)  # NEW: Track team creator
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -33,4 +33,7 @@ class Team(Base):
     # losers_matches_as_team2 = relationship("LosersMatch", foreign_keys="LosersMatch.team2_id", back_populates="team2")
     
     # TKR relationships - Keep these for your TKR functionality
-    tkr_registrations = relationship("TKRTeamRegistration", back_populates="team")
\ No newline at end of file
+    tkr_registrations = relationship("TKRTeamRegistration", back_populates="team")
+
+    # Name search (app.crud.search)
+    __table_args__ = search_indexes('ix_teams_name', name)
@@ -1,5 +1,5 @@
 # app/models/tkr.py - FIXED VERSION
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, JSON, Boolean, Text, Float, Enum
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, JSON, Boolean, Text, Float, Enum, Index, UniqueConstraint, text
 from sqlalchemy.orm import relationship
 from app.models.base import Base
 from datetime import datetime
@@ -44,6 +44,8 @@ class TKRTournamentConfig(Base):
     placement_multipliers = Column(JSON, nullable=False)
     bonus_point_thresholds = Column(JSON, nullable=True)
     max_points_per_map = Column(Integer, nullable=True)
+    # Bumped whenever the scoring fields change; keys the compiled scorer cache
+    scoring_version = Column(Integer, nullable=False, default=1)
     
     # Prize pool configuration
     host_percentage = Column(Float, default=0.0)
@@ -60,18 +62,22 @@ class TKRTeamRegistration(Base):
     id = Column(Integer, primary_key=True, index=True)
     tournament_id = Column(Integer, ForeignKey("tournaments.id"), nullable=False)
     config_id = Column(Integer, ForeignKey("tkr_tournament_configs.id"), nullable=False)
-    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False, index=True)
     
     # Team information
     team_name = Column(String, nullable=False)
     team_rank = Column(Integer, nullable=False)
     
-    # Player information (JSON array)
+    # Player information (JSON array); mirrored row-per-player in tkr_roster_players
     players = Column(JSON, nullable=False)
     
     # Tournament timing
     start_time = Column(DateTime, nullable=False)
     end_time = Column(DateTime, nullable=True)
+    # end_time plus the grace period; set whenever the window changes
+    submission_deadline = Column(DateTime, nullable=True)
+    # Set by the scheduler once the deadline passes
+    submissions_closed_at = Column(DateTime, nullable=True)
     
     # Entry and payment information
     is_rerunning = Column(Boolean, default=False)
@@ -93,6 +99,50 @@ class TKRTeamRegistration(Base):
     tournament_config = relationship("TKRTournamentConfig", back_populates="team_registrations")
     team = relationship("Team")
     game_submissions = relationship("TKRGameSubmission", back_populates="team_registration")
+    roster = relationship(
+        "TKRRosterPlayer", back_populates="registration",
+        cascade="all, delete-orphan", order_by="TKRRosterPlayer.position"
+    )
+
+    # The closing job only ever scans windows that are still open
+    __table_args__ = (
+        Index(
+            'ix_tkr_team_registrations_open_deadline', 'submission_deadline',
+            postgresql_where=text('submissions_closed_at IS NULL')
+        ),
+    )
+
+class TKRRosterPlayer(Base):
+    """
+    One player of a registration, written alongside the players JSON so
+    handle lookups are index scans instead of parsing every roster.
+    """
+    __tablename__ = "tkr_roster_players"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    registration_id = Column(
+        Integer, ForeignKey("tkr_team_registrations.id", ondelete="CASCADE"), nullable=False
+    )
+    tournament_id = Column(Integer, ForeignKey("tournaments.id"), nullable=False)
+    
+    # Normalized (lowercased, single-spaced) activision handle; player_name keeps the casing
+    handle = Column(String, nullable=False)
+    player_name = Column(String, nullable=False)
+    rank = Column(Integer, nullable=True)
+    stream = Column(String, nullable=True)
+    position = Column(Integer, nullable=False, default=0)
+    using_free_entry = Column(Boolean, nullable=False, default=False)
+    
+    # Relationships
+    registration = relationship("TKRTeamRegistration", back_populates="roster")
+    
+    __table_args__ = (
+        UniqueConstraint('registration_id', 'handle', name='uq_tkr_roster_players_registration_handle'),
+        # "Is this player already in the tournament?" at registration time
+        Index('ix_tkr_roster_players_tournament_handle', 'tournament_id', 'handle'),
+        # Every registration a player has been part of
+        Index('ix_tkr_roster_players_handle', 'handle'),
+    )
 
 class TKRGameSubmission(Base):
     __tablename__ = "tkr_game_submissions"
@@ -123,11 +173,54 @@ class TKRGameSubmission(Base):
     # Timestamps
     submitted_at = Column(DateTime, default=datetime.utcnow)
     verified_at = Column(DateTime, nullable=True)
+    # Any change, including host edits of scored rows; drives incremental dashboard polls
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # md5 of the normalized (vod_url, timestamp); unique per team among non-rejected rows
+    fingerprint = Column(String(32), nullable=True)
+    # Largest |z| against the tournament's distribution when submitted, plus reasons
+    anomaly_score = Column(Float, nullable=True)
+    anomaly_flags = Column(JSON, nullable=True)
+    
+    # Verification queue claim; expired claims can be taken by another moderator
+    claimed_by = Column(Integer, ForeignKey("users.id"), nullable=True)
+    claimed_until = Column(DateTime, nullable=True)
     
     # Relationships
     tournament = relationship("Tournament")
     team_registration = relationship("TKRTeamRegistration", back_populates="game_submissions")
-    verified_by_user = relationship("User")
+    verified_by_user = relationship("User", foreign_keys=[verified_by])
+
+    __table_args__ = (
+        # Keyset pagination of a tournament's submissions walks (submitted_at, id)
+        Index('ix_tkr_game_submissions_tournament_submitted', 'tournament_id', 'submitted_at', 'id'),
+        # Incremental host dashboard: rows changed since the last poll
+        Index('ix_tkr_game_submissions_tournament_updated', 'tournament_id', 'updated_at'),
+        # The verification queue only ever reads pending rows, oldest first
+        Index(
+            'ix_tkr_game_submissions_pending_queue', 'tournament_id', 'submitted_at', 'id',
+            postgresql_where=text("status = 'PENDING'")
+        ),
+        # Duplicate detection; rejected rows may be resubmitted
+        Index(
+            'uq_tkr_game_submissions_team_fingerprint', 'team_registration_id', 'fingerprint',
+            unique=True, postgresql_where=text("status != 'REJECTED'")
+        ),
+    )
+
+class TKRSubmissionStats(Base):
+    """Running (Welford) statistics of a tournament's submissions for anomaly scoring"""
+    __tablename__ = "tkr_submission_stats"
+    
+    tournament_id = Column(Integer, ForeignKey("tournaments.id"), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    kills_mean = Column(Float, nullable=False, default=0.0)
+    kills_m2 = Column(Float, nullable=False, default=0.0)
+    placement_mean = Column(Float, nullable=False, default=0.0)
+    placement_m2 = Column(Float, nullable=False, default=0.0)
+    final_score_mean = Column(Float, nullable=False, default=0.0)
+    final_score_m2 = Column(Float, nullable=False, default=0.0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 class TKRLeaderboard(Base):
     __tablename__ = "tkr_leaderboards"
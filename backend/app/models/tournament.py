@@ -1,7 +1,7 @@
 # app/models/tournament.py - FIXED to match actual database schema
-from sqlalchemy import Column, Integer, String, Enum, ForeignKey, DateTime, JSON, Text
+from sqlalchemy import Column, Integer, String, Enum, ForeignKey, DateTime, JSON, Text, Index
 from sqlalchemy.orm import relationship
-from app.models.base import Base
+from app.models.base import Base, search_indexes
 import enum
 from datetime import datetime
 
@@ -26,6 +26,9 @@ class Tournament(Base):
     start_time = Column(String, nullable=True)
     end_date = Column(DateTime, nullable=True)
     end_time = Column(String, nullable=True)
+    # UTC instants derived from the date/time pairs above; the TKR scheduler runs on these
+    starts_at = Column(DateTime, nullable=True)
+    ends_at = Column(DateTime, nullable=True)
     team_size = Column(Integer, nullable=True)
     max_teams = Column(Integer, nullable=True)
     current_teams = Column(Integer, default=0)
@@ -46,6 +49,9 @@ class Tournament(Base):
     
     # Existing field for bracket configuration
     bracket_config = Column(JSON, nullable=True)
+    
+    # Set once the "starts soon" notice has been queued for registered teams
+    start_reminder_sent_at = Column(DateTime, nullable=True)
  
     # Existing relationships
     creator = relationship("User", back_populates="created_tournaments")
@@ -58,4 +64,13 @@ class Tournament(Base):
     tkr_config = relationship("TKRTournamentConfig", back_populates="tournament", uselist=False)
     tkr_registrations = relationship("TKRTeamRegistration", back_populates="tournament")
     tkr_submissions = relationship("TKRGameSubmission", back_populates="tournament")
-    tkr_leaderboard = relationship("TKRLeaderboard", back_populates="tournament")
\ No newline at end of file
+    tkr_leaderboard = relationship("TKRLeaderboard", back_populates="tournament")
+
+    # Keyset pagination walks (start_date, id); listings usually filter on status first
+    __table_args__ = (
+        Index('ix_tournaments_start_date_id', 'start_date', 'id'),
+        Index('ix_tournaments_status_start_date_id', 'status', 'start_date', 'id'),
+        Index('ix_tournaments_status_starts_at', 'status', 'starts_at'),
+        Index('ix_tournaments_status_ends_at', 'status', 'ends_at'),
+        *search_indexes('ix_tournaments_name', name),
+    )
\ No newline at end of file
@@ -1,9 +1,9 @@
 # app/models/user.py - Updated with created_teams relationship
-from sqlalchemy import Column, Integer, String, Boolean, Enum as SQLEnum, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, Enum as SQLEnum, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
-from app.models.base import Base
+from app.models.base import Base, search_indexes
 
 class UserRole(str, enum.Enum):
     USER = "USER"
@@ -36,6 +36,12 @@ class User(Base):
     # Add the social links relationship
     social_links = relationship("UserSocialLink", back_populates="user", cascade="all, delete-orphan")
 
+    # Keyset pagination walks (created_at, id)
+    __table_args__ = (
+        Index('ix_users_created_at_id', 'created_at', 'id'),
+        *search_indexes('ix_users_username', username),
+    )
+
     @property
     def is_superuser(self):
         """
@@ -1,6 +1,6 @@
 # app/schemas/__init__.py
 from .user import User, UserCreate, UserUpdate, UserBase, UserInDB, UserInTournament, UserRole, UserInApplication
-from .tournament import Tournament, TournamentCreate, TournamentUpdate, TournamentWithTeams
+from .tournament import Tournament, TournamentCreate, TournamentUpdate, TournamentWithTeams, TournamentCard
 from .team import Team, TeamCreate, TeamUpdate, TeamWithPlayers, TeamInTournament
 from .match import Match, MatchCreate, MatchUpdate, TournamentBracketResponse
 from .token import Token, TokenPayload
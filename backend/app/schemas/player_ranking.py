@@ -1,5 +1,6 @@
 # app/schemas/player_ranking.py
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from typing import List, Optional
 
 class PlayerRankingBase(BaseModel):
     player_name: str
@@ -18,4 +19,38 @@ class PlayerRanking(PlayerRankingBase):
     id: int
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class PlayerRankingImportRow(BaseModel):
+    player_name: str = Field(..., min_length=1)
+    twitter_handle: str = Field(..., min_length=1)
+    # Desired ladder position; ties and gaps are resolved when the ladder is renumbered
+    rank: int = Field(..., ge=1)
+
+class PlayerRankingImportResult(BaseModel):
+    received: int
+    created: int
+    updated: int
+    removed: int
+    ladder_size: int
+
+class PlayerRankingModelInfo(BaseModel):
+    trained: bool
+    samples: Optional[int] = None
+    max_rank: Optional[int] = None
+    rmse_log_rank: Optional[float] = None
+    mean_abs_rank_error: Optional[float] = None
+    trained_at: Optional[str] = None
+
+class PlayerRerankEntry(BaseModel):
+    ranking_id: int
+    player_name: str
+    twitter_handle: str
+    current_rank: Optional[int] = None
+    new_rank: int
+    has_stats: bool
+
+class PlayerRerankResult(BaseModel):
+    applied: bool
+    players_moved: int
+    entries: List[PlayerRerankEntry]
@@ -0,0 +1,19 @@
+# app/schemas/search.py
+from typing import List, Optional
+from pydantic import BaseModel
+
+class SearchHit(BaseModel):
+    kind: str  # players, teams, tournaments or hosts
+    id: int
+    label: str
+    # Twitter handle, tournament name, game or organization, depending on kind
+    detail: Optional[str] = None
+    # Trigram similarity, +1 for a prefix match, +0.5 for a later-word prefix match
+    score: float
+
+class SearchResults(BaseModel):
+    query: str
+    players: List[SearchHit] = []
+    teams: List[SearchHit] = []
+    tournaments: List[SearchHit] = []
+    hosts: List[SearchHit] = []
@@ -0,0 +1,33 @@
+# app/schemas/stats.py
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict
+
+class StatsRollup(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    subject_type: str
+    subject_key: str
+    display_name: str
+    game: str
+    map_name: str
+    season: str
+    games_played: int
+    kills: int
+    total_score: float
+    best_game_score: Optional[float] = None
+    average_kills: Optional[float] = None
+    average_placement: Optional[float] = None
+    first_places: int
+    matches_won: int
+    matches_lost: int
+    updated_at: Optional[datetime] = None
+
+class StatsProfile(BaseModel):
+    subject_type: str
+    subject_key: str
+    display_name: str
+    career: Optional[StatsRollup] = None
+    # Every game/map/season bucket, including the career row
+    breakdown: List[StatsRollup]
@@ -1,6 +1,6 @@
 # app/schemas/tkr.py - Fixed for proper enum serialization
 from pydantic import BaseModel, field_validator, Field, ConfigDict
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
@@ -93,12 +93,36 @@ class TKRTournamentConfigUpdate(BaseModel):
     host_percentage: Optional[float] = None
     show_prize_pool: Optional[bool] = None
 
+# Dry-run of scoring changes
+class TKRSimulationEntry(BaseModel):
+    team_registration_id: int
+    team_name: str
+    current_score: float
+    simulated_score: float
+    score_delta: float
+    current_rank: Optional[int] = None
+    simulated_rank: int
+    rank_change: Optional[int] = None  # positive means the team moves up
+
+class TKRSimulationResult(BaseModel):
+    tournament_id: int
+    games_evaluated: int
+    teams_moved: int
+    elapsed_ms: float
+    entries: List[TKRSimulationEntry]
+
 class TKRTournamentConfig(TKRTournamentConfigBase):
     model_config = ConfigDict(from_attributes=True, use_enum_values=True)  # KEY FIX: use_enum_values=True
     
     id: int
     tournament_id: int
 
+def naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Registration times are stored and compared as naive UTC; convert offset-aware input"""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
 # TKR Team Registration
 class TKRTeamRegistrationBase(BaseModel):
     team_name: str = Field(..., min_length=1, max_length=100)
@@ -109,11 +133,19 @@ class TKRTeamRegistrationBase(BaseModel):
     using_free_entry: bool = False
     free_entry_players: Optional[List[str]] = None
 
+    @field_validator('start_time')
+    @classmethod
+    def normalize_start_time(cls, v):
+        return naive_utc(v)
+
     @field_validator('players')
     @classmethod
     def validate_players(cls, v, info):
         if not v:
             raise ValueError('At least one player must be provided')
+        names = [" ".join(player.name.split()).lower() for player in v]
+        if len(set(names)) != len(names):
+            raise ValueError('Each player can only be listed once')
         return v
 
     @field_validator('team_rank')
@@ -171,6 +203,11 @@ class TKRTeamRegistrationUpdate(BaseModel):
     paid_to: Optional[str] = None
     payment_notes: Optional[str] = None
 
+    @field_validator('start_time')
+    @classmethod
+    def normalize_start_time(cls, v):
+        return naive_utc(v)
+
 class TKRTeamRegistration(TKRTeamRegistrationBase):
     model_config = ConfigDict(from_attributes=True, use_enum_values=True)  # KEY FIX: use_enum_values=True
     
@@ -179,6 +216,8 @@ class TKRTeamRegistration(TKRTeamRegistrationBase):
     config_id: int
     team_id: int
     end_time: Optional[datetime] = None
+    submission_deadline: Optional[datetime] = None
+    submissions_closed_at: Optional[datetime] = None
     payment_status: PaymentStatus
     payment_amount: float
     paid_to: Optional[str] = None
@@ -228,6 +267,8 @@ class TKRGameSubmission(TKRGameSubmissionBase):
     verification_notes: Optional[str] = None
     submitted_at: datetime
     verified_at: Optional[datetime] = None
+    anomaly_score: Optional[float] = None
+    anomaly_flags: Optional[List[str]] = None
 
 # TKR Leaderboard Entry
 class TKRLeaderboardEntry(BaseModel):
@@ -327,6 +368,30 @@ class TKRBulkGameSubmission(BaseModel):
         
         return v
 
+# Submission eligibility across all of a user's live registrations
+class TKREligibility(BaseModel):
+    team_registration_id: int
+    tournament_id: int
+    tournament_name: str
+    team_name: str
+    can_submit: bool
+    window_status: str  # "upcoming", "active", "grace" or "closed"
+    message: str
+    start_time: datetime
+    end_time: Optional[datetime] = None
+    submission_deadline: Optional[datetime] = None
+    seconds_remaining: Optional[int] = None  # until the next boundary of this registration
+
+class TKREligibilityResponse(BaseModel):
+    current_time: datetime
+    valid_until: Optional[datetime] = None  # earliest boundary; the answer can't change before it
+    registrations: List[TKREligibility]
+
+class TKRPlayerHistory(BaseModel):
+    handle: str
+    free_entries_used: int
+    registrations: List[TKRTeamRegistration]
+
 # Enhanced response models
 class TKRTeamRegistrationResponse(TKRTeamRegistration):
     calculated_entry_fee: Optional[float] = None
@@ -346,12 +411,49 @@ class TKRLeaderboardResponse(BaseModel):
 
 class TKRHostDashboard(BaseModel):
     tournament_id: int
+    server_time: datetime  # pass back as `since` on the next poll
+    since: Optional[datetime] = None
     config: TKRTournamentConfig
     registrations: List[TKRTeamRegistrationResponse]
     recent_submissions: List[TKRGameSubmissionWithTeam]
+    leaderboard: List[TKRLeaderboardEntry] = []
     prize_pool: Optional[TKRPrizePool] = None
     quick_stats: Dict[str, Any]
 
+# Verification queue
+class TKRQueuedSubmission(TKRGameSubmissionWithTeam):
+    claimed_by: Optional[int] = None
+    claimed_until: Optional[datetime] = None
+
+class TKRVerificationVerdict(BaseModel):
+    submission_id: int
+    status: SubmissionStatus
+    verification_notes: Optional[str] = None
+
+    @field_validator('status')
+    @classmethod
+    def validate_status(cls, v):
+        if v == SubmissionStatus.PENDING:
+            raise ValueError('Verdict must be VERIFIED or REJECTED')
+        return v
+
+class TKRVerificationBatch(BaseModel):
+    verdicts: List[TKRVerificationVerdict]
+
+    @field_validator('verdicts')
+    @classmethod
+    def validate_verdicts(cls, v):
+        if not v:
+            raise ValueError('At least one verdict is required')
+        ids = [verdict.submission_id for verdict in v]
+        if len(ids) != len(set(ids)):
+            raise ValueError('Duplicate submission IDs are not allowed')
+        return v
+
+class TKRVerificationResult(BaseModel):
+    updated: List[TKRGameSubmission]
+    skipped: List[int]  # no longer pending, or held by another moderator
+
 # Validation models
 class TKRValidationError(BaseModel):
     field: str
@@ -212,6 +212,26 @@ class Tournament(BaseModel):
     class Config:
         from_attributes = True
 
+class TournamentCard(BaseModel):
+    """Lightweight projection rendered by the tournament list and home cards"""
+    id: int
+    name: str
+    format: TournamentFormat
+    start_date: datetime
+    start_time: Optional[str] = None
+    status: TournamentStatus
+    team_size: Optional[int] = None
+    max_teams: Optional[int] = None
+    current_teams: Optional[int] = 0
+    creator_id: Optional[int] = None
+    creator_username: Optional[str] = None
+    entry_fee: Optional[str] = None
+    game: Optional[str] = None
+    game_mode: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
 class TournamentWithTeams(Tournament):
     teams: List["Team"] = []
 
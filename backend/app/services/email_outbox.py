@@ -0,0 +1,189 @@
+# app/services/email_outbox.py - Background delivery of queued email
+import random
+import smtplib
+import threading
+import time
+from datetime import datetime, timedelta
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from typing import List, Optional
+import logging
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.email_outbox import EmailOutbox, EmailStatus
+
+logger = logging.getLogger(__name__)
+
+def build_message(email: EmailOutbox) -> MIMEMultipart:
+    message = MIMEMultipart("alternative")
+    message["Subject"] = email.subject
+    message["From"] = f"{settings.EMAIL_FROM_NAME} <{settings.EMAIL_FROM_ADDRESS}>"
+    message["To"] = email.to_address
+    if email.text_body:
+        message.attach(MIMEText(email.text_body, "plain"))
+    if email.html_body:
+        message.attach(MIMEText(email.html_body, "html"))
+    return message
+
+class SMTPTransport:
+    """
+    Keeps one authenticated SMTP connection open between batches and
+    reconnects when the server drops it or it has been idle too long.
+
+    With SMTP_USE_SSL and SMTP_TLS both off and no SMTP_USER it talks plain
+    SMTP, which is what a local debugging server such as
+    `python -m aiosmtpd -n -l localhost:1025` expects.
+    """
+
+    def __init__(self):
+        self._server: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+
+    def _connect(self) -> smtplib.SMTP:
+        timeout = settings.SMTP_TIMEOUT_SECONDS
+        if settings.SMTP_USE_SSL:
+            server = smtplib.SMTP_SSL(settings.SMTP_HOST, settings.SMTP_PORT, timeout=timeout)
+        else:
+            server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=timeout)
+            if settings.SMTP_TLS:
+                server.starttls()
+        if settings.SMTP_USER:
+            server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+        return server
+
+    def _connection(self) -> smtplib.SMTP:
+        if self._server is not None:
+            if time.monotonic() - self._last_used > settings.SMTP_IDLE_TIMEOUT_SECONDS:
+                self.close()
+            else:
+                return self._server
+        self._server = self._connect()
+        return self._server
+
+    def send(self, message: MIMEMultipart) -> None:
+        try:
+            self._connection().send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            # Kept-alive connection was closed by the server; retry once on a fresh one
+            self.close()
+            self._connection().send_message(message)
+        except (smtplib.SMTPException, OSError):
+            self.close()
+            raise
+        self._last_used = time.monotonic()
+
+    def close(self) -> None:
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._server = None
+
+class MemoryTransport:
+    """Collects messages instead of sending them (EMAIL_BACKEND=memory)"""
+    sent: List[MIMEMultipart] = []
+
+    def send(self, message: MIMEMultipart) -> None:
+        MemoryTransport.sent.append(message)
+
+    def close(self) -> None:
+        pass
+
+def get_transport():
+    if settings.EMAIL_BACKEND == "memory":
+        return MemoryTransport()
+    return SMTPTransport()
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff with jitter, capped at EMAIL_RETRY_MAX_SECONDS"""
+    delay = min(settings.EMAIL_RETRY_BASE_SECONDS * 2 ** (attempts - 1), settings.EMAIL_RETRY_MAX_SECONDS)
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+def deliver_batch(db: Session, transport, batch_size: int) -> int:
+    """
+    Send up to `batch_size` due emails over `transport` in one transaction.
+
+    Rows are claimed with FOR UPDATE SKIP LOCKED so several workers can drain
+    the outbox concurrently without double-sending. Returns the number of
+    rows processed.
+    """
+    now = datetime.utcnow()
+    emails = db.query(EmailOutbox).filter(
+        EmailOutbox.status == EmailStatus.PENDING,
+        EmailOutbox.next_attempt_at <= now
+    ).order_by(
+        EmailOutbox.next_attempt_at
+    ).limit(batch_size).with_for_update(skip_locked=True).all()
+
+    for email in emails:
+        email.attempts += 1
+        try:
+            transport.send(build_message(email))
+        except Exception as e:
+            email.last_error = str(e)
+            if email.attempts >= settings.EMAIL_MAX_ATTEMPTS:
+                email.status = EmailStatus.FAILED
+                logger.error("Giving up on email %s after %s attempts: %s", email.id, email.attempts, e)
+            else:
+                email.next_attempt_at = datetime.utcnow() + retry_delay(email.attempts)
+                logger.warning("Email %s failed (attempt %s), retrying: %s", email.id, email.attempts, e)
+        else:
+            email.status = EmailStatus.SENT
+            email.sent_at = datetime.utcnow()
+            email.last_error = None
+
+    db.commit()
+    return len(emails)
+
+class EmailOutboxWorker:
+    """Daemon thread draining the outbox; app.core.email.queue_email and queue_rendered_batch wake it immediately"""
+    _thread: Optional[threading.Thread] = None
+    _wake = threading.Event()
+    _stop = threading.Event()
+
+    @classmethod
+    def start(cls):
+        if cls._thread is not None and cls._thread.is_alive():
+            return
+        cls._stop.clear()
+        cls._thread = threading.Thread(target=cls._run, name="email-outbox", daemon=True)
+        cls._thread.start()
+        logger.info("Email outbox worker started (backend=%s)", settings.EMAIL_BACKEND)
+
+    @classmethod
+    def stop(cls, timeout: float = 10.0):
+        cls._stop.set()
+        cls._wake.set()
+        if cls._thread is not None:
+            cls._thread.join(timeout)
+            cls._thread = None
+
+    @classmethod
+    def wake(cls):
+        cls._wake.set()
+
+    @classmethod
+    def _run(cls):
+        transport = get_transport()
+        try:
+            while not cls._stop.is_set():
+                processed = 0
+                db = SessionLocal()
+                try:
+                    processed = deliver_batch(db, transport, settings.EMAIL_OUTBOX_BATCH_SIZE)
+                except Exception:
+                    db.rollback()
+                    logger.exception("Email outbox batch failed")
+                finally:
+                    db.close()
+
+                # A full batch means more may be waiting; otherwise sleep until woken
+                if processed < settings.EMAIL_OUTBOX_BATCH_SIZE:
+                    cls._wake.wait(settings.EMAIL_OUTBOX_POLL_SECONDS)
+                    cls._wake.clear()
+        finally:
+            transport.close()
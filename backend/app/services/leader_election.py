@@ -0,0 +1,180 @@
+# app/services/leader_election.py - One leader per database for background jobs
+import os
+import socket
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+import logging
+
+from app.core.config import settings
+from app.db.database import SessionLocal, engine
+from app.models.leader_lease import LeaderLease
+
+logger = logging.getLogger(__name__)
+
+ELECTION_NAME = "background-jobs"
+
+def dedicated_connection():
+    """
+    An autocommit DBAPI connection outside the pool. Session-level state such
+    as advisory locks and LISTEN lives exactly as long as it does.
+    """
+    raw = engine.raw_connection()
+    raw.detach()
+    conn = raw.driver_connection
+    conn.autocommit = True
+    return conn
+
+class LeaderElection:
+    """
+    Elects one process across all workers and hosts to run the registered
+    background jobs.
+
+    Every process runs the election thread. Leadership is a session-level
+    Postgres advisory lock on a dedicated connection, so it is released the
+    moment the leader's connection dies and a follower takes over on its
+    next attempt (within LEADER_RETRY_SECONDS). The leader heartbeats its row
+    in leader_leases every LEADER_HEARTBEAT_SECONDS; a failed heartbeat means
+    the lock may be gone, so it stops its jobs and steps down.
+
+    Jobs are objects with start() and stop(); they are started when this
+    process becomes leader and stopped when it stops leading.
+    """
+    instance_id = f"{socket.gethostname()}:{os.getpid()}"
+    _jobs: Dict[str, Any] = {}
+    _thread: Optional[threading.Thread] = None
+    _stop = threading.Event()
+    _is_leader = False
+
+    @classmethod
+    def register(cls, name: str, job) -> None:
+        cls._jobs[name] = job
+
+    @classmethod
+    def start(cls):
+        if cls._thread is not None and cls._thread.is_alive():
+            return
+        cls._stop.clear()
+        cls._thread = threading.Thread(target=cls._run, name="leader-election", daemon=True)
+        cls._thread.start()
+        logger.info("Leader election started for %s (%s)", cls.instance_id, ", ".join(cls._jobs) or "no jobs")
+
+    @classmethod
+    def stop(cls, timeout: float = 15.0):
+        cls._stop.set()
+        if cls._thread is not None:
+            cls._thread.join(timeout)
+            cls._thread = None
+
+    @classmethod
+    def running(cls) -> bool:
+        return cls._thread is not None and cls._thread.is_alive()
+
+    @classmethod
+    def is_leader(cls) -> bool:
+        return cls._is_leader
+
+    @classmethod
+    def status(cls) -> Dict[str, Any]:
+        """This process's view plus the current lease, readable from any worker"""
+        db = SessionLocal()
+        try:
+            lease = db.query(LeaderLease).filter(LeaderLease.name == ELECTION_NAME).first()
+        finally:
+            db.close()
+
+        leader = None
+        if lease:
+            age = (datetime.now(timezone.utc) - lease.heartbeat_at).total_seconds()
+            leader = {
+                "instance": lease.holder,
+                "acquired_at": lease.acquired_at.isoformat(),
+                "heartbeat_at": lease.heartbeat_at.isoformat(),
+                # A crashed leader leaves its row behind until someone takes over
+                "stale": age > 3 * settings.LEADER_HEARTBEAT_SECONDS,
+            }
+        return {
+            "instance": cls.instance_id,
+            "running": cls.running(),
+            "is_leader": cls._is_leader,
+            "leader": leader,
+            "jobs": list(cls._jobs),
+        }
+
+    @classmethod
+    def _run(cls):
+        while not cls._stop.is_set():
+            conn = None
+            try:
+                conn = dedicated_connection()
+                while not cls._stop.is_set():
+                    if cls._try_lock(conn):
+                        cls._lead(conn)
+                        break
+                    cls._stop.wait(settings.LEADER_RETRY_SECONDS)
+            except Exception:
+                logger.exception("Leader election connection failed")
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()  # releases the lock if we still hold it
+                    except Exception:
+                        pass
+            cls._stop.wait(settings.LEADER_RETRY_SECONDS)
+
+    @staticmethod
+    def _try_lock(conn) -> bool:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", (settings.LEADER_ELECTION_LOCK_ID,))
+            return cursor.fetchone()[0]
+
+    @classmethod
+    def _lead(cls, conn):
+        with conn.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO leader_leases (name, holder, acquired_at, heartbeat_at)
+                VALUES (%s, %s, now(), now())
+                ON CONFLICT (name) DO UPDATE SET
+                    holder = EXCLUDED.holder, acquired_at = now(), heartbeat_at = now()
+                """,
+                (ELECTION_NAME, cls.instance_id)
+            )
+        cls._is_leader = True
+        logger.info("%s is now leader", cls.instance_id)
+        cls._start_jobs()
+        try:
+            while not cls._stop.wait(settings.LEADER_HEARTBEAT_SECONDS):
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        "UPDATE leader_leases SET heartbeat_at = now() WHERE name = %s AND holder = %s",
+                        (ELECTION_NAME, cls.instance_id)
+                    )
+            # Graceful shutdown: clear the lease so the status endpoint does not
+            # show a dead leader until the next one takes over
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "DELETE FROM leader_leases WHERE name = %s AND holder = %s",
+                    (ELECTION_NAME, cls.instance_id)
+                )
+                cursor.execute("SELECT pg_advisory_unlock(%s)", (settings.LEADER_ELECTION_LOCK_ID,))
+        finally:
+            cls._stop_jobs()
+            cls._is_leader = False
+            logger.info("%s stopped leading", cls.instance_id)
+
+    @classmethod
+    def _start_jobs(cls):
+        for name, job in cls._jobs.items():
+            try:
+                job.start()
+            except Exception:
+                logger.exception("Failed to start background job %s", name)
+
+    @classmethod
+    def _stop_jobs(cls):
+        for name, job in cls._jobs.items():
+            try:
+                job.stop()
+            except Exception:
+                logger.exception("Failed to stop background job %s", name)
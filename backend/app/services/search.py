@@ -0,0 +1,203 @@
+# app/services/search.py - Search backends: pg_trgm queries or a per-process trigram index
+import bisect
+import heapq
+import math
+import re
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.search import (
+    FUZZY_MIN_LENGTH, PREFIX_BONUS, SEARCH_KINDS, WORD_PREFIX_BONUS,
+    load_search_documents, normalize_query, postgres_search
+)
+
+# pg_trgm splits on anything that is not a letter or digit
+_WORD = re.compile(r"[^\W_]+")
+
+def trigrams(value: str) -> Set[str]:
+    """The trigram set pg_trgm builds: each word padded with two leading spaces and one trailing"""
+    grams = set()
+    for word in _WORD.findall(value.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+def similarity(a: str, b: str) -> float:
+    """pg_trgm similarity(): shared trigrams over the union of both sets"""
+    left, right = trigrams(a), trigrams(b)
+    if not left or not right:
+        return 0.0
+    shared = len(left & right)
+    return shared / (len(left) + len(right) - shared)
+
+class _KindIndex:
+    """One kind's documents. Keys are lower-cased names; a document may have several."""
+
+    def __init__(self):
+        self.docs: Dict[int, Tuple[str, Optional[str]]] = {}
+        self.entries: List[Tuple[int, str, int]] = []  # (doc id, key, trigram count)
+        self.postings: Dict[str, List[int]] = {}  # trigram -> entry numbers
+        self.prefixes: List[Tuple[str, int]] = []  # sorted (key, entry)
+        self.word_prefixes: List[Tuple[str, int]] = []  # sorted (key after a space, entry)
+
+    def add(self, doc_id: int, label: str, detail: Optional[str], keys: Iterable[str]):
+        self.docs[doc_id] = (label, detail)
+        for key in keys:
+            entry = len(self.entries)
+            grams = trigrams(key)
+            self.entries.append((doc_id, key, len(grams)))
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(entry)
+            self.prefixes.append((key, entry))
+            self.word_prefixes.extend(
+                (key[i + 1:], entry) for i, char in enumerate(key) if char == " "
+            )
+
+    def finish(self):
+        self.prefixes.sort()
+        self.word_prefixes.sort()
+
+    @staticmethod
+    def _starting_with(pairs: List[Tuple[str, int]], query: str) -> List[int]:
+        start = bisect.bisect_left(pairs, (query,))
+        end = bisect.bisect_left(pairs, (query + "\U0010ffff",), start)
+        return [entry for _, entry in pairs[start:end]]
+
+    def search(self, query: str, limit: int, threshold: float) -> List[Dict]:
+        fuzzy = len(query) >= FUZZY_MIN_LENGTH
+        bonuses = dict.fromkeys(self._starting_with(self.prefixes, query), PREFIX_BONUS)
+        if fuzzy:
+            for entry in self._starting_with(self.word_prefixes, query):
+                bonuses.setdefault(entry, WORD_PREFIX_BONUS)
+
+        # Rarest trigrams first. similarity >= threshold needs at least
+        # ceil(threshold * n) of the n query trigrams, so every fuzzy match
+        # appears in one of the n - needed + 1 rarest posting lists; only
+        # those generate candidates, the rest are just checked against them.
+        postings = sorted(
+            (self.postings.get(gram, []) for gram in trigrams(query)), key=len
+        )
+        needed = max(1, math.ceil(threshold * len(postings) - 1e-9))
+        scanned = len(postings) - needed + 1 if fuzzy else 0
+
+        shared = Counter()
+        for posting in postings[:scanned]:
+            shared.update(posting)
+        candidates = set(shared)
+        candidates.update(bonuses)
+        for posting in postings[scanned:]:
+            if len(posting) < 16 * len(candidates):
+                shared.update(candidates.intersection(posting))
+                continue
+            # Entries are numbered in insertion order, so postings are sorted
+            for entry in candidates:
+                at = bisect.bisect_left(posting, entry)
+                if at < len(posting) and posting[at] == entry:
+                    shared[entry] += 1
+
+        scores: Dict[int, float] = {}
+        for entry in candidates:
+            common = shared.get(entry, 0)
+            score = common / (len(postings) + self.entries[entry][2] - common) if common else 0.0
+            if score < threshold and entry not in bonuses:
+                continue
+            doc_id = self.entries[entry][0]
+            score += bonuses.get(entry, 0.0)
+            if score > scores.get(doc_id, -1.0):
+                scores[doc_id] = score
+
+        best = heapq.nsmallest(
+            limit, ((-score, self.docs[doc_id][0], doc_id) for doc_id, score in scores.items())
+        )
+        return [
+            {"id": doc_id, "label": label, "detail": self.docs[doc_id][1], "score": round(-negative, 4)}
+            for negative, label, doc_id in best
+        ]
+
+class MemorySearchIndex:
+    """
+    Pure-Python equivalent of the Postgres search: the same pg_trgm trigram
+    similarity, prefix bonuses and threshold, over an inverted trigram index
+    and sorted key lists. Used by the "memory" backend and in tests, where it
+    can be filled with add() directly.
+    """
+
+    def __init__(self):
+        self._kinds: Dict[str, _KindIndex] = {kind: _KindIndex() for kind in SEARCH_KINDS}
+
+    def add(self, kind: str, doc_id: int, label: str, detail: Optional[str], keys: Iterable[str]):
+        self._kinds[kind].add(doc_id, label, detail, keys)
+
+    def finish(self) -> "MemorySearchIndex":
+        """Sort the prefix lists; call once after the last add()"""
+        for index in self._kinds.values():
+            index.finish()
+        return self
+
+    @classmethod
+    def from_documents(cls, documents) -> "MemorySearchIndex":
+        index = cls()
+        for kind, doc_id, label, detail, keys in documents:
+            index.add(kind, doc_id, label, detail, keys)
+        return index.finish()
+
+    def search(self, query: str, kinds: Sequence[str], limit: int, threshold: float) -> Dict[str, List[Dict]]:
+        results = {}
+        for kind in kinds:
+            hits = self._kinds[kind].search(query, limit, threshold)
+            for hit in hits:
+                hit["kind"] = kind
+            results[kind] = hits
+        return results
+
+class PostgresSearchBackend:
+    def search(self, db: Session, query: str, kinds: Sequence[str], limit: int) -> Dict[str, List[Dict]]:
+        return postgres_search(db, query, kinds, limit, settings.SEARCH_SIMILARITY_THRESHOLD)
+
+class MemorySearchBackend:
+    """A MemorySearchIndex rebuilt from the database once it is older than `refresh_seconds`"""
+
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self._index: Optional[MemorySearchIndex] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def index(self, db: Session) -> MemorySearchIndex:
+        if self._index is None or time.monotonic() - self._loaded_at > self.refresh_seconds:
+            with self._lock:
+                if self._index is None or time.monotonic() - self._loaded_at > self.refresh_seconds:
+                    self._index = MemorySearchIndex.from_documents(load_search_documents(db))
+                    self._loaded_at = time.monotonic()
+        return self._index
+
+    def search(self, db: Session, query: str, kinds: Sequence[str], limit: int) -> Dict[str, List[Dict]]:
+        return self.index(db).search(query, kinds, limit, settings.SEARCH_SIMILARITY_THRESHOLD)
+
+_backend = None
+_backend_lock = threading.Lock()
+
+def get_search_backend():
+    """The backend selected by SEARCH_BACKEND, created on first use"""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                if settings.SEARCH_BACKEND == "postgres":
+                    _backend = PostgresSearchBackend()
+                else:
+                    _backend = MemorySearchBackend(settings.SEARCH_MEMORY_REFRESH_SECONDS)
+    return _backend
+
+def search(db: Session, query: str, kinds: Sequence[str], limit: int, backend=None) -> Dict[str, List[Dict]]:
+    """Top `limit` hits per requested kind, best first"""
+    query = normalize_query(query)
+    if not query:
+        return {kind: [] for kind in kinds}
+    backend = backend or get_search_backend()
+    return backend.search(db, query, kinds, limit)
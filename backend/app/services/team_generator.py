@@ -0,0 +1,140 @@
+# app/services/team_generator.py - Random and rank-balanced team generation in one pass
+import heapq
+import random
+import secrets
+from typing import List, Mapping, Optional, Sequence, Tuple
+
+BALANCE_MODES = ("random", "snake", "min_variance")
+
+def team_count(lists: Sequence[Sequence[str]], team_size: int) -> int:
+    """
+    Teams for a draw: one list makes ceil(total / team_size) teams (a random
+    draw cuts a short last team, balanced draws even the sizes out); several
+    lists fill total // team_size teams and the leftovers join existing teams.
+    """
+    total = sum(len(players) for players in lists)
+    if len(lists) == 1:
+        return -(-total // team_size)
+    return total // team_size
+
+def snake_team(position: int, teams: int) -> int:
+    """Team for the n-th pick of a snake draft: 0..T-1, T-1..0, 0..T-1, ..."""
+    round_number, offset = divmod(position, teams)
+    return offset if round_number % 2 == 0 else teams - 1 - offset
+
+def rank_value(ranks: Mapping[str, int], player: str, unranked: int) -> int:
+    return ranks.get(player.strip().lower(), unranked)
+
+def ordered_list(
+    players: Sequence[str],
+    rng: random.Random,
+    ranks: Optional[Mapping[str, int]],
+    unranked: int
+) -> List[str]:
+    """One shuffle; balanced modes then sort best rank first, keeping the shuffle between ties"""
+    shuffled = list(players)
+    rng.shuffle(shuffled)
+    if ranks is not None:
+        shuffled.sort(key=lambda player: rank_value(ranks, player, unranked))
+    return shuffled
+
+def list_quotas(lists: Sequence[Sequence[str]], teams: int) -> List[List[int]]:
+    """
+    Seats each team gets from each list when positions are dealt round-robin
+    across lists in order; keeps every list spread evenly over the teams and
+    team sizes within one of each other.
+    """
+    quotas = []
+    start = 0
+    for players in lists:
+        full_rounds, extra = divmod(len(players), teams)
+        quota = [full_rounds] * teams
+        for offset in range(extra):
+            quota[(start + offset) % teams] += 1
+        quotas.append(quota)
+        start += len(players)
+    return quotas
+
+def assign_min_variance(
+    lists: Sequence[List[str]],
+    teams: int,
+    ranks: Mapping[str, int],
+    unranked: int
+) -> List[List[str]]:
+    """
+    Greedy balanced partition: within each list, weakest (highest rank
+    number) first, each player goes to the team with the lowest rank total
+    that still has a seat for that list. Team totals end up close to equal,
+    with the same per-list composition as the other modes.
+    """
+    result: List[List[str]] = [[] for _ in range(teams)]
+    totals = [0] * teams
+    for players, quota in zip(lists, list_quotas(lists, teams)):
+        remaining = list(quota)
+        heap = [(totals[team], team) for team in range(teams) if remaining[team]]
+        heapq.heapify(heap)
+        for player in reversed(players):
+            total, team = heapq.heappop(heap)
+            result[team].append(player)
+            totals[team] = total + rank_value(ranks, player, unranked)
+            remaining[team] -= 1
+            if remaining[team]:
+                heapq.heappush(heap, (totals[team], team))
+    return result
+
+def generate_teams(
+    lists: Sequence[Sequence[str]],
+    team_size: int,
+    seed: Optional[int] = None,
+    balance: str = "random",
+    ranks: Optional[Mapping[str, int]] = None
+) -> Tuple[List[List[str]], int]:
+    """
+    Split the players into teams, drawing from every list evenly. Returns
+    (teams, seed); the same seed, input and ranks give the same teams.
+
+    balance="random" deals shuffled lists round-robin. "snake" and
+    "min_variance" need `ranks` (lower-cased name -> ladder rank, 1 is
+    best); unranked players count as one below the worst rank. Raises
+    ValueError when there are too few players for one team.
+    """
+    if balance not in BALANCE_MODES:
+        raise ValueError(f"balance must be one of {', '.join(BALANCE_MODES)}")
+    if sum(len(players) for players in lists) < team_size:
+        raise ValueError(f"Not enough players to form a team of {team_size}")
+    teams = team_count(lists, team_size)
+    if seed is None:
+        seed = secrets.randbits(32)
+    rng = random.Random(seed)
+
+    if balance == "random":
+        ranks = None
+        unranked = 0
+    else:
+        ranks = ranks or {}
+        unranked = max(ranks.values(), default=0) + 1
+    ordered = [ordered_list(players, rng, ranks, unranked) for players in lists]
+
+    if balance == "min_variance":
+        return assign_min_variance(ordered, teams, ranks, unranked), seed
+
+    if len(lists) == 1 and balance == "random":
+        players = ordered[0]
+        return [players[i:i + team_size] for i in range(0, len(players), team_size)], seed
+
+    result: List[List[str]] = [[] for _ in range(teams)]
+    position = 0
+    for players in ordered:
+        for player in players:
+            team = snake_team(position, teams) if balance == "snake" else position % teams
+            result[team].append(player)
+            position += 1
+    return result, seed
+
+def average_ranks(teams: Sequence[Sequence[str]], ranks: Mapping[str, int]) -> List[Optional[float]]:
+    """Mean ladder rank of each team's ranked players (None when none are ranked)"""
+    averages = []
+    for team in teams:
+        known = [ranks[key] for key in (player.strip().lower() for player in team) if key in ranks]
+        averages.append(round(sum(known) / len(known), 2) if known else None)
+    return averages
@@ -0,0 +1,63 @@
+# app/services/tkr_anomaly.py - Duplicate fingerprints and outlier scoring for TKR submissions
+import hashlib
+import math
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+# Metrics tracked per tournament; each is a (count, mean, M2) Welford state
+METRICS = ("kills", "placement", "final_score")
+
+TEAM_SIZE_PLAYERS = {"SOLO": 1, "DUOS": 2, "TRIOS": 3, "QUADS": 4}
+
+def submission_fingerprint(vod_url: str, timestamp: str) -> str:
+    """Same VOD and timestamp (ignoring case/whitespace in the URL) means the same game"""
+    raw = f"{vod_url.strip().lower()}|{timestamp.strip()}"
+    return hashlib.md5(raw.encode()).hexdigest()
+
+def welford_update(state: Tuple[int, float, float], value: float) -> Tuple[int, float, float]:
+    count, mean, m2 = state
+    count += 1
+    delta = value - mean
+    mean += delta / count
+    m2 += delta * (value - mean)
+    return count, mean, m2
+
+def z_score(state: Tuple[int, float, float], value: float) -> Optional[float]:
+    """None until the distribution has enough samples to mean anything"""
+    count, mean, m2 = state
+    if count < settings.TKR_ANOMALY_MIN_SAMPLES:
+        return None
+    std = math.sqrt(m2 / (count - 1))
+    if std == 0:
+        return 0.0 if value == mean else None
+    return (value - mean) / std
+
+def score_submission(
+    states: Dict[str, Tuple[int, float, float]],
+    values: Dict[str, float],
+    team_size: str
+) -> Tuple[float, List[str]]:
+    """
+    Score one submission against the tournament distribution seen so far.
+
+    Returns (score, flags): the score is the largest |z| across metrics, so
+    ordering by it puts the most unusual rows first. Kill counts beyond
+    TKR_MAX_KILLS_PER_PLAYER per player are flagged regardless of history.
+    """
+    flags = []
+    score = 0.0
+    for metric in METRICS:
+        z = z_score(states[metric], values[metric])
+        if z is None:
+            continue
+        score = max(score, abs(z))
+        if abs(z) >= settings.TKR_ANOMALY_Z_THRESHOLD:
+            flags.append(f"{metric}_outlier")
+
+    size_key = str(team_size).upper().split('.')[-1]
+    max_kills = TEAM_SIZE_PLAYERS.get(size_key, 4) * settings.TKR_MAX_KILLS_PER_PLAYER
+    if values["kills"] > max_kills:
+        flags.append("impossible_kills")
+        score = max(score, settings.TKR_ANOMALY_Z_THRESHOLD * 2)
+    return round(score, 3), flags
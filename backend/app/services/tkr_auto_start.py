@@ -5,8 +5,14 @@ from typing import List
 import logging
 
 from app.models.tournament import Tournament, TournamentFormat, TournamentStatus
-from app.models.tkr import TKRTournamentConfig
+from app.models.tkr import TKRTournamentConfig, TKRTeamRegistration
+from app.models.team import Team
+from app.models.user import User
 from app.db.database import SessionLocal
+from app.core.config import settings
+from app.core.email import queue_tournament_starting_soon
+from app.crud.tkr import close_expired_submission_windows
+from app.services.email_outbox import EmailOutboxWorker
 
 logger = logging.getLogger(__name__)
 
@@ -25,27 +31,17 @@ class TKRAutoStartService:
         try:
             current_time = datetime.utcnow()
             
-            # Find TKR tournaments that should be started
+            # starts_at is a real timestamp, so this holds across date boundaries
             tournaments_to_start = db.query(Tournament).join(TKRTournamentConfig).filter(
                 Tournament.format == TournamentFormat.TKR,
                 Tournament.status == TournamentStatus.PENDING,
-                Tournament.start_date <= current_time.date(),
-                Tournament.start_time <= current_time.strftime('%H:%M')
+                Tournament.starts_at <= current_time
             ).all()
             
             for tournament in tournaments_to_start:
-                # Double-check the exact start time
-                tournament_start_datetime = datetime.combine(
-                    tournament.start_date,
-                    datetime.strptime(tournament.start_time, '%H:%M').time()
-                )
-                
-                if current_time >= tournament_start_datetime:
-                    # Start the tournament
-                    tournament.status = TournamentStatus.ONGOING
-                    started_tournaments.append(tournament.id)
-                    
-                    logger.info(f"Auto-started TKR tournament {tournament.id}: {tournament.name}")
+                tournament.status = TournamentStatus.ONGOING
+                started_tournaments.append(tournament.id)
+                logger.info(f"Auto-started TKR tournament {tournament.id}: {tournament.name}")
             
             if started_tournaments:
                 db.commit()
@@ -71,37 +67,17 @@ class TKRAutoStartService:
         try:
             current_time = datetime.utcnow()
             
-            # Find TKR tournaments that should be ended
+            # ends_at already falls back to 23:59 when no end time was given
             tournaments_to_end = db.query(Tournament).join(TKRTournamentConfig).filter(
                 Tournament.format == TournamentFormat.TKR,
                 Tournament.status == TournamentStatus.ONGOING,
-                Tournament.end_date.isnot(None),
-                Tournament.end_date <= current_time.date()
+                Tournament.ends_at <= current_time
             ).all()
             
             for tournament in tournaments_to_end:
-                # Check if we have an end time
-                if tournament.end_time:
-                    tournament_end_datetime = datetime.combine(
-                        tournament.end_date,
-                        datetime.strptime(tournament.end_time, '%H:%M').time()
-                    )
-                    
-                    if current_time >= tournament_end_datetime:
-                        tournament.status = TournamentStatus.COMPLETED
-                        ended_tournaments.append(tournament.id)
-                        logger.info(f"Auto-ended TKR tournament {tournament.id}: {tournament.name}")
-                else:
-                    # If no end time specified, end at end of day
-                    tournament_end_datetime = datetime.combine(
-                        tournament.end_date,
-                        datetime.strptime('23:59', '%H:%M').time()
-                    )
-                    
-                    if current_time >= tournament_end_datetime:
-                        tournament.status = TournamentStatus.COMPLETED
-                        ended_tournaments.append(tournament.id)
-                        logger.info(f"Auto-ended TKR tournament {tournament.id}: {tournament.name} (end of day)")
+                tournament.status = TournamentStatus.COMPLETED
+                ended_tournaments.append(tournament.id)
+                logger.info(f"Auto-ended TKR tournament {tournament.id}: {tournament.name}")
             
             if ended_tournaments:
                 db.commit()
@@ -115,15 +91,97 @@ class TKRAutoStartService:
             
         return ended_tournaments
 
-# Background task runner (you'll need to set this up with your task system)
+    @staticmethod
+    def send_start_reminders() -> List[int]:
+        """
+        Queue the "starts soon" email for TKR tournaments starting within
+        TOURNAMENT_START_REMINDER_MINUTES. Each tournament is notified once.
+        Returns list of tournament IDs that were notified.
+        """
+        db = SessionLocal()
+        notified_tournaments = []
+        
+        try:
+            current_time = datetime.utcnow()
+            horizon = current_time + timedelta(minutes=settings.TOURNAMENT_START_REMINDER_MINUTES)
+            
+            candidates = db.query(Tournament).join(TKRTournamentConfig).filter(
+                Tournament.format == TournamentFormat.TKR,
+                Tournament.status == TournamentStatus.PENDING,
+                Tournament.start_reminder_sent_at.is_(None),
+                Tournament.starts_at >= current_time,
+                Tournament.starts_at <= horizon
+            ).all()
+            
+            for tournament in candidates:
+                starts_at = tournament.starts_at
+                
+                # One email per team captain, however many registrations they have
+                rows = db.query(User.email, User.username, TKRTeamRegistration.team_name).join(
+                    Team, Team.creator_id == User.id
+                ).join(
+                    TKRTeamRegistration, TKRTeamRegistration.team_id == Team.id
+                ).filter(
+                    TKRTeamRegistration.tournament_id == tournament.id
+                ).all()
+                recipients = {}
+                for email, username, team_name in rows:
+                    recipients.setdefault(email, {
+                        "email": email, "username": username, "team_name": team_name
+                    })
+                
+                queue_tournament_starting_soon(
+                    db, tournament, recipients.values(), starts_at, commit=False
+                )
+                tournament.start_reminder_sent_at = current_time
+                notified_tournaments.append(tournament.id)
+                logger.info(f"Queued start reminders for TKR tournament {tournament.id} ({len(recipients)} recipients)")
+            
+            if notified_tournaments:
+                db.commit()
+                EmailOutboxWorker.wake()
+                
+        except Exception as e:
+            logger.error(f"Error in TKR start reminder service: {str(e)}")
+            db.rollback()
+        finally:
+            db.close()
+            
+        return notified_tournaments
+
+    @staticmethod
+    def close_submission_windows() -> List[int]:
+        """
+        Close the submission window of every registration past its deadline.
+        Returns list of registration IDs that were closed.
+        """
+        db = SessionLocal()
+        closed_registrations = []
+        
+        try:
+            closed_registrations = close_expired_submission_windows(db)
+            if closed_registrations:
+                logger.info(f"Closed {len(closed_registrations)} TKR submission windows")
+        except Exception as e:
+            logger.error(f"Error in TKR window close service: {str(e)}")
+            db.rollback()
+        finally:
+            db.close()
+            
+        return closed_registrations
+
 def run_tkr_auto_start_check():
-    """Background task to check for tournaments to start/end"""
+    """Start/end due TKR tournaments and send due reminders (run by the TKR scheduler)"""
     service = TKRAutoStartService()
+    reminded = service.send_start_reminders()
     started = service.check_and_start_tournaments()
     ended = service.check_and_end_tournaments()
+    closed = service.close_submission_windows()
     
     return {
+        "reminded_tournaments": reminded,
         "started_tournaments": started,
         "ended_tournaments": ended,
+        "closed_registrations": closed,
         "timestamp": datetime.utcnow().isoformat()
     }
\ No newline at end of file
@@ -0,0 +1,187 @@
+# app/services/tkr_scheduler.py - Event-driven TKR start/end/reminder scheduler
+import heapq
+import os
+import select
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from app.core.config import settings
+from app.crud.tkr import next_submission_deadline
+from app.db.database import SessionLocal
+from app.models.tkr import TKRTournamentConfig
+from app.models.tournament import Tournament, TournamentFormat, TournamentStatus
+from app.services.leader_election import dedicated_connection
+from app.services.tkr_auto_start import run_tkr_auto_start_check
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "tkr_schedule"
+
+# (when, kind, tournament_id); kind is "remind", "start", "end" or "close"
+Event = Tuple[datetime, str, int]
+
+def load_events(db) -> List[Event]:
+    """Every pending TKR transition plus the next submission window to close, as a heap"""
+    lead = timedelta(minutes=settings.TOURNAMENT_START_REMINDER_MINUTES)
+    rows = db.query(
+        Tournament.id, Tournament.status, Tournament.starts_at,
+        Tournament.ends_at, Tournament.start_reminder_sent_at
+    ).join(TKRTournamentConfig).filter(
+        Tournament.format == TournamentFormat.TKR,
+        Tournament.status.in_([TournamentStatus.PENDING, TournamentStatus.ONGOING])
+    ).all()
+
+    events: List[Event] = []
+    for tournament_id, status, starts_at, ends_at, reminded_at in rows:
+        if status == TournamentStatus.PENDING and starts_at:
+            events.append((starts_at, "start", tournament_id))
+            if reminded_at is None:
+                events.append((starts_at - lead, "remind", tournament_id))
+        elif status == TournamentStatus.ONGOING and ends_at:
+            events.append((ends_at, "end", tournament_id))
+
+    # Submission windows: only the earliest matters, the next one is loaded
+    # after it fires
+    next_close = next_submission_deadline(db)
+    if next_close:
+        tournament_id, deadline = next_close
+        events.append((deadline, "close", tournament_id))
+    heapq.heapify(events)
+    return events
+
+class TKRScheduler:
+    """
+    Sleeps until the next TKR transition instead of polling every minute.
+
+    Registered with LeaderElection, so it only runs in the leader process.
+    It LISTENs on the `tkr_schedule` channel, which tournament and TKR config
+    writes notify, and reloads its heap whenever a schedule changes or an
+    event fires. It also reloads every TKR_SCHEDULER_RESYNC_SECONDS to pick
+    up edits made outside the API.
+    """
+    _thread: Optional[threading.Thread] = None
+    _stop = threading.Event()
+    _wake_r: Optional[int] = None
+    _wake_w: Optional[int] = None
+    _events: List[Event] = []
+    _last_run: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def start(cls):
+        if cls._thread is not None and cls._thread.is_alive():
+            return
+        cls._stop.clear()
+        cls._wake_r, cls._wake_w = os.pipe()
+        cls._thread = threading.Thread(target=cls._run, name="tkr-scheduler", daemon=True)
+        cls._thread.start()
+        logger.info("TKR scheduler started")
+
+    @classmethod
+    def stop(cls, timeout: float = 10.0):
+        cls._stop.set()
+        cls.wake()
+        if cls._thread is not None:
+            cls._thread.join(timeout)
+            cls._thread = None
+        for fd in (cls._wake_r, cls._wake_w):
+            if fd is not None:
+                os.close(fd)
+        cls._wake_r = cls._wake_w = None
+
+    @classmethod
+    def wake(cls):
+        """Reload the schedule now (no-op unless this process is running it)"""
+        if cls._wake_w is not None:
+            try:
+                os.write(cls._wake_w, b"x")
+            except OSError:
+                pass
+
+    @classmethod
+    def running(cls) -> bool:
+        return cls._thread is not None and cls._thread.is_alive()
+
+    @classmethod
+    def status(cls) -> Dict[str, Any]:
+        events = sorted(cls._events)
+        return {
+            "status": "running" if cls.running() else "stopped",
+            "next_wake": events[0][0].isoformat() if events else None,
+            "upcoming": [
+                {"at": when.isoformat(), "event": kind, "tournament_id": tournament_id}
+                for when, kind, tournament_id in events[:20]
+            ],
+            "last_run": cls._last_run,
+        }
+
+    @classmethod
+    def _run(cls):
+        while not cls._stop.is_set():
+            conn = None
+            try:
+                conn = dedicated_connection()
+                cls._serve(conn)
+            except Exception:
+                logger.exception("TKR scheduler connection failed")
+            finally:
+                cls._events = []
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+            cls._stop.wait(settings.TKR_SCHEDULER_RETRY_SECONDS)
+
+    @classmethod
+    def _serve(cls, conn):
+        with conn.cursor() as cursor:
+            cursor.execute(f"LISTEN {CHANNEL}")
+
+        cls._reload()
+        resync_at = datetime.utcnow() + timedelta(seconds=settings.TKR_SCHEDULER_RESYNC_SECONDS)
+        while not cls._stop.is_set():
+            now = datetime.utcnow()
+            if cls._events and cls._events[0][0] <= now:
+                due = set()
+                while cls._events and cls._events[0][0] <= now:
+                    due.add(heapq.heappop(cls._events)[1])
+                logger.info("TKR scheduler firing %s", ", ".join(sorted(due)))
+                cls._last_run = run_tkr_auto_start_check()
+                # Anything still due failed to apply; leave it to the next resync
+                # rather than spinning on it
+                cls._reload(handled_until=now)
+                continue
+
+            if now >= resync_at:
+                cls._reload()
+                resync_at = now + timedelta(seconds=settings.TKR_SCHEDULER_RESYNC_SECONDS)
+
+            wake_at = min(resync_at, cls._events[0][0]) if cls._events else resync_at
+            timeout = max(0.0, (wake_at - now).total_seconds())
+            readable, _, _ = select.select([conn, cls._wake_r], [], [], timeout)
+
+            changed = False
+            if cls._wake_r in readable:
+                os.read(cls._wake_r, 1024)
+                changed = True
+            if conn in readable:
+                conn.poll()  # raises if the connection was lost
+                if conn.notifies:
+                    conn.notifies.clear()
+                    changed = True
+            if changed and not cls._stop.is_set():
+                cls._reload()
+
+    @classmethod
+    def _reload(cls, handled_until: Optional[datetime] = None):
+        db = SessionLocal()
+        try:
+            events = load_events(db)
+        finally:
+            db.close()
+        if handled_until is not None:
+            events = [event for event in events if event[0] > handled_until]
+            heapq.heapify(events)
+        cls._events = events
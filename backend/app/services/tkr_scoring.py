@@ -0,0 +1,86 @@
+# app/services/tkr_scoring.py - TKR scoring rules compiled once per config version
+import threading
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, Optional, Tuple
+
+# crud.tkr.TKRScoringEngine falls back to this for placements without a multiplier
+DEFAULT_PLACEMENT_MULTIPLIER = 0.5
+
+class CompiledScorer:
+    """
+    A TKR config's scoring rules preprocessed for repeated scoring.
+
+    Gives the same results as TKRScoringEngine.calculate_game_score:
+    placement multipliers become a list indexed by placement, bonus
+    thresholds a sorted kill array searched with bisect alongside the
+    running maximum of their bonuses, and the cap a plain float.
+    """
+    __slots__ = ("multipliers", "threshold_kills", "threshold_bonus", "cap")
+
+    def __init__(
+        self,
+        placement_multipliers: Dict[str, float],
+        bonus_point_thresholds: Optional[Dict[str, int]] = None,
+        max_points_per_map: Optional[int] = None
+    ):
+        # Only keys that str(placement) can produce ever matched ("1", not "01")
+        placements = {int(key): float(value) for key, value in placement_multipliers.items()
+                      if key.isdigit() and str(int(key)) == key}
+        size = max(placements, default=0) + 1
+        self.multipliers = [placements.get(p, DEFAULT_PLACEMENT_MULTIPLIER) for p in range(size)]
+
+        thresholds = sorted((int(kills), bonus) for kills, bonus in (bonus_point_thresholds or {}).items())
+        self.threshold_kills = [kills for kills, _ in thresholds]
+        # Best bonus among thresholds <= kills; starts at 0 like the original loop
+        self.threshold_bonus = list(accumulate((float(bonus) for _, bonus in thresholds), max, initial=0.0))[1:]
+
+        self.cap = float(max_points_per_map) if max_points_per_map else None
+
+    def score(self, kills: int, placement: int, team_rank: int) -> Tuple[float, float, float]:
+        """(base_score, bonus_points, final_score)"""
+        multipliers = self.multipliers
+        multiplier = multipliers[placement] if 0 <= placement < len(multipliers) else DEFAULT_PLACEMENT_MULTIPLIER
+        base_score = (kills * multiplier) / max(team_rank * 0.1, 1)
+
+        i = bisect_right(self.threshold_kills, kills)
+        bonus_points = self.threshold_bonus[i - 1] if i else 0.0
+
+        total = base_score + bonus_points
+        if self.cap is not None and total > self.cap:
+            total = self.cap
+        return base_score, bonus_points, total
+
+    def score_dict(self, kills: int, placement: int, team_rank: int) -> Dict[str, float]:
+        base_score, bonus_points, final_score = self.score(kills, placement, team_rank)
+        return {"base_score": base_score, "bonus_points": bonus_points, "final_score": final_score}
+
+class ScorerCache:
+    """Compiled scorers keyed by (config id, scoring_version), per process"""
+    _scorers: Dict[Tuple[int, int], CompiledScorer] = {}
+    _lock = threading.Lock()
+    max_entries = 512
+
+    @classmethod
+    def get(cls, config) -> CompiledScorer:
+        key = (config.id, config.scoring_version or 0)
+        scorer = cls._scorers.get(key)
+        if scorer is None:
+            scorer = CompiledScorer(
+                config.placement_multipliers,
+                config.bonus_point_thresholds,
+                config.max_points_per_map
+            )
+            with cls._lock:
+                if len(cls._scorers) >= cls.max_entries:
+                    cls._scorers.clear()
+                cls._scorers[key] = scorer
+        return scorer
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._scorers.clear()
+
+def get_scorer(config) -> CompiledScorer:
+    return ScorerCache.get(config)
@@ -9,8 +9,6 @@ from .LosersBracket import LosersBracket
 from .ChampionshipMatches import ChampionshipMatches
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 class BracketGenerator:
@@ -4,6 +4,9 @@ from sqlalchemy.orm import Session
 from app.models.match import Match
 from app.models.team import Team
 from app.models.tournament import TournamentFormat
+import logging
+
+logger = logging.getLogger(__name__)
 
 class ChampionshipMatches:
     def __init__(self, tournament_id: int, db: Session):
@@ -62,8 +65,8 @@ class ChampionshipMatches:
             if not match:
                 raise ValueError(f"Match {match_id} not found")
 
-            print(f"Updating championship match {match_id}")
-            print(f"Current match state - team1: {match.team1_id}, team2: {match.team2_id}, winner: {winner_id}")
+            logger.debug("Updating championship match %s", match_id)
+            logger.debug("Current match state - team1: %s, team2: %s, winner: %s", match.team1_id, match.team2_id, winner_id)
 
             # Validate winner is part of match
             if winner_id not in [match.team1_id, match.team2_id]:
@@ -72,18 +75,18 @@ class ChampionshipMatches:
             # If this is first championship match (round 98)
             if match.round == 98:
                 if winner_id == match.team2_id:  # Losers bracket team won
-                    print("Losers bracket team won match 98, setting up reset match")
+                    logger.debug("Losers bracket team won match 98, setting up reset match")
                     reset_match = db.query(Match).filter(
                         Match.tournament_id == match.tournament_id,
                         Match.round == 99
                     ).first()
                     
                     if reset_match:
-                        print("Found reset match, updating teams")
+                        logger.debug("Found reset match, updating teams")
                         reset_match.team1_id = match.team1_id
                         reset_match.team2_id = winner_id
                     else:
-                        print("Reset match not found, creating new one")
+                        logger.debug("Reset match not found, creating new one")
                         reset_match = Match(
                             tournament_id=match.tournament_id,
                             round=99,
@@ -93,7 +96,7 @@ class ChampionshipMatches:
                         )
                         db.add(reset_match)
                 else:
-                    print("Winners bracket team won match 98, removing reset match")
+                    logger.debug("Winners bracket team won match 98, removing reset match")
                     try:
                         # First, remove the next_match_id reference
                         match.next_match_id = None
@@ -104,9 +107,9 @@ class ChampionshipMatches:
                             Match.tournament_id == match.tournament_id,
                             Match.round == 99
                         ).delete(synchronize_session=False)
-                        print(f"Deleted {deleted} reset match(es)")
+                        logger.debug("Deleted %s reset match(es)", deleted)
                     except Exception as delete_error:
-                        print(f"Error handling reset match: {str(delete_error)}")
+                        logger.warning("Error handling reset match: %s", delete_error)
                         # Continue even if delete fails - not critical
 
             # Update match data
@@ -114,20 +117,20 @@ class ChampionshipMatches:
             match.loser_id = match.team1_id if match.team1_id != winner_id else match.team2_id
             match.is_completed = True
             
-            print(f"Updated match state - winner: {match.winner_id}, loser: {match.loser_id}")
+            logger.debug("Updated match state - winner: %s, loser: %s", match.winner_id, match.loser_id)
 
             # Commit all changes
             try:
                 db.commit()
                 db.refresh(match)
-                print("Successfully committed championship match update")
+                logger.debug("Successfully committed championship match update")
                 return match
             except Exception as commit_error:
-                print(f"Error committing changes: {str(commit_error)}")
+                logger.error("Error committing changes: %s", commit_error)
                 db.rollback()
                 raise commit_error
 
         except Exception as e:
-            print(f"Error in championship match update: {str(e)}")
+            logger.error("Error in championship match update: %s", e)
             db.rollback()
             raise ValueError(f"Failed to update championship match: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,109 @@
+# scripts/benchmark_logging.py
+"""
+Measure request throughput with the old and new request logging.
+
+Drives a minimal ASGI app in-process (no network, no database) so the only
+variable is the logging middleware:
+
+  none     - no request logging
+  legacy   - the previous @app.middleware("http") logging three INFO lines
+             per request through a synchronous StreamHandler
+  sampled  - AccessLogMiddleware behind QueueHandler/QueueListener
+
+Log output goes to os.devnull so terminal speed does not skew results.
+
+Usage: python scripts/benchmark_logging.py [--requests 20000] [--sample-rate 0.05]
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import logging
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.core.logging_config import AccessLogMiddleware, JSONFormatter
+
+async def ping(request: Request):
+    return JSONResponse({"status": "ok"})
+
+def build_app(mode: str, sample_rate: float) -> Starlette:
+    app = Starlette(routes=[Route("/ping", ping)])
+    if mode == "legacy":
+        logger = logging.getLogger("bench.legacy")
+
+        @app.middleware("http")
+        async def log_requests(request, call_next):
+            logger.info(f"Incoming request: {request.method} {request.url}")
+            logger.info(f"Origin: {request.headers.get('origin')}")
+            response = await call_next(request)
+            logger.info(f"Response status: {response.status_code}")
+            return response
+    elif mode == "sampled":
+        app.add_middleware(AccessLogMiddleware, sample_rate=sample_rate)
+    return app
+
+def configure(mode: str, devnull):
+    """Install the handler setup each mode ran with; returns a listener to stop"""
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    stream_handler = logging.StreamHandler(devnull)
+    if mode == "sampled":
+        stream_handler.setFormatter(JSONFormatter())
+        log_queue = queue.SimpleQueue()
+        root.handlers[:] = [QueueHandler(log_queue)]
+        listener = QueueListener(log_queue, stream_handler)
+        listener.start()
+        return listener
+    stream_handler.setFormatter(logging.Formatter("%(levelname)s:%(name)s:%(message)s"))
+    root.handlers[:] = [stream_handler]
+    return None
+
+async def drive(app, requests: int) -> float:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": "/ping", "raw_path": b"/ping",
+        "query_string": b"", "root_path": "",
+        "headers": [(b"host", b"localhost"), (b"origin", b"http://localhost:3000")],
+        "client": ("127.0.0.1", 50000), "server": ("localhost", 8000),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--sample-rate", type=float, default=0.05)
+    args = parser.parse_args()
+
+    print(f"{args.requests} requests per mode")
+    print(f"{'mode':<10}{'req/s':>12}{'us/req':>10}")
+    with open(os.devnull, "w") as devnull:
+        for mode in ("none", "legacy", "sampled"):
+            listener = configure(mode, devnull)
+            app = build_app(mode, args.sample_rate)
+            asyncio.run(drive(app, 200))  # warm up
+            elapsed = asyncio.run(drive(app, args.requests))
+            if listener:
+                listener.stop()
+            print(f"{mode:<10}{args.requests / elapsed:>12.0f}{elapsed / args.requests * 1e6:>10.1f}")
+
+if __name__ == "__main__":
+    main()
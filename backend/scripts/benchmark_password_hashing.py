@@ -0,0 +1,85 @@
+# scripts/benchmark_password_hashing.py
+"""
+Login throughput per core for the password hashing configurations.
+
+For each scheme/cost it reports single-thread verifications per second
+(which is the per-core login ceiling) and the throughput through the
+bounded hash pool used by the login route. It also times a failed login
+with the old verify_password, which hashed the plaintext a second time on
+every failure.
+
+Usage: python scripts/benchmark_password_hashing.py [--seconds 3] [--workers N]
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.context import CryptContext
+
+PASSWORD = "correct horse battery staple"
+
+CONFIGS = [
+    ("sha256_crypt (previous default)", CryptContext(schemes=["sha256_crypt"])),
+    ("bcrypt rounds=10", CryptContext(schemes=["bcrypt"], bcrypt__rounds=10)),
+    ("bcrypt rounds=12", CryptContext(schemes=["bcrypt"], bcrypt__rounds=12)),
+]
+
+def per_second(fn, seconds: float) -> float:
+    fn()
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        fn()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+async def pool_throughput(fn, workers: int, seconds: float) -> float:
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=workers)
+    done = 0
+    deadline = time.perf_counter() + seconds
+
+    async def client():
+        nonlocal done
+        while time.perf_counter() < deadline:
+            await loop.run_in_executor(executor, fn)
+            done += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(workers * 2)))
+    elapsed = time.perf_counter() - start
+    executor.shutdown()
+    return done / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    print(f"{'configuration':<34}{'logins/s/core':>15}{'pool logins/s':>15}{'fail (old) ms':>15}{'fail (new) ms':>15}")
+    for name, context in CONFIGS:
+        stored = context.hash(PASSWORD)
+        verify_ok = lambda: context.verify(PASSWORD, stored)
+
+        def old_failed_login():
+            if not context.verify("wrong password", stored):
+                context.hash("wrong password")
+
+        new_failed_login = lambda: context.verify("wrong password", stored)
+
+        single = per_second(verify_ok, args.seconds)
+        pooled = asyncio.run(pool_throughput(verify_ok, args.workers, args.seconds))
+        old_fail = 1000 / per_second(old_failed_login, args.seconds)
+        new_fail = 1000 / per_second(new_failed_login, args.seconds)
+        print(f"{name:<34}{single:>15.1f}{pooled:>15.1f}{old_fail:>15.1f}{new_fail:>15.1f}")
+
+    print(f"\npool size: {args.workers} workers")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# scripts/benchmark_ranking_import.py
+"""
+Compare per-row ladder updates with the set-based bulk import.
+
+Seeds a ladder of --players entries, then applies the same shuffled set of
+new ranks two ways:
+
+  per-row  - load each entry, set its rank and flush, the way one
+             PUT /player-ranking/rankings/{id} does (per-request COMMITs
+             and HTTP overhead are not counted, so this is a lower bound)
+  bulk     - import_player_rankings: temp table, UPDATE/INSERT and a single
+             row_number() renumbering statement
+
+Everything runs inside one transaction that is rolled back at the end, so
+the database is left untouched.
+
+Usage: python scripts/benchmark_ranking_import.py [--players 10000]
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import random
+import time
+
+from app.crud.player_ranking import import_player_rankings
+from app.db.database import SessionLocal
+from app.models.player_ranking import PlayerRanking
+
+def ladder_rows(players: int, seed: int):
+    rows = [
+        {"player_name": f"Bench Player {i}", "twitter_handle": f"@bench_{i}", "rank": i}
+        for i in range(1, players + 1)
+    ]
+    shuffled = list(range(1, players + 1))
+    random.Random(seed).shuffle(shuffled)
+    reranked = [dict(row, rank=rank) for row, rank in zip(rows, shuffled)]
+    return rows, reranked
+
+def assert_dense(db, players: int):
+    ranks = [rank for (rank,) in db.query(PlayerRanking.rank).order_by(PlayerRanking.rank)]
+    if ranks != list(range(1, len(ranks) + 1)) or len(ranks) < players:
+        raise SystemExit("Ladder is not a dense 1..n ranking after the import")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--players", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    seed_rows, reranked = ladder_rows(args.players, args.seed)
+    db = SessionLocal()
+    try:
+        import_player_rankings(db, seed_rows, replace=True, commit=False)
+        ids = dict(db.query(PlayerRanking.twitter_handle, PlayerRanking.id))
+
+        start = time.perf_counter()
+        for row in reranked:
+            with db.begin_nested():
+                ranking = db.get(PlayerRanking, ids[row["twitter_handle"]])
+                ranking.rank = row["rank"]
+        per_row = time.perf_counter() - start
+
+        import_player_rankings(db, seed_rows, commit=False)
+        db.expire_all()
+
+        start = time.perf_counter()
+        result = import_player_rankings(db, reranked, commit=False)
+        bulk = time.perf_counter() - start
+        db.expire_all()
+        assert_dense(db, args.players)
+    finally:
+        db.rollback()
+        db.close()
+
+    print(f"{args.players} players, ladder size {result['ladder_size']}")
+    print(f"{'path':<10}{'total s':>10}{'rows/s':>12}")
+    for name, elapsed in (("per-row", per_row), ("bulk", bulk)):
+        print(f"{name:<10}{elapsed:>10.2f}{args.players / elapsed:>12.0f}")
+    print(f"speedup   {per_row / bulk:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
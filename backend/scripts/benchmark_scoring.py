@@ -0,0 +1,68 @@
+# scripts/benchmark_scoring.py
+"""
+Scores per second for TKR game scoring: TKRScoringEngine.calculate_game_score
+(raw config dicts on every call) against the compiled scorer used by the
+submission, update and recompute paths. Both are checked to agree first.
+
+Usage: python scripts/benchmark_scoring.py [--games 200000] [--thresholds 8]
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import random
+import time
+
+from app.crud.tkr import TKRScoringEngine
+from app.services.tkr_scoring import CompiledScorer
+
+PLACEMENT_MULTIPLIERS = {
+    "1": 2.0, "2": 1.8, "3": 1.6, "4": 1.5, "5": 1.4,
+    "6": 1.3, "7": 1.2, "8": 1.1, "9": 1.0, "10": 0.9
+}
+
+def make_thresholds(count: int) -> dict:
+    return {str(10 + 5 * i): 2 * (i + 1) for i in range(count)}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=200000)
+    parser.add_argument("--thresholds", type=int, default=8)
+    parser.add_argument("--cap", type=int, default=100)
+    args = parser.parse_args()
+
+    thresholds = make_thresholds(args.thresholds)
+    rng = random.Random(42)
+    games = [(rng.randint(0, 60), rng.randint(1, 40), rng.randint(1, 250)) for _ in range(args.games)]
+
+    def raw():
+        calculate = TKRScoringEngine.calculate_game_score
+        for kills, placement, team_rank in games:
+            calculate(kills, placement, team_rank, PLACEMENT_MULTIPLIERS, thresholds, args.cap)
+
+    def compiled():
+        score = CompiledScorer(PLACEMENT_MULTIPLIERS, thresholds, args.cap).score
+        for kills, placement, team_rank in games:
+            score(kills, placement, team_rank)
+
+    scorer = CompiledScorer(PLACEMENT_MULTIPLIERS, thresholds, args.cap)
+    for kills, placement, team_rank in games[:10000]:
+        expected = TKRScoringEngine.calculate_game_score(
+            kills, placement, team_rank, PLACEMENT_MULTIPLIERS, thresholds, args.cap
+        )
+        actual = scorer.score_dict(kills, placement, team_rank)
+        assert all(abs(expected[key] - actual[key]) < 1e-9 for key in expected), (expected, actual)
+
+    print(f"{args.games} games, {args.thresholds} bonus thresholds")
+    results = {}
+    for name, fn in (("raw dicts", raw), ("compiled", compiled)):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        results[name] = args.games / elapsed
+        print(f"{name:<12}{results[name]:>14,.0f} scores/s")
+    print(f"speedup: {results['compiled'] / results['raw dicts']:.1f}x")
+
+if __name__ == "__main__":
+    main()
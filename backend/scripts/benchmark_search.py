@@ -0,0 +1,120 @@
+# scripts/benchmark_search.py
+"""
+Measure search latency over a large player ladder.
+
+Inserts --rows synthetic player rankings inside a transaction that is rolled
+back at the end, then runs the same query mix through both backends:
+
+  postgres - postgres_search on the pg_trgm / text_pattern_ops indexes
+  memory   - MemorySearchIndex built from the same names
+
+The mix covers short prefixes (1-2 characters, prefix-only), longer
+prefixes, later-word prefixes and misspelled names (fuzzy).
+
+Usage: python scripts/benchmark_search.py [--rows 100000] [--queries 500]
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import random
+import time
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.crud.search import normalize_query, postgres_search
+from app.db.database import SessionLocal
+from app.services.search import MemorySearchIndex
+
+CONSONANTS = "bcdfghjklmnprstvwz"
+VOWELS = "aeiouy"
+
+def gamer_tag(rng: random.Random) -> str:
+    def word(syllables: int) -> str:
+        return "".join(rng.choice(CONSONANTS) + rng.choice(VOWELS) for _ in range(syllables))
+    name = word(rng.randint(2, 4)).capitalize()
+    if rng.random() < 0.4:
+        name += " " + word(rng.randint(2, 3)).capitalize()
+    if rng.random() < 0.3:
+        name += str(rng.randint(1, 999))
+    return name
+
+def query_mix(names, count: int, rng: random.Random):
+    queries = []
+    for name in rng.sample(names, count):
+        kind = rng.randrange(4)
+        if kind == 0:
+            queries.append(("short prefix", name[:rng.randint(1, 2)]))
+        elif kind == 1:
+            queries.append(("prefix", name[:rng.randint(3, 8)]))
+        elif kind == 2 and " " in name:
+            queries.append(("word prefix", name.split(" ")[1][:rng.randint(3, 6)]))
+        else:
+            at = rng.randrange(len(name))
+            queries.append(("fuzzy", name[:at] + rng.choice(CONSONANTS) + name[at + 1:]))
+    return queries
+
+def percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+def report(backend: str, timings):
+    for label in sorted(timings):
+        samples = timings[label]
+        print(f"{backend:<10}{label:<14}{len(samples):>6}"
+              f"{percentile(samples, 0.5) * 1e3:>9.2f}{percentile(samples, 0.95) * 1e3:>9.2f}"
+              f"{max(samples) * 1e3:>9.2f}")
+
+def run(queries, search_one):
+    timings = {}
+    for label, query in queries:
+        started = time.perf_counter()
+        search_one(normalize_query(query))
+        timings.setdefault(label, []).append(time.perf_counter() - started)
+    timings["all"] = [sample for samples in list(timings.values()) for sample in samples]
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    names = [gamer_tag(rng) for _ in range(args.rows)]
+    queries = query_mix(names, min(args.queries, args.rows), rng)
+    threshold = settings.SEARCH_SIMILARITY_THRESHOLD
+
+    db = SessionLocal()
+    try:
+        db.execute(text("""
+            INSERT INTO player_rankings (player_name, twitter_handle, rank)
+            SELECT name, '@bench_' || n, NULL
+            FROM unnest(CAST(:names AS text[])) WITH ORDINALITY AS t(name, n)
+        """), {"names": names})
+        db.execute(text("ANALYZE player_rankings"))
+        # Warm the indexes into shared buffers
+        for _, query in queries[:50]:
+            postgres_search(db, normalize_query(query), ["players"], args.limit, threshold)
+        postgres = run(queries, lambda q: postgres_search(db, q, ["players"], args.limit, threshold))
+    finally:
+        db.rollback()
+        db.close()
+
+    started = time.perf_counter()
+    index = MemorySearchIndex.from_documents(
+        ("players", row_id, name, None, [name.lower()]) for row_id, name in enumerate(names)
+    )
+    print(f"Built memory index over {args.rows} names in {time.perf_counter() - started:.1f}s")
+    memory = run(queries, lambda q: index.search(q, ["players"], args.limit, threshold))
+
+    print(f"{'backend':<10}{'queries':<14}{'n':>6}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}")
+    report("postgres", postgres)
+    report("memory", memory)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# scripts/benchmark_serialization.py
+"""
+Compare response serialization time for the largest payloads we serve.
+
+"before" replays what FastAPI does for a route that returns Pydantic models
+with a response_model: build the models, validate them again against the
+response_model, run jsonable_encoder and json.dumps. "after" is the
+validated_json fast path used by those routes now.
+
+Usage: python scripts/benchmark_serialization.py [--rows 500] [--repeat 20]
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.core.responses import validated_json
+from app.schemas.leaderboard import LeaderboardEntry
+from app.schemas.match import TournamentBracketResponse
+from app.schemas.tkr import TKRLeaderboardEntry, TKRTournamentDetails
+
+NOW = datetime(2024, 6, 1, 18, 0, 0)
+
+def fake_team(i: int) -> SimpleNamespace:
+    return SimpleNamespace(id=i, name=f"Team {i}", seed=i)
+
+def fake_match(i: int, round_number: int) -> SimpleNamespace:
+    team1, team2 = fake_team(2 * i), fake_team(2 * i + 1)
+    return SimpleNamespace(
+        id=i, tournament_id=1, round=round_number, match_number=i,
+        team1_id=team1.id, team2_id=team2.id, winner_id=team1.id, loser_id=team2.id,
+        next_match_id=None, bracket_position=i, has_bye=False,
+        round_name=f"Round {round_number}", is_completed=True,
+        team1=team1, team2=team2, winner=team1, loser=team2,
+        previous_match_ids=[],
+        team1_from_winners=True, team1_winners_round=None, team1_winners_match_number=None,
+        team2_from_winners=True, team2_winners_round=None, team2_winners_match_number=None
+    )
+
+def fake_registration(i: int) -> SimpleNamespace:
+    players = [
+        {"name": f"player{i}_{p}", "rank": 100 + p, "stream": f"https://twitch.tv/p{i}_{p}"}
+        for p in range(4)
+    ]
+    return SimpleNamespace(
+        id=i, tournament_id=1, config_id=1, team_id=i,
+        team_name=f"Team {i}", team_rank=sum(p["rank"] for p in players),
+        players=players, start_time=NOW, end_time=NOW + timedelta(hours=4),
+        is_rerunning=False, using_free_entry=False, free_entry_players=None,
+        payment_status="PAID_FULL", payment_amount=20.0, paid_to=None, payment_notes=None,
+        registered_at=NOW, updated_at=NOW,
+        team=SimpleNamespace(id=i, name=f"Team {i}", creator=None)
+    )
+
+def fake_leaderboard(rows: int) -> List[dict]:
+    entries = []
+    for i in range(1, rows + 1):
+        registration = fake_registration(i)
+        entries.append({
+            "id": i, "tournament_id": 1, "team_registration_id": i,
+            "team_name": registration.team_name, "total_kills": 40 + i % 30,
+            "total_score": 120.5 + i, "games_submitted": 8, "current_rank": i,
+            "average_kills": 5.2, "average_placement": 6.1, "last_updated": NOW,
+            "team_registration": registration
+        })
+    return entries
+
+def fake_config() -> SimpleNamespace:
+    return SimpleNamespace(
+        id=1, tournament_id=1, map_name="Rebirth Island", team_size="QUADS",
+        consecutive_hours=4, tournament_days=3, best_games_count=8,
+        placement_multipliers={str(p): 1.0 + (10 - p) * 0.1 for p in range(1, 11)},
+        bonus_point_thresholds={"20": 5}, max_points_per_map=None,
+        host_percentage=0.1, show_prize_pool=False
+    )
+
+def fastapi_default(schema, content) -> bytes:
+    """The validate -> jsonable_encoder -> json.dumps path of serialize_response"""
+    validated = TypeAdapter(schema).validate_python(content, from_attributes=True)
+    encoded = jsonable_encoder(validated)
+    return json.dumps(encoded, ensure_ascii=False, allow_nan=False,
+                      indent=None, separators=(",", ":")).encode("utf-8")
+
+def time_it(fn, repeat: int) -> float:
+    fn()  # warm up adapters and caches
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    leaderboard = fake_leaderboard(args.rows)
+    matches = [fake_match(i, 1 + i % 6) for i in range(args.rows)]
+    bracket = {
+        "tournament_id": 1, "winners_bracket": matches, "finals": matches[:2],
+        "losers_bracket": matches, "total_rounds": 6
+    }
+    details = {
+        "tournament_id": 1, "config": fake_config(), "total_registrations": args.rows,
+        "active_teams": 0, "completed_teams": args.rows, "prize_pool": None,
+        "leaderboard": leaderboard
+    }
+    standings = [
+        SimpleNamespace(id=i, tournament_id=1, team_id=i, wins=i % 5, losses=i % 3, points=i)
+        for i in range(args.rows)
+    ]
+
+    cases = [
+        ("GET /tkr/tournaments/{id}/leaderboard",
+         lambda: fastapi_default(List[TKRLeaderboardEntry], [TKRLeaderboardEntry(**e) for e in leaderboard]),
+         lambda: validated_json(List[TKRLeaderboardEntry], leaderboard).body),
+        ("GET /tkr/tournaments/{id}/details",
+         lambda: fastapi_default(TKRTournamentDetails, TKRTournamentDetails(
+             **{**details, "leaderboard": [TKRLeaderboardEntry(**e) for e in leaderboard]})),
+         lambda: validated_json(TKRTournamentDetails, details).body),
+        ("GET /matches/tournament/{id}",
+         lambda: fastapi_default(TournamentBracketResponse, TournamentBracketResponse(**bracket)),
+         lambda: validated_json(TournamentBracketResponse, bracket).body),
+        ("GET /leaderboard/tournament/{id}",
+         lambda: fastapi_default(List[LeaderboardEntry], standings),
+         lambda: validated_json(List[LeaderboardEntry], standings).body),
+    ]
+
+    print(f"{args.rows} rows, mean of {args.repeat} runs (ms)")
+    print(f"{'endpoint':<42}{'before':>10}{'after':>10}{'speedup':>10}")
+    for name, before, after in cases:
+        before_ms = time_it(before, args.repeat)
+        after_ms = time_it(after, args.repeat)
+        print(f"{name:<42}{before_ms:>10.2f}{after_ms:>10.2f}{before_ms / after_ms:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
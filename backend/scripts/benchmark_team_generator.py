@@ -0,0 +1,98 @@
+# scripts/benchmark_team_generator.py
+"""
+Time team generation at 1k, 10k and 100k players.
+
+Compares the previous endpoint algorithm (repeated pop() passes and a
+second full shuffle for one list) with app.services.team_generator in each
+balance mode, on one list and on two lists of team size 4 (the old special
+case). Balanced modes use synthetic ladder ranks; no database is needed.
+Also prints the spread (population std dev) of team rank totals so the
+balance modes can be compared.
+
+Usage: python scripts/benchmark_team_generator.py [--sizes 1000,10000,100000] [--repeat 5]
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import random
+import statistics
+import time
+
+from app.services.team_generator import BALANCE_MODES, generate_teams
+
+def legacy_two_lists_size_four(list1, list2):
+    random.shuffle(list1)
+    random.shuffle(list2)
+    num_teams = min(len(list1), len(list2)) // 2
+    teams = []
+    for i in range(num_teams):
+        team = list1[i*2:(i+1)*2] + list2[i*2:(i+1)*2]
+        random.shuffle(team)
+        teams.append(team)
+    remaining = list1[num_teams*2:] + list2[num_teams*2:]
+    for i, player in enumerate(remaining):
+        teams[i % len(teams)].append(player)
+    return teams
+
+def legacy_generate(lists, team_size):
+    """The endpoint before the generator engine, minus the 150-player cap"""
+    num_lists = len(lists)
+    if num_lists == 2 and team_size == 4:
+        return legacy_two_lists_size_four(list(lists[0]), list(lists[1]))
+    total_players = sum(len(player_list) for player_list in lists)
+    shuffled_lists = [list(player_list) for player_list in lists]
+    for player_list in shuffled_lists:
+        random.shuffle(player_list)
+    num_teams = total_players // team_size
+    teams = [[] for _ in range(num_teams)]
+    for i in range(num_teams):
+        for j in range(num_lists):
+            if shuffled_lists[j]:
+                teams[i].append(shuffled_lists[j].pop())
+    remaining_players = [player for sublist in shuffled_lists for player in sublist]
+    random.shuffle(remaining_players)
+    for i, player in enumerate(remaining_players):
+        teams[i % num_teams].append(player)
+    if num_lists == 1:
+        all_players = [player for team in teams for player in team]
+        random.shuffle(all_players)
+        teams = [all_players[i:i + team_size] for i in range(0, len(all_players), team_size)]
+    return teams
+
+def rank_spread(teams, ranks) -> float:
+    unranked = max(ranks.values()) + 1
+    return statistics.pstdev(sum(ranks.get(player.lower(), unranked) for player in team) for team in teams)
+
+def best_of(repeat: int, run):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        teams = run()
+        timings.append(time.perf_counter() - started)
+    return min(timings), teams
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--team-size", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"{'players':>8}  {'lists':<6}{'algorithm':<14}{'ms':>10}{'rank spread':>14}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        players = [f"Player{i}" for i in range(size)]
+        # Every fifth player is unranked
+        ranks = {player.lower(): rank for rank, player in enumerate(players, 1) if rank % 5}
+        for lists in ([players], [players[:size // 2], players[size // 2:]]):
+            elapsed, teams = best_of(args.repeat, lambda: legacy_generate(lists, args.team_size))
+            print(f"{size:>8}  {len(lists):<6}{'legacy':<14}{elapsed * 1e3:>10.1f}{rank_spread(teams, ranks):>14.1f}")
+            for mode in BALANCE_MODES:
+                elapsed, (teams, _) = best_of(
+                    args.repeat, lambda: generate_teams(lists, args.team_size, seed=1, balance=mode, ranks=ranks)
+                )
+                print(f"{size:>8}  {len(lists):<6}{mode:<14}{elapsed * 1e3:>10.1f}{rank_spread(teams, ranks):>14.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+# scripts/rebuild_stats.py
+"""
+Recompute the cross-tournament stats rollups from verified TKR games and
+decided bracket matches. Run once after the stats_rollups migration, and
+again whenever the rollups need repairing.
+
+Usage: python scripts/rebuild_stats.py
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+
+from app.crud.stats import rebuild_stats_rollups
+from app.db.database import SessionLocal
+
+def main():
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        rows = rebuild_stats_rollups(db)
+        print(f"Rebuilt {rows} stats rollup rows in {time.perf_counter() - started:.1f}s")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+# scripts/train_player_ranking.py
+"""
+Train the player ranking prediction model from every ranked player's latest
+submitted stats and write the artifact to PLAYER_RANKING_MODEL_PATH. Running
+workers pick it up on their next prediction.
+
+Usage: python scripts/train_player_ranking.py
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+
+from app.crud.player_ranking import get_training_data
+from app.db.database import SessionLocal
+from app.ml import player_ranking_prediction
+
+def main():
+    db = SessionLocal()
+    try:
+        rows, ranks = get_training_data(db)
+    finally:
+        db.close()
+    try:
+        metadata = player_ranking_prediction.train(rows, ranks)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    print(f"Wrote {player_ranking_prediction.model_path()}")
+    print(json.dumps(metadata, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -22,23 +22,13 @@ export const UpcomingTournaments = () => {
           return;
         }
   
-        // If no cache, fetch from API
-        const response = await tournamentService.getAllTournaments();
-        const now = new Date();
-        
-        const upcomingTournaments = response
-          .filter(t => {
-            // Filter tournaments that are:
-            // 1. Still pending
-            // 2. Have a start date in the future
-            const tournamentDate = new Date(t.start_date);
-            return t.status === 'PENDING' && tournamentDate > now;
-          })
-          .sort((a, b) => {
-            // Sort by start date, earliest first
-            return new Date(a.start_date) - new Date(b.start_date);
-          })
-          .slice(0, 4);  // Take only the first 4
+        // If no cache, fetch the next 4 pending tournaments, earliest first
+        const upcomingTournaments = await tournamentService.getTournamentCards({
+          status: 'PENDING',
+          start_from: new Date().toISOString(),
+          order: 'asc',
+          limit: 4
+        });
         
         setTournaments(upcomingTournaments);
         
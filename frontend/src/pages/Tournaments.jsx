@@ -4,7 +4,7 @@ import { Search, Filter, Loader2 } from 'lucide-react';
 import TournamentCard from '../components/tournament/TournamentCard';
 import Button from '../components/ui/Button';
 import Card from '../components/ui/Card';
-import api from '../services/api';
+import { tournamentService } from '../services/tournament';
 import PageBackground from '../components/backgrounds/PageBackground';
 
 const Tournaments = () => {
@@ -20,10 +20,9 @@ const Tournaments = () => {
     const fetchTournaments = async () => {
       try {
         setLoading(true);
-        const response = await api.get('/api/v1/tournaments/');
-        const activeTournaments = response.data.filter(
-          tournament => tournament.status !== 'COMPLETED'
-        );
+        const activeTournaments = await tournamentService.getTournamentCards({
+          status: ['PENDING', 'ONGOING', 'CANCELLED']
+        });
         console.log('Fetched tournaments:', activeTournaments);
         setTournaments(activeTournaments);
       } catch (error) {
@@ -8,6 +8,17 @@ export const tournamentService = {
     return response.data;
   },
 
+  // Card projection with server-side filters; array values repeat the key (?status=A&status=B)
+  async getTournamentCards(filters = {}) {
+    const params = new URLSearchParams();
+    Object.entries(filters).forEach(([key, value]) => {
+      if (value === undefined || value === null) return;
+      (Array.isArray(value) ? value : [value]).forEach(v => params.append(key, v));
+    });
+    const response = await api.get(`${config.endpoints.tournaments.cards}?${params.toString()}`);
+    return response.data;
+  },
+
   async createTournament(tournamentData) {
     const response = await api.post(config.endpoints.tournaments.create, tournamentData);
     return response.data;
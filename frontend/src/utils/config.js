@@ -26,6 +26,7 @@ const config = {
       },
       tournaments: {
           list: '/api/v1/tournaments/',
+          cards: '/api/v1/tournaments/cards',
           create: '/api/v1/tournaments/',
           details: (id) => `/api/v1/tournaments/${id}`,
           update: (id) => `/api/v1/tournaments/${id}`,